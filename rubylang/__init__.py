@@ -1,3 +1,53 @@
+"""
+Ruby's core classes for Python.
 
-from .ruby_array import Array
+The classes are resolved lazily through the module __getattr__ (PEP 562): `import rubylang` imports
+nothing else, and `rubylang.Array` imports only the modules Array needs, on first access.
+"""
 
+# typing.TYPE_CHECKING without importing typing, type checkers treat the name the same way.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .ruby_array import Array, FrozenError
+    from .ruby_deque_array import DequeArray
+    from .ruby_lazy import Lazy
+    from .ruby_typed_array import TypedArray
+    from .ruby_parallel import Parallel
+    from .ruby_enumerator import Enumerator
+    from .ruby_sorted_array import SortedArray
+    from .ruby_mapped_array import MappedArray
+    from .ruby_string import String
+    from .ruby_hash import Hash
+
+# Public name -> module defining it.
+_EXPORTS = {
+    "Array": ".ruby_array",
+    "FrozenError": ".ruby_array",
+    "DequeArray": ".ruby_deque_array",
+    "Lazy": ".ruby_lazy",
+    "TypedArray": ".ruby_typed_array",
+    "Parallel": ".ruby_parallel",
+    "Enumerator": ".ruby_enumerator",
+    "SortedArray": ".ruby_sorted_array",
+    "MappedArray": ".ruby_mapped_array",
+    "String": ".ruby_string",
+    "Hash": ".ruby_hash",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cached as a module global, __getattr__ is not called again for this name.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
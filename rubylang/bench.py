@@ -0,0 +1,531 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterable, NamedTuple, Sequence
+
+import argparse
+import asyncio
+import atexit
+import bisect
+import functools
+import hashlib
+import itertools
+import json
+import math
+import os
+import platform
+import struct
+import sys
+import time
+
+from .ruby_array import Array
+
+"""
+Benchmarks of every public Array method against the equivalent builtin list code.
+
+Run with:
+
+    python -m rubylang.bench --sizes 10 1000 --output results.json
+    python -m rubylang.bench --baseline results.json
+
+Results are printed (or written) as JSON. With --baseline, timings slower than the baseline by more
+than --tolerance are listed under "regressions" and the exit status is 1.
+"""
+
+DEFAULT_SIZES = (10, 1_000, 100_000, 1_000_000)
+
+
+# ---------------------------------------------------------------------------------
+#   Element types
+# ---------------------------------------------------------------------------------
+
+def _ints(size: int) -> Tuple[List[Any], Any]:
+    return list(range(size)), -1
+
+
+def _strings(size: int) -> Tuple[List[Any], Any]:
+    return [f"string-{i}" for i in range(size)], "missing"
+
+
+def _nested(size: int) -> Tuple[List[Any], Any]:
+    return [[i, [i]] if i % 2 else {"class": "Hash", "id": i} for i in range(size)], [-1, [-1]]
+
+
+def _falsy(size: int) -> Tuple[List[Any], Any]:
+    falsy_values = [0, "", None, False, [], 0.0, ()]
+    return [falsy_values[i % len(falsy_values)] for i in range(size)], "missing"
+
+
+# Each kind builds (elements, probe). The probe is absent from the elements, so lookups scan everything.
+KINDS: Dict[str, Callable[[int], Tuple[List[Any], Any]]] = {
+    "ints": _ints,
+    "strings": _strings,
+    "nested": _nested,
+    "falsy": _falsy,
+}
+
+
+# ---------------------------------------------------------------------------------
+#   Cases
+# ---------------------------------------------------------------------------------
+
+class Case(NamedTuple):
+    # ruby(arr, probe, block) and builtin(lst, probe, block) do the same work on an Array and a list.
+    ruby: Callable[[Array, Any, Callable[[Any], Any]], Any]
+    builtin: Callable[[list, Any, Callable[[Any], Any]], Any]
+    # Mutating cases get a fresh copy of the data on both sides for every call.
+    mutates: bool = False
+    # Element kinds the case applies to, e.g. only mutually comparable ones for ordering. All by default.
+    kinds: Optional[Tuple[str, ...]] = None
+    # Largest size the case runs at, for cases too slow for the biggest sizes. No limit by default.
+    max_size: Optional[int] = None
+
+
+# Kinds whose elements can be ordered with <.
+_ORDERED = ("ints", "strings")
+
+
+def _run(coroutine: Any) -> Any:
+    return asyncio.run(coroutine)
+
+
+def _list_rindex(lst: list, probe: Any) -> Optional[int]:
+    for i in range(len(lst) - 1, -1, -1):
+        if lst[i] == probe:
+            return i
+    return None
+
+
+def _list_one(values: Any) -> bool:
+    return sum(1 for val in values if val) == 1
+
+
+def _first10(values: Iterable) -> list:
+    return list(itertools.islice(values, 10))
+
+
+def _list_difference(lst: Iterable, other: list) -> list:
+    removed = set(other)
+    return [val for val in lst if val not in removed]
+
+
+def _list_delete(lst: list, obj: Any) -> None:
+    lst[:] = [val for val in lst if val != obj]
+
+
+def _list_flatten(lst: list) -> list:
+    flat: list = []
+    for val in lst:
+        if isinstance(val, list):
+            flat.extend(_list_flatten(val))
+        else:
+            flat.append(val)
+    return flat
+
+
+def _list_group_by(lst: list, key: Callable[[Any], Any]) -> Dict[Any, list]:
+    groups: Dict[Any, list] = {}
+    for val in lst:
+        groups.setdefault(key(val), []).append(val)
+    return groups
+
+
+def _list_tally(lst: list) -> Dict[Any, int]:
+    counts: Dict[Any, int] = {}
+    for val in lst:
+        counts[val] = counts.get(val, 0) + 1
+    return counts
+
+
+def _list_chunk_while(lst: list, keep: Callable[[Any, Any], Any]) -> List[list]:
+    chunks: List[list] = []
+    for val in lst:
+        if chunks and keep(chunks[-1][-1], val):
+            chunks[-1].append(val)
+        else:
+            chunks.append([val])
+    return chunks
+
+
+# Largest size of the parallel cases: a default run would take about an hour at a million elements.
+_PARALLEL_MAX_SIZE = 10_000
+
+
+# CPU bound block for the parallel cases, at module level so that process pools can pickle it.
+def _cpu_block(value: Any) -> str:
+    digest = repr(value).encode()
+    for _ in range(200):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()
+
+
+# Process pools are started once per worker count and reused by every call, so that the parallel
+# cases time the work and not the pool start-up.
+@functools.lru_cache(maxsize=None)
+def _process_pool(workers: int) -> Any:
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(workers)
+    atexit.register(pool.shutdown)
+    return pool
+
+
+def _parallel_map(arr: Array, workers: int) -> Array:
+    return arr.parallel(workers, executor=_process_pool(workers)).map(block=_cpu_block)
+
+
+# Typed copy of the last Array passed, so that the typed cases time the query and not the copy.
+_typed_copies: Dict[int, Tuple[Array, Any]] = {}
+
+
+def _typed(arr: Array) -> Any:
+    cached = _typed_copies.get(id(arr))
+    if cached is None or cached[0] is not arr:
+        _typed_copies.clear()
+        cached = _typed_copies[id(arr)] = (arr, Array.typed('q', arr))
+    return cached[1]
+
+
+def _memory(elements: List[Any]) -> Dict[str, int]:
+    # Bytes held by a list of ints (the list and its distinct int objects) and by the same typed storage.
+    objects = {id(val): sys.getsizeof(val) for val in elements}
+    return {
+        "size": len(elements),
+        "list_bytes": sys.getsizeof(elements) + sum(objects.values()),
+        "typed_bytes": sys.getsizeof(Array.typed('q', elements)),
+    }
+
+
+CASES: Dict[str, Case] = {
+    "length": Case(lambda a, p, b: a.length(), lambda lst, p, b: len(lst)),
+    "include": Case(lambda a, p, b: a.include(p), lambda lst, p, b: p in lst),
+    "empty": Case(lambda a, p, b: a.empty(), lambda lst, p, b: not lst),
+    "all": Case(lambda a, p, b: a.all(block=b), lambda lst, p, b: all(b(v) for v in lst)),
+    "any": Case(lambda a, p, b: a.any(block=b), lambda lst, p, b: any(b(v) for v in lst)),
+    "none": Case(lambda a, p, b: a.none(block=b), lambda lst, p, b: not any(b(v) for v in lst)),
+    "one": Case(lambda a, p, b: a.one(block=b), lambda lst, p, b: _list_one(b(v) for v in lst)),
+    "count": Case(lambda a, p, b: a.count(block=b), lambda lst, p, b: sum(1 for v in lst if b(v))),
+    "index": Case(lambda a, p, b: a.index(p), lambda lst, p, b: p in lst and lst.index(p)),
+    "rindex": Case(lambda a, p, b: a.rindex(p), lambda lst, p, b: _list_rindex(lst, p)),
+    "build_index": Case(lambda a, p, b: a.build_index().include(p), lambda lst, p, b: p in lst, mutates=True),
+    "drop_index": Case(lambda a, p, b: a.drop_index(), lambda lst, p, b: lst),
+    "hash": Case(lambda a, p, b: a.hash(), lambda lst, p, b: hash(tuple(lst)), kinds=_ORDERED),
+    "freeze": Case(lambda a, p, b: a.freeze(), lambda lst, p, b: tuple(lst), mutates=True),
+    "frozen": Case(lambda a, p, b: a.frozen(), lambda lst, p, b: False),
+    "dup": Case(lambda a, p, b: a.dup(), lambda lst, p, b: lst.copy()),
+    "clone": Case(lambda a, p, b: a.clone(), lambda lst, p, b: lst.copy()),
+    "compare": Case(lambda a, p, b: a.compare(a), lambda lst, p, b: 0 if lst == lst else (-1 if lst < lst else 1)),
+    "eql": Case(lambda a, p, b: a.eql(a), lambda lst, p, b: lst == lst),
+    "mismatch": Case(lambda a, p, b: a.mismatch(a[:-1] + [p]),
+                     lambda lst, p, b: next((i for i, (x, y) in enumerate(zip(lst, lst[:-1] + [p])) if x != y), None)),
+    "push": Case(lambda a, p, b: a.push(p, p), lambda lst, p, b: lst.extend((p, p)), mutates=True),
+    "unshift": Case(lambda a, p, b: a.unshift(p, p), lambda lst, p, b: lst.__setitem__(slice(0, 0), (p, p)),
+                    mutates=True),
+    "insert": Case(lambda a, p, b: a.insert(len(a) // 2, p), lambda lst, p, b: lst.insert(len(lst) // 2, p),
+                   mutates=True),
+    "extend": Case(lambda a, p, b: a.extend(range(10)), lambda lst, p, b: lst.extend(range(10)), mutates=True),
+    "pop": Case(lambda a, p, b: a and a.pop(0), lambda lst, p, b: lst and lst.pop(0), mutates=True),
+    "remove": Case(lambda a, p, b: a and a.remove(a[-1]), lambda lst, p, b: lst and lst.remove(lst[-1]), mutates=True),
+    "clear": Case(lambda a, p, b: a.clear(), lambda lst, p, b: lst.clear(), mutates=True),
+    "reverse": Case(lambda a, p, b: a.reverse(), lambda lst, p, b: lst.reverse(), mutates=True),
+    "sort": Case(lambda a, p, b: a.sort(key=str), lambda lst, p, b: lst.sort(key=str), mutates=True),
+    "min": Case(lambda a, p, b: a.min(), lambda lst, p, b: min(lst, default=None), kinds=_ORDERED),
+    "max": Case(lambda a, p, b: a.max(10), lambda lst, p, b: sorted(lst, reverse=True)[:10], kinds=_ORDERED),
+    "minmax": Case(lambda a, p, b: a.minmax(), lambda lst, p, b: [min(lst, default=None), max(lst, default=None)],
+                   kinds=_ORDERED),
+    "min_by": Case(lambda a, p, b: a.min_by(block=repr), lambda lst, p, b: min(lst, key=repr, default=None)),
+    "max_by": Case(lambda a, p, b: a.max_by(10, block=repr), lambda lst, p, b: sorted(lst, key=repr)[-10:]),
+    "sort_by": Case(lambda a, p, b: a.sort_by(block=repr), lambda lst, p, b: sorted(lst, key=repr)),
+    "group_by": Case(lambda a, p, b: a.group_by(block=type), lambda lst, p, b: _list_group_by(lst, type)),
+    "tally": Case(lambda a, p, b: a.tally(), lambda lst, p, b: _list_tally(lst), kinds=("ints", "strings")),
+    "partition": Case(lambda a, p, b: a.partition(block=b), lambda lst, p, b: ([v for v in lst if b(v)],
+                                                                               [v for v in lst if not b(v)])),
+    "chunk_while": Case(lambda a, p, b: list(a.chunk_while(block=lambda x, y: type(x) is type(y))),
+                        lambda lst, p, b: _list_chunk_while(lst, lambda x, y: type(x) is type(y))),
+    "slice_when": Case(lambda a, p, b: list(a.slice_when(block=lambda x, y: type(x) is not type(y))),
+                       lambda lst, p, b: _list_chunk_while(lst, lambda x, y: type(x) is type(y))),
+    "each_slice": Case(lambda a, p, b: list(a.each_slice(3)),
+                       lambda lst, p, b: [lst[i:i + 3] for i in range(0, len(lst), 3)]),
+    "each_cons": Case(lambda a, p, b: list(a.each_cons(3)),
+                      lambda lst, p, b: [lst[i:i + 3] for i in range(len(lst) - 2)]),
+    # Set operations against the dict / set idioms, only for kinds with hashable elements.
+    "uniq": Case(lambda a, p, b: a.uniq(), lambda lst, p, b: list(dict.fromkeys(lst)), kinds=_ORDERED),
+    "uniq_bang": Case(lambda a, p, b: a.uniq_bang(), lambda lst, p, b: lst.__setitem__(slice(None), dict.fromkeys(lst)),
+                      mutates=True, kinds=_ORDERED),
+    "difference": Case(lambda a, p, b: a.difference(a[::2]), lambda lst, p, b: _list_difference(lst, lst[::2]),
+                       kinds=_ORDERED),
+    "intersection": Case(lambda a, p, b: a.intersection(a[::2]),
+                         lambda lst, p, b: _list_difference(dict.fromkeys(lst), lst[1::2]), kinds=_ORDERED),
+    "union": Case(lambda a, p, b: a.union(a[::2]), lambda lst, p, b: list(dict.fromkeys(lst + lst[::2])),
+                  kinds=_ORDERED),
+    "intersect": Case(lambda a, p, b: a.intersect([p]), lambda lst, p, b: p in lst),
+    "flatten": Case(lambda a, p, b: a.flatten(), lambda lst, p, b: _list_flatten(lst)),
+    "flatten_bang": Case(lambda a, p, b: a.flatten_bang(),
+                         lambda lst, p, b: lst.__setitem__(slice(None), _list_flatten(lst)), mutates=True),
+    # In-place filters against the list comprehension idiom, which builds a second list.
+    "map_bang": Case(lambda a, p, b: a.map_bang(block=b), lambda lst, p, b: lst.__setitem__(slice(None), map(b, lst)),
+                     mutates=True),
+    "select_bang": Case(lambda a, p, b: a.select_bang(block=type), lambda lst, p, b: lst.__setitem__(
+        slice(None), [v for v in lst if type(v)]), mutates=True),
+    "keep_if": Case(lambda a, p, b: a.keep_if(block=b), lambda lst, p, b: lst.__setitem__(
+        slice(None), [v for v in lst if b(v)]), mutates=True),
+    "reject_bang": Case(lambda a, p, b: a.reject_bang(block=bool), lambda lst, p, b: lst.__setitem__(
+        slice(None), [v for v in lst if not v]), mutates=True),
+    "delete_if": Case(lambda a, p, b: a.delete_if(block=b), lambda lst, p, b: lst.__setitem__(
+        slice(None), [v for v in lst if not b(v)]), mutates=True),
+    "delete": Case(lambda a, p, b: a and a.delete(a[-1]), lambda lst, p, b: lst and _list_delete(lst, lst[-1]),
+                   mutates=True),
+    "compact_bang": Case(lambda a, p, b: a.compact_bang(), lambda lst, p, b: lst.__setitem__(
+        slice(None), [v for v in lst if v is not None]), mutates=True),
+    "slice_bang": Case(lambda a, p, b: a.slice_bang(len(a) // 4, len(a) // 2),
+                       lambda lst, p, b: lst.__delitem__(slice(len(lst) // 4, len(lst) // 4 + len(lst) // 2)),
+                       mutates=True),
+    "each_flat": Case(lambda a, p, b: sum(1 for _ in a.each_flat()), lambda lst, p, b: len(_list_flatten(lst))),
+    # Enumerators: the size is computed, and only the first values are produced.
+    "product": Case(lambda a, p, b: (a.product(a).size(), a.product(a).first(10)),
+                    lambda lst, p, b: (len(lst) ** 2, _first10(itertools.product(lst, lst)))),
+    "combination": Case(lambda a, p, b: (a.combination(3).size(), a.combination(3).first(10)),
+                        lambda lst, p, b: (math.comb(len(lst), 3), _first10(itertools.combinations(lst, 3)))),
+    "permutation": Case(lambda a, p, b: (a.permutation(3).size(), a.permutation(3).first(10)),
+                        lambda lst, p, b: (math.perm(len(lst), 3), _first10(itertools.permutations(lst, 3)))),
+    "repeated_combination": Case(
+        lambda a, p, b: (a.repeated_combination(3).size(), a.repeated_combination(3).first(10)),
+        lambda lst, p, b: (math.comb(len(lst) + 2, 3),
+                           _first10(itertools.combinations_with_replacement(lst, 3)))),
+    "repeated_permutation": Case(
+        lambda a, p, b: (a.repeated_permutation(3).size(), a.repeated_permutation(3).first(10)),
+        lambda lst, p, b: (len(lst) ** 3, _first10(itertools.product(lst, repeat=3)))),
+    # The ints are sorted, as binary search requires.
+    "bsearch": Case(lambda a, p, b: a.bsearch(block=lambda x: x >= len(a) // 3),
+                    lambda lst, p, b: lst[bisect.bisect_left(lst, len(lst) // 3)] if lst else None, kinds=("ints",)),
+    "bsearch_index": Case(lambda a, p, b: a.bsearch_index(block=lambda x: x >= len(a) // 3),
+                          lambda lst, p, b: bisect.bisect_left(lst, len(lst) // 3) if lst else None, kinds=("ints",)),
+    "pack": Case(lambda a, p, b: a.pack('Q*'), lambda lst, p, b: struct.pack(f'={len(lst)}Q', *lst), kinds=("ints",)),
+    "pack_into": Case(lambda a, p, b: a.pack_into('Q*', bytearray(8 * len(a))),
+                      lambda lst, p, b: struct.pack_into(f'={len(lst)}Q', bytearray(8 * len(lst)), 0, *lst),
+                      kinds=("ints",)),
+    "lazy": Case(lambda a, p, b: a.lazy().map(block=b).first(10), lambda lst, p, b: [b(v) for v in lst[:10]]),
+    "new": Case(lambda a, p, b: Array.new(len(a), block=b), lambda lst, p, b: list(map(b, range(len(lst))))),
+    "try_convert": Case(lambda a, p, b: Array.try_convert(a), lambda lst, p, b: lst),
+    "from_iter": Case(lambda a, p, b: Array.from_iter((v for v in a), size_hint=len(a)),
+                      lambda lst, p, b: list(v for v in lst)),
+    "typed": Case(lambda a, p, b: Array.typed('q', range(len(a))), lambda lst, p, b: list(range(len(lst)))),
+    # Queries on typed storage against the same queries on the list, see also "memory" in the results.
+    "typed[include]": Case(lambda a, p, b: _typed(a).include(p), lambda lst, p, b: p in lst, kinds=("ints",)),
+    "typed[count]": Case(lambda a, p, b: _typed(a).count(p), lambda lst, p, b: lst.count(p), kinds=("ints",)),
+    "typed[count_block]": Case(lambda a, p, b: _typed(a).count(block=b), lambda lst, p, b: sum(1 for v in lst if b(v)),
+                               kinds=("ints",)),
+    "typed[any]": Case(lambda a, p, b: _typed(a).any(block=b), lambda lst, p, b: any(b(v) for v in lst),
+                       kinds=("ints",)),
+    "typed[sum]": Case(lambda a, p, b: _typed(a).sum(), lambda lst, p, b: sum(lst), kinds=("ints",)),
+    "typed[min]": Case(lambda a, p, b: _typed(a).min(), lambda lst, p, b: min(lst, default=None), kinds=("ints",)),
+    "typed[max]": Case(lambda a, p, b: _typed(a).max(), lambda lst, p, b: max(lst, default=None), kinds=("ints",)),
+    # Scaling across cores: the same CPU bound block on 1, 2 and 4 worker processes, against a serial
+    # list comprehension. A ratio under 1 is a speed-up, see "cpu_count" in the results meta.
+    "parallel": Case(lambda a, p, b: _parallel_map(a, 1), lambda lst, p, b: [_cpu_block(v) for v in lst],
+                     kinds=_ORDERED, max_size=_PARALLEL_MAX_SIZE),
+    "parallel[workers=2]": Case(lambda a, p, b: _parallel_map(a, 2), lambda lst, p, b: [_cpu_block(v) for v in lst],
+                                kinds=_ORDERED, max_size=_PARALLEL_MAX_SIZE),
+    "parallel[workers=4]": Case(lambda a, p, b: _parallel_map(a, 4), lambda lst, p, b: [_cpu_block(v) for v in lst],
+                                kinds=_ORDERED, max_size=_PARALLEL_MAX_SIZE),
+    "async_all": Case(lambda a, p, b: _run(a.async_all(block=b)), lambda lst, p, b: all(b(v) for v in lst)),
+    "async_any": Case(lambda a, p, b: _run(a.async_any(block=b)), lambda lst, p, b: any(b(v) for v in lst)),
+    "async_none": Case(lambda a, p, b: _run(a.async_none(block=b)), lambda lst, p, b: not any(b(v) for v in lst)),
+    "async_one": Case(lambda a, p, b: _run(a.async_one(block=b)), lambda lst, p, b: _list_one(b(v) for v in lst)),
+    "async_count": Case(lambda a, p, b: _run(a.async_count(block=b)), lambda lst, p, b: sum(1 for v in lst if b(v))),
+    "async_index": Case(lambda a, p, b: _run(a.async_index(block=b)), lambda lst, p, b: p in lst and lst.index(p)),
+    "async_map": Case(lambda a, p, b: _run(a.async_map(block=b)), lambda lst, p, b: [b(v) for v in lst]),
+    "async_select": Case(lambda a, p, b: _run(a.async_select(block=b)), lambda lst, p, b: [v for v in lst if b(v)]),
+    "async_reject": Case(lambda a, p, b: _run(a.async_reject(block=b)), lambda lst, p, b: [v for v in lst if not b(v)]),
+}
+
+# Public methods deliberately left out, with the reason reported in the results.
+SKIPPED: Dict[str, str] = {
+    "mmap": "reads a file, benchmark with a real dataset",
+}
+
+
+def public_methods() -> Dict[str, str]:
+    """
+    Maps every public method defined by Array to its canonical name (aliases map to the aliased method).
+    """
+    canonical: Dict[int, str] = {}
+    methods: Dict[str, str] = {}
+    for cls in reversed(Array.__mro__[:Array.__mro__.index(list)]):
+        for name, attribute in vars(cls).items():
+            if name.startswith("_") or not callable(getattr(attribute, "__func__", attribute)):
+                continue
+            function = getattr(attribute, "__func__", attribute)
+            methods[name] = canonical.setdefault(id(function), name)
+    return methods
+
+
+# ---------------------------------------------------------------------------------
+#   Running
+# ---------------------------------------------------------------------------------
+
+def _best_time(call: Callable[[], Any], repeat: int, min_time: float) -> float:
+    # Best seconds per call, over `repeat` rounds of enough calls to last min_time.
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run(sizes: Sequence[int] = DEFAULT_SIZES,
+        kinds: Optional[Sequence[str]] = None,
+        methods: Optional[Sequence[str]] = None,
+        repeat: int = 3,
+        min_time: float = 0.01) -> Dict[str, Any]:
+    """
+    Times the cases and returns the machine-readable results.
+
+    Parameters
+    ----------
+    sizes: Sequence[int]
+        Element counts to benchmark.
+    kinds: Optional[Sequence[str]] = None
+        Element types from KINDS, all of them by default.
+    methods: Optional[Sequence[str]] = None
+        Names from CASES, all of them by default.
+    repeat: int = 3
+        Rounds per timing, the best one is kept.
+    min_time: float = 0.01
+        Minimum duration of a round in seconds.
+
+    Returns
+    -------
+    Dict[str, Any]
+        {"meta": ..., "results": [...], "memory": [...], "uncovered": [...], "skipped": {...}}
+        "memory" compares the bytes of the ints as a list and as typed storage, when typed cases ran.
+    """
+    kinds = list(kinds or KINDS)
+    methods = list(methods or CASES)
+    unknown = [name for name in methods if name not in CASES] + [kind for kind in kinds if kind not in KINDS]
+    if unknown:
+        raise ValueError(f"Unknown methods or kinds: {', '.join(unknown)}")
+
+    results = []
+    memory = []
+    for kind in kinds:
+        for size in sizes:
+            elements, probe = KINDS[kind](size)
+            ruby_array = Array(elements)
+            if kind == "ints" and any(name.startswith("typed[") for name in methods):
+                memory.append(_memory(elements))
+
+            def block(value: Any) -> bool:
+                return value == probe
+
+            for name in methods:
+                case = CASES[name]
+                if case.kinds is not None and kind not in case.kinds:
+                    continue
+                if case.max_size is not None and size > case.max_size:
+                    continue
+                if case.mutates:
+                    def ruby_call() -> Any:
+                        return case.ruby(Array(elements), probe, block)
+
+                    def builtin_call() -> Any:
+                        return case.builtin(list(elements), probe, block)
+                else:
+                    def ruby_call() -> Any:
+                        return case.ruby(ruby_array, probe, block)
+
+                    def builtin_call() -> Any:
+                        return case.builtin(elements, probe, block)
+
+                ruby_seconds = _best_time(ruby_call, repeat, min_time)
+                builtin_seconds = _best_time(builtin_call, repeat, min_time)
+                results.append({
+                    "method": name,
+                    "kind": kind,
+                    "size": size,
+                    "ruby_seconds": ruby_seconds,
+                    "list_seconds": builtin_seconds,
+                    "ratio": ruby_seconds / builtin_seconds if builtin_seconds else None,
+                })
+
+    covered = set(CASES) | set(SKIPPED)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+        "memory": memory,
+        "uncovered": sorted({canonical for canonical in public_methods().values() if canonical not in covered}),
+        "skipped": SKIPPED,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25) -> List[Dict[str, Any]]:
+    """
+    Returns the results slower than the matching baseline result by more than tolerance (0.25 = 25%).
+    """
+    previous = {(entry["method"], entry["kind"], entry["size"]): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results["results"]:
+        old = previous.get((entry["method"], entry["kind"], entry["size"]))
+        if old is None or not old["ruby_seconds"]:
+            continue
+        slowdown = entry["ruby_seconds"] / old["ruby_seconds"] - 1
+        if slowdown > tolerance:
+            regressions.append({
+                "method": entry["method"],
+                "kind": entry["kind"],
+                "size": entry["size"],
+                "baseline_seconds": old["ruby_seconds"],
+                "ruby_seconds": entry["ruby_seconds"],
+                "slowdown": slowdown,
+            })
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m rubylang.bench",
+        description="Benchmarks every public Array method against the equivalent builtin list code.",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--kinds", nargs="+", choices=list(KINDS))
+    parser.add_argument("--methods", nargs="+", choices=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.01)
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON results of a previous run to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline, 0.25 means 25%% (default)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.kinds, args.methods, args.repeat, args.min_time)
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            results["regressions"] = compare(results, json.load(baseline_file), args.tolerance)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    return 1 if results.get("regressions") else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
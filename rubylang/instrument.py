@@ -0,0 +1,269 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import functools
+import inspect
+import threading
+import time
+
+from .ruby_array import Array
+
+"""
+Opt-in per-method instrumentation of Array.
+
+enable() replaces the public methods of Array, and the ones DequeArray, SortedArray and TypedArray
+define, with recording wrappers, and disable() puts the original methods back, so nothing is paid
+while instrumentation is off.
+
+For every public method the snapshot holds:
+    calls           number of calls
+    receiver_length total length of the receiving Array at call time over those calls. It is not
+                    the number of elements visited: index, any or include stopping at the first
+                    element still count the whole receiver. block_calls is the visited count of
+                    methods taking a block.
+    block_calls     number of times the block passed with block= was called
+    seconds         total wall time
+
+Only the outermost call is recorded: none calling any, or push calling extend, counts as one none
+or push call, and the time of the inner calls is part of it.
+"""
+
+_FIELDS = ("calls", "receiver_length", "block_calls", "seconds")
+
+# Callback(method_name, record) called after each recorded call.
+Callback = Callable[[str, Dict[str, float]], Any]
+
+
+class Stats:
+    """
+    Accumulated measurements, per public method name.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._methods: Dict[str, List[float]] = {}
+
+    def record(self, name: str, receiver_length: int, block_calls: int, seconds: float) -> None:
+        with self._lock:
+            totals = self._methods.get(name)
+            if totals is None:
+                totals = self._methods[name] = [0, 0, 0, 0.0]
+            totals[0] += 1
+            totals[1] += receiver_length
+            totals[2] += block_calls
+            totals[3] += seconds
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        Returns {method_name: {"calls", "receiver_length", "block_calls", "seconds"}}, optionally resetting.
+        """
+        with self._lock:
+            snapshot = {name: dict(zip(_FIELDS, totals)) for name, totals in self._methods.items()}
+            if reset:
+                self._methods.clear()
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
+
+
+# Process wide measurements, collected while instrumentation is enabled.
+_global_stats = Stats()
+_callback: Optional[Callback] = None
+
+# Stats of the measure() scopes active in the current context (thread or task).
+_scopes: ContextVar[tuple] = ContextVar("rubylang_instrument_scopes", default=())
+# True while a recorded call is running, so that nested public calls are not recorded twice.
+_inside: ContextVar[bool] = ContextVar("rubylang_instrument_inside", default=False)
+
+_lock = threading.RLock()
+# Original methods replaced by enable(), by (class, name).
+_originals: Dict[Tuple[type, str], Any] = {}
+# enable() calls plus active measure() scopes. Wrappers are installed while positive.
+_users = 0
+_enabled = False
+
+
+class _CountingBlock:
+    """
+    Wraps a block to count its calls.
+    """
+
+    __slots__ = ("block", "calls")
+
+    def __init__(self, block: Callable[..., Any]) -> None:
+        self.block = block
+        self.calls = 0
+
+    def __call__(self, *args: Any) -> Any:
+        self.calls += 1
+        return self.block(*args)
+
+
+def _record(name: str, receiver: Any, block: Optional[_CountingBlock], seconds: float) -> None:
+    receiver_length = len(receiver)
+    block_calls = block.calls if block is not None else 0
+    if _enabled:
+        _global_stats.record(name, receiver_length, block_calls, seconds)
+    for stats in _scopes.get():
+        stats.record(name, receiver_length, block_calls, seconds)
+    if _callback is not None:
+        _callback(name, {"calls": 1, "receiver_length": receiver_length, "block_calls": block_calls,
+                         "seconds": seconds})
+
+
+def _wrap(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    # Only functions are wrapped. classmethods and staticmethods are left alone.
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            if _inside.get():
+                return await method(self, *args, **kwargs)
+            block = kwargs.get("block")
+            if callable(block):
+                block = kwargs["block"] = _CountingBlock(block)
+            token = _inside.set(True)
+            start = time.perf_counter()
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                _inside.reset(token)
+                _record(name, self, block if isinstance(block, _CountingBlock) else None,
+                        time.perf_counter() - start)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _inside.get():
+            return method(self, *args, **kwargs)
+        block = kwargs.get("block")
+        if callable(block):
+            block = kwargs["block"] = _CountingBlock(block)
+        token = _inside.set(True)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _inside.reset(token)
+            _record(name, self, block if isinstance(block, _CountingBlock) else None, time.perf_counter() - start)
+
+    return wrapper
+
+
+# Array and the storage classes overriding its methods. Imported here, when instrumentation starts.
+def _classes() -> Tuple[type, ...]:
+    from .ruby_deque_array import DequeArray
+    from .ruby_sorted_array import SortedArray
+    from .ruby_typed_array import TypedArray
+
+    return Array, DequeArray, SortedArray, TypedArray
+
+
+def _install() -> None:
+    for cls in _classes():
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(method):
+                continue
+            _originals[cls, name] = method
+            setattr(cls, name, _wrap(name, method))
+
+
+def _uninstall() -> None:
+    for (cls, name), method in _originals.items():
+        setattr(cls, name, method)
+    _originals.clear()
+
+
+def _acquire() -> None:
+    global _users
+    with _lock:
+        if _users == 0:
+            _install()
+        _users += 1
+
+
+def _release() -> None:
+    global _users
+    with _lock:
+        _users -= 1
+        if _users == 0:
+            _uninstall()
+
+
+def enable(callback: Optional[Callback] = None) -> None:
+    """
+    Starts recording Array method calls process wide.
+
+    Parameters
+    ----------
+    callback: Optional[Callable[[str, Dict[str, float]], Any]] = None
+        Called with (method_name, record) after every recorded call, e.g. to feed a metrics client.
+    """
+    global _enabled, _callback
+    with _lock:
+        _callback = callback
+        if not _enabled:
+            _enabled = True
+            _acquire()
+
+
+def disable() -> None:
+    """
+    Stops recording and restores the original Array methods. Recorded data is kept.
+    """
+    global _enabled, _callback
+    with _lock:
+        _callback = None
+        if _enabled:
+            _enabled = False
+            _release()
+
+
+def enabled() -> bool:
+    """
+    Returns whether enable() is in effect.
+    """
+    return _enabled
+
+
+def snapshot(reset: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the process wide measurements, see Stats.snapshot.
+    """
+    return _global_stats.snapshot(reset)
+
+
+def reset() -> None:
+    """
+    Clears the process wide measurements.
+    """
+    _global_stats.reset()
+
+
+@contextmanager
+def measure() -> Iterator[Stats]:
+    """
+    Records the Array calls made inside the block (in the current thread or task) into a new Stats.
+
+    Works whether or not enable() is in effect, and scopes can be nested.
+
+    Examples
+    --------
+    >>> from rubylang import instrument
+    >>> with instrument.measure() as stats:
+    ...     _ = Array([1, 2, 3]).any(block=lambda x: x > 1)
+    >>> stats.snapshot()["any"]["block_calls"]
+    2
+    """
+    stats = Stats()
+    _acquire()
+    token = _scopes.set(_scopes.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _scopes.reset(token)
+        _release()
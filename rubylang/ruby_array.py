@@ -1,14 +1,217 @@
 from __future__ import annotations
-from typing import List, Set, Dict, Tuple, Union, Optional, Any, Callable, Iterable, SupportsIndex
-
+from typing import List, Set, Dict, Tuple, Union, Optional, Any, Callable, Iterable, Iterator, SupportsIndex, TYPE_CHECKING
+
+from bisect import bisect_left
+from collections import Counter, deque
+from copy import deepcopy
+from functools import cmp_to_key, partial
+from itertools import compress, count, islice, repeat
+from itertools import product, combinations, permutations, combinations_with_replacement
+
+import heapq
+import math
+import operator
+import os
 import warnings
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from .ruby_lazy import Lazy
+    from .ruby_enumerator import Enumerator
+    from .ruby_typed_array import TypedArray
+    from .ruby_parallel import Parallel
+    from .ruby_mapped_array import MappedArray
+    from .ruby_hash import Hash
+
 """
 TODO Implement Enumerable https://ruby-doc.org/3.1.3/Enumerable.html
 TODO Docstrings numpy style
 
 """
 
+class FrozenError(RuntimeError):
+    """
+    Raised when modifying a frozen Array, see Array.freeze.
+    https://ruby-doc.org/3.1.3/FrozenError.html
+    """
+
+
+# Sentinel for "no value" where None is a legitimate element.
+_MISSING = object()
+
+# Elements per slice when Arrays are compared, see Array.mismatch. Equal slices are skipped in C.
+_COMPARE_CHUNK = 4096
+
+# Tokens of the canonical keys of unhashable containers. Private objects, so no element can collide with them.
+_LIST_KEY, _TUPLE_KEY, _DICT_KEY, _END_KEY, _RECURSIVE_KEY = object(), object(), object(), object(), object()
+
+# Elements of these types may need a canonical key of their own, see _hash_key.
+_CONTAINER_TYPES = (list, tuple, dict, set)
+
+
+def _hash_key(value: Any) -> Any:
+    """
+    Returns a hashable key such that _hash_key(a) == _hash_key(b) exactly when a == b.
+
+    Hashable values are their own key. Lists, tuples, dicts and sets holding unhashable values get
+    a canonical key built from their contents. Raises TypeError for other unhashable values.
+    """
+    # Before the hash check: a frozen Array (or a dict key made by _frozen_key) is hashable, but must get
+    # the same key as an equal list or dict.
+    if isinstance(value, dict):
+        # dict equality ignores order. Each nested dict takes one level of recursion.
+        return _DICT_KEY, frozenset((key, _hash_key(val)) for key, val in value.items())
+    if not isinstance(value, list):
+        try:
+            hash(value)
+            return value
+        except TypeError:
+            pass
+        if isinstance(value, (set, frozenset)):
+            return frozenset(value)
+        if not isinstance(value, tuple):
+            raise TypeError(f"unhashable type: '{type(value).__name__}'")
+
+    # Nested lists and tuples are flattened into a single tuple of tokens, each one opened by its tag and
+    # closed by _END_KEY, walking them with an explicit stack: neither building, hashing nor comparing the
+    # key recurses however deep the nesting. A list already open on the path (a recursive Array) is a token.
+    tokens: List[Any] = []
+    stack: List[Iterator[Any]] = []
+    path: List[int] = []
+    on_path: Set[int] = set()
+    container: Any = value
+    while container is not _MISSING:
+        tokens.append(_LIST_KEY if isinstance(container, list) else _TUPLE_KEY)
+        if any(map(isinstance, container, repeat(_CONTAINER_TYPES))):
+            stack.append(iter(container))
+            path.append(id(container))
+            on_path.add(id(container))
+        else:
+            # No nested container: the elements are the tokens, checked hashable in C.
+            hash(tuple(container))
+            tokens.extend(container)
+            tokens.append(_END_KEY)
+
+        container = _MISSING
+        while stack and container is _MISSING:
+            for val in stack[-1]:
+                if isinstance(val, list):
+                    if id(val) not in on_path:
+                        container = val
+                        break
+                    val = _RECURSIVE_KEY
+                elif isinstance(val, (dict, set)):
+                    val = _hash_key(val)
+                else:
+                    try:
+                        hash(val)
+                    except TypeError:
+                        if not isinstance(val, tuple):
+                            raise
+                        container = val
+                        break
+                tokens.append(val)
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+                tokens.append(_END_KEY)
+    return tuple(tokens)
+
+
+class _FrozenDict(dict):
+    """
+    Read only dict, hashable so that it can be a dict key, see _frozen_key.
+    """
+
+    def __hash__(self) -> int:
+        return hash(_hash_key(self))
+
+    def __readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(f"can't modify a dict used as a key: {self!r}")
+
+    __setitem__ = __delitem__ = __ior__ = __readonly
+    clear = pop = popitem = setdefault = update = __readonly
+
+
+def _frozen_key(value: Any) -> Any:
+    """
+    Returns value if it is hashable, else an equal hashable copy of it that can be a dict key:
+    a frozen Array for a list, a read only dict for a dict, a frozenset for a set.
+    Raises TypeError for other unhashable values.
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+
+    if isinstance(value, list):
+        return Array(map(_frozen_key, value)).freeze()
+    if isinstance(value, tuple):
+        return tuple(map(_frozen_key, value))
+    if isinstance(value, dict):
+        return _FrozenDict(value)
+    if isinstance(value, set):
+        return frozenset(value)
+    raise TypeError(f"unhashable type: '{type(value).__name__}'")
+
+
+class _KeySet:
+    """
+    Set of values compared with ==, hashing through _hash_key.
+
+    Values without a canonical key are kept in a list and compared one by one, only with each other.
+    """
+
+    __slots__ = ("_keys", "_unkeyed")
+
+    def __init__(self, values: Iterable = ()) -> None:
+        self._keys: Set[Any] = set()
+        self._unkeyed: List[Any] = []
+        for val in values:
+            self.add(val)
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            return _hash_key(value) in self._keys
+        except TypeError:
+            return value in self._unkeyed
+
+    def add(self, value: Any) -> bool:
+        # Returns True when value was not in the set yet.
+        try:
+            key = _hash_key(value)
+        except TypeError:
+            if value in self._unkeyed:
+                return False
+            self._unkeyed.append(value)
+            return True
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        return True
+
+
+class _LengthHinted:
+    """
+    Iterable over an iterator, with a length hint.
+
+    list() and list.extend read the length hint of the iterable they are given but iterate over its
+    iterator, so the list is allocated once at the hinted size and filled in C.
+    """
+
+    __slots__ = ("_iterator", "_hint")
+
+    def __init__(self, iterator: Iterator, hint: int) -> None:
+        self._iterator = iterator
+        self._hint = hint
+
+    def __iter__(self) -> Iterator:
+        return self._iterator
+
+    def __length_hint__(self) -> int:
+        return self._hint
+
 
 class Array(list):
     """
@@ -24,10 +227,34 @@ class Array(list):
         def __repr__(self):
             return f"RBDefault Value : {self.value}"
 
-    # TODO Array.new https://ruby-doc.org/3.1.3/Array.html#class-Array-label-Creating+Arrays
+    # Opt-in value -> ascending positions index, see build_index. None while not enabled.
+    # Values are keyed with _hash_key, so that equal values share a key whether they are hashable or not.
+    __value_index: Optional[Dict[Any, List[int]]] = None
+    # Set when an element has no canonical key: it could be == to any argument, so lookups scan.
+    __value_index_incomplete: bool = False
+    # Set by mutators the index can't follow incrementally, the index is rebuilt on the next lookup.
+    __value_index_stale: bool = False
+    # Set by freeze, every mutator then raises FrozenError.
+    __frozen: bool = False
+    # Content hash cached by hash while frozen, shared with dups until their first mutation.
+    __content_hash: Optional[int] = None
+
     def __init__(self, value) -> None:
         super().__init__(value)
 
+    def __copy__(self) -> Array:
+        # The value index is not shared with copies, it would be corrupted by their mutations.
+        return type(self)(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Array:
+        # copy.deepcopy would restore the frozen flag before adding the elements.
+        copy = type(self)([])
+        memo[id(self)] = copy
+        copy.extend(deepcopy(val, memo) for val in self)
+        if self.__frozen:
+            copy.freeze()
+        return copy
+
     # -----------------------------------------------------------------------------------------------
     # Array methods for creating new array.
     # https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Creating+an+Array
@@ -39,16 +266,198 @@ class Array(list):
     # def [](cls):
     #     pass
 
-    # TODO Figure out the new mess and how to implement it.
-    # https://docs.ruby-lang.org/en/master/Array.html#method-c-5B-5D
+    # https://docs.ruby-lang.org/en/master/Array.html#method-c-new
     @classmethod
-    def new(cls):
-        pass
+    def new(cls, size: int | Iterable = _RLDefault(None), default: Any = _RLDefault(None), *,
+            block: Optional[Callable[[int], Any]] = None) -> Array:
+        """
+        Returns a new Array.
 
-    # https://docs.ruby-lang.org/en/master/Array.html#method-c-new
+        With no arguments, returns a new empty Array.
+        With an Iterable, returns a new Array holding its elements.
+        With an int size and a default, returns a new Array of size references to default, the same object.
+        With an int size and a block, returns a new Array of the values block(i) for each index i.
+        With only an int size, returns a new Array of size None elements.
+
+        The list is allocated once at its final size: size copies of default are made by list
+        repetition, and block values or the elements of an Iterable with a length hint are filled
+        in C without reallocating.
+
+        Parameters
+        ----------
+        size: int | Iterable
+            Size of the new Array, or elements to copy.
+        default: Any
+            The object every element refers to.
+        block: Optional[Callable[[int], Any]] = None
+            The function called with each index to compute the element at that index.
+
+        Returns
+        -------
+        Array
+            New Array.
+
+        Raises
+        ------
+        ValueError
+            If size is negative.
+
+        Examples
+        --------
+        >>> Array.new()
+        []
+        >>> Array.new(3)
+        [None, None, None]
+        >>> a = Array.new(3, [])
+        >>> a[0] is a[2]
+        True
+        >>> Array.new(4, block=lambda i: i * i)
+        [0, 1, 4, 9]
+        >>> Array.new(range(3))
+        [0, 1, 2]
+        """
+        if isinstance(size, cls._RLDefault):
+            return cls([])
+        if not isinstance(size, int):
+            return cls(size)
+        if size < 0:
+            raise ValueError("negative array size")
+        if block is not None:
+            if not isinstance(default, cls._RLDefault):
+                warnings.warn("block supersedes default value argument")
+            return cls(_LengthHinted(map(block, range(size)), size))
+        arr = cls([None if isinstance(default, cls._RLDefault) else default])
+        arr *= size
+        return arr
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-c-try_convert
     @classmethod
-    def try_convert(cls):
-        pass
+    def try_convert(cls, obj: Any) -> Optional[Array]:
+        """
+        Returns obj converted to an Array, or None if it can't be converted.
+
+        An Array is returned as is, without copying. A list is copied once, in C, since a list can't
+        become an Array in place. Other objects are converted with their to_ary method, if they have one.
+
+        Parameters
+        ----------
+        obj: Any
+            The object to convert.
+
+        Returns
+        -------
+        Optional[Array]
+            obj as an Array, None if it can't be converted.
+
+        Examples
+        --------
+        >>> a = Array([1, 2])
+        >>> Array.try_convert(a) is a
+        True
+        >>> Array.try_convert([1, 2]), Array.try_convert('12')
+        ([1, 2], None)
+        """
+        if not isinstance(obj, list):
+            to_ary = getattr(obj, "to_ary", None)
+            if to_ary is None:
+                return None
+            converted = to_ary()
+            if not isinstance(converted, list):
+                raise TypeError(f"can't convert {type(obj).__name__} to Array "
+                                f"({type(obj).__name__}#to_ary gives {type(converted).__name__})")
+            obj = converted
+        return obj if isinstance(obj, Array) else cls(obj)
+
+    # Not part of Ruby, builds an Array from an iterator of known length.
+    @classmethod
+    def from_iter(cls, iterable: Iterable, size_hint: Optional[int] = None) -> Array:
+        """
+        Returns a new Array of the elements of iterable, allocated once at size_hint elements.
+
+        Generators and other iterators without a length hint otherwise make the list grow several
+        times while it is filled. size_hint only sizes the allocation: the Array holds all the
+        elements of iterable, fewer or more than size_hint.
+
+        Parameters
+        ----------
+        iterable: Iterable
+            The elements of the new Array.
+        size_hint: Optional[int] = None
+            The expected count of elements.
+
+        Returns
+        -------
+        Array
+            New Array.
+
+        Examples
+        --------
+        >>> Array.from_iter((i * 2 for i in range(4)), size_hint=4)
+        [0, 2, 4, 6]
+        """
+        if size_hint is None:
+            return cls(iterable)
+        if size_hint < 0:
+            raise ValueError("negative size hint")
+        return cls(_LengthHinted(iter(iterable), size_hint))
+
+    # Not part of Ruby, numeric Arrays stored unboxed in a typed buffer.
+    @classmethod
+    def typed(cls, typecode: str, value: Iterable = ()) -> TypedArray:
+        """
+        Creates an Array of numbers stored in a typed buffer from the array module.
+
+        Queries such as all, any, count, include, index, sum, min and max run as bulk operations,
+        vectorized with NumPy when it is installed.
+
+        Parameters
+        ----------
+        typecode: str
+            array module numeric typecode, e.g. 'd' for float or 'q' for 64 bit int.
+        value: Iterable
+            The numbers to store.
+
+        Returns
+        -------
+        TypedArray
+            New typed Array holding the numbers in value.
+
+        Examples
+        --------
+        >>> Array.typed('d', [1, 2.5])
+        Array.typed('d', [1.0, 2.5])
+        """
+        from .ruby_typed_array import TypedArray
+
+        return TypedArray(typecode, value)
+
+    # Not part of Ruby, see MappedArray.
+    @classmethod
+    def mmap(cls, path: str | os.PathLike, dtype: str, *, writable: bool = False) -> MappedArray:
+        """
+        Opens a file of fixed width records as a read-mostly Array, memory mapped instead of loaded.
+
+        length, indexing and slicing (as views, not copies) read only the records needed, include, index,
+        rindex, count, all and any stream over the mapping in chunks. With writable=True records can be
+        appended with push and written to disk with flush.
+
+        Parameters
+        ----------
+        path: str | os.PathLike
+            The file, created when missing and writable is True.
+        dtype: str
+            struct format of one record, e.g. 'q' for numbers or '<qd' for (int, float) tuples.
+        writable: bool = False
+            Whether records can be appended.
+
+        Returns
+        -------
+        MappedArray
+            Array view over the file. Close it (or use it as a context manager) to unmap the file.
+        """
+        from .ruby_mapped_array import MappedArray
+
+        return MappedArray(path, dtype, writable=writable)
 
     # -----------------------------------------------------------------------------------------------
     # Methods for Querying.
@@ -105,6 +514,9 @@ class Array(list):
         >>> rb_arr.include("String")
         True
         """
+        positions = self.__indexed_positions(item)
+        if positions is not None:
+            return bool(positions)
         return item in self
 
     # Returns whether there are no elements.
@@ -143,14 +555,28 @@ class Array(list):
         else:
             return True
 
+    # Private Method
+    # Lazily yields the values tested by all?, any?, none?, one? and count.
+    # Nothing is evaluated until the consumer pulls, so short-circuiting consumers stop calling the block early.
+    def __predicate_values(self, obj: Optional[Any], block: Optional[Callable[[Any], Any]]) -> Optional[Iterator]:
+        if self.__is_default_args(obj) and (block is None):
+            values = iter(self)
+        elif self.__is_passed_args(obj):
+            values = (val == obj for val in self)
+        elif block:
+            values = (block(val) for val in self)
+        else:
+            values = None
+        return values
+
     # Private Method
     # Custom Method used to check self.all?, self.any?, self.none? and self.one?
     def __check_all_any(
             self,
-            method_to_apply: Callable[[Iterable], bool],
+            method_to_apply: Callable[[Iterable], Any],
             obj: Optional[Any],
             block: Optional[Callable[[Any], Any]]
-    ) -> bool:
+    ) -> Any:
 
         if self.__is_passed_args(obj) and block:
             warnings.warn("Both argument and block is given. block will be ignored")
@@ -159,21 +585,12 @@ class Array(list):
             status = method_to_apply(self)
 
         else:
-            # If object and block is not passed by user.
-            if self.__is_default_args(obj) and (block is None):
-                status = method_to_apply(self)
-
-            # If object is  passed by user.
-            elif self.__is_passed_args(obj):
-                status = method_to_apply([val == obj for val in self])
-
-            # If block is  passed by user.
-            elif block:
-                status = method_to_apply([block(val) for val in self])
-
-            else:
+            values = self.__predicate_values(obj, block)
+            if values is None:
                 status = None
                 warnings.warn("Invalid Options")
+            else:
+                status = method_to_apply(values)
 
         return status
 
@@ -459,16 +876,20 @@ class Array(list):
 
         """
 
-        truthy_count = self.__check_all_any(self.__count_truthy, obj, block)
-        if truthy_count == 1:
-            value = True
-        else:
-            value = False
+        return bool(self.__check_all_any(self.__is_exactly_one, obj, block))
 
-        return value
+    # Private Method
+    # Stops at the second truthy value, the answer is already known to be False.
+    @staticmethod
+    def __is_exactly_one(iterable: Iterable) -> bool:
+        truthy_values = filter(None, iterable)
+        return next(truthy_values, _MISSING) is not _MISSING and next(truthy_values, _MISSING) is _MISSING
 
-    def __count_truthy(self, iterable: Iterable) -> bool:
-        return sum([bool(val) for val in iterable])
+    # Private Method
+    # Counts truthy values without building an intermediate list.
+    @staticmethod
+    def __count_truthy(iterable: Iterable) -> int:
+        return sum(1 for val in iterable if val)
 
     #  Returns the count of elements that meet a given criterion.
     # https://docs.ruby-lang.org/en/master/Array.html#method-i-count
@@ -522,15 +943,63 @@ class Array(list):
 
         if self.__is_default_args(obj) and (block is None):
             value = len(self)
+        elif self.__is_passed_args(obj):
+            if block:
+                warnings.warn("Both argument and block is given. block will be ignored")
+            positions = self.__indexed_positions(obj)
+            value = len(positions) if positions is not None else super().count(obj)
         else:
             value = self.__check_all_any(self.__count_truthy, obj, block)
 
         return value
 
+    # Private Method
+    # Walks self in place between start and stop (forward or backward) and returns the first matching index.
+    def __scan(
+            self,
+            obj: Optional[Any],
+            block: Optional[Callable[[Any], Any]],
+            start: Optional[int],
+            stop: Optional[int],
+            reverse: bool = False
+    ) -> Optional[int]:
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return None
+
+        if self.__is_passed_args(obj):
+            positions = self.__indexed_positions(obj)
+            if positions is not None:
+                # Positions are ascending, bisect for the first (or last) one inside start:stop.
+                if reverse:
+                    found = bisect_left(positions, stop) - 1
+                    return positions[found] if found >= 0 and positions[found] >= start else None
+                found = bisect_left(positions, start)
+                return positions[found] if found < len(positions) and positions[found] < stop else None
+            if not reverse:
+                # list.index already stops at the first hit, and does it in C.
+                try:
+                    return super().index(obj, start, stop)
+                except ValueError:
+                    return None
+            for i in range(stop - 1, start - 1, -1):
+                val = self[i]
+                if val is obj or val == obj:
+                    return i
+            return None
+
+        positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        for i in positions:
+            if block(self[i]):
+                return i
+        return None
+
     # Returns the index of the first element that meets a given criterion.
     # https://docs.ruby-lang.org/en/master/Array.html#method-i-index
     def index(self, obj: Optional[Any] = _RLDefault(None), *,
-              block: Optional[Callable[[Any], Any]] = None) -> int | None | Iterable:
+              block: Optional[Callable[[Any], Any]] = None,
+              start: Optional[int] = None,
+              stop: Optional[int] = None) -> int | None | Iterable:
         """
         Returns the index of a specified element. Alias for: find_index
 
@@ -542,12 +1011,18 @@ class Array(list):
         Returns nil if the block never returns a truthy value.
         When neither an argument nor a block is given, returns a new Enumerator(Iterator):
 
+        The search stops at the first match, and can be bounded to self[start:stop] to resume a previous search.
+
         Parameters
         ----------
         obj: Optional[Any] = _RLDefault(None)
             The element that will be compared with self to return its first index
         block: Optional[Callable[[Any], Any]] = None
             The function in which each element will be passed to check.
+        start: Optional[int] = None
+            Index to start searching from, same semantics as a slice start.
+        stop: Optional[int] = None
+            Index to stop searching at (exclusive), same semantics as a slice stop.
 
         Returns
         -------
@@ -561,6 +1036,10 @@ class Array(list):
         1
         >>> Array(['foo', 'bar', 2, 'bar']).index(block=lambda x: x == 'bar')
         1
+        >>> Array(['foo', 'bar', 2, 'bar']).index('bar', start=2)
+        3
+        >>> Array(['foo', 'bar', 2, 'bar']).index('bar', start=2, stop=3) is None
+        True
         >>> iter_obj = Array(['foo', 'bar', 2, 'bar']).index()
         >>> list(iter_obj)
         ['foo', 'bar', 2, 'bar']
@@ -569,18 +1048,8 @@ class Array(list):
         if self.__is_passed_args(obj) and block:
             warnings.warn("Ignoring Block since both block and argument is passed.")
 
-        value = None
-        if self.__is_passed_args(obj):
-            if obj in self:
-                value = super().index(obj)
-            else:
-                value = None
-        elif block:
-            collected_values = [bool(block(val)) for val in self]
-            if True in collected_values:
-                value = collected_values.index(True)
-            else:
-                value = None
+        if self.__is_passed_args(obj) or block:
+            value = self.__scan(obj, block, start, stop)
         else:
             value = iter(self)
 
@@ -591,10 +1060,11 @@ class Array(list):
     # ==> [alias]
     find_index = index
 
-    # TODO-IMPLEMENT
     # https://docs.ruby-lang.org/en/master/Array.html#method-i-rindex
     def rindex(self, obj: Optional[Any] = _RLDefault(None), *,
-               block: Optional[Callable[[Any], Any]] = None) -> int | None | Iterable:
+               block: Optional[Callable[[Any], Any]] = None,
+               start: Optional[int] = None,
+               stop: Optional[int] = None) -> int | None | Iterable:
         """
         Returns the index of the last element that meets a given criterion.
 
@@ -604,12 +1074,18 @@ class Array(list):
         Returns nil if the block never returns a truthy value.
         When neither an argument nor a block is given, returns a new Enumerator:
 
+        Elements are walked backward in place from stop towards start, without copying self.
+
         Parameters
         ----------
         obj: Optional[Any] = _RLDefault(None)
-            The element that will be compared with self to return its first index
+            The element that will be compared with self to return its last index
         block: Optional[Callable[[Any], Any]] = None
             The function in which each element will be passed to check.
+        start: Optional[int] = None
+            Lowest index to search (inclusive), same semantics as a slice start.
+        stop: Optional[int] = None
+            Index to start walking backward from (exclusive), same semantics as a slice stop.
 
         Returns
         -------
@@ -623,248 +1099,2195 @@ class Array(list):
         3
         >>> Array(['foo', 'bar', 2, 'bar']).rindex(block=lambda x: x == 'bar')
         3
+        >>> Array(['foo', 'bar', 2, 'bar']).rindex('bar', stop=3)
+        1
         >>> iter_obj = Array(['foo', 'bar', 2, 'bar']).rindex()
         >>> list(iter_obj)
         ['foo', 'bar', 2, 'bar']
         """
 
-        if self.__is_default_args(obj) and block is None:
-            value = iter(self)
-        else:
-            # TODO Replace with .reverse() when implemented.
-            reversed_array = Array(reversed(self))
+        if self.__is_passed_args(obj) and block:
+            warnings.warn("Ignoring Block since both block and argument is passed.")
 
-            reversed_index = reversed_array.index(obj, block=block)
-            if isinstance(reversed_index, int) :
-                value = self.length() - reversed_index - 1
-            else:
-                value = reversed_index
+        if self.__is_passed_args(obj) or block:
+            value = self.__scan(obj, block, start, stop, reverse=True)
+        else:
+            value = iter(self)
 
         return value
 
-
-
-    # TODO-CHECK
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-rindex
-    def hash(self) -> int:
+    # Not part of Ruby, makes include, index, rindex and count(obj) O(1) for hashable objects.
+    def build_index(self) -> Array:
         """
-        Returns id of self
+        Builds (or rebuilds) a value to positions index over self; returns self.
+
+        While the index exists, include, index, find_index, rindex and count with an argument look the
+        argument up in the index instead of scanning. Appending with push, append, extend or += updates
+        the index in place, every other mutation marks it stale and it is rebuilt on the next lookup.
+        Elements and arguments are keyed with their canonical key, so unhashable lists, dicts and sets
+        are indexed too. While an element has no canonical key (an unhashable object of another type),
+        and for such arguments, lookups scan instead.
 
         Returns
         -------
-        int
-            Returns id of self
+        Self
+            Returns self.
+
+        Examples
+        --------
+        >>> a = Array(['foo', 'bar', 2, 'bar']).build_index()
+        >>> a.index('bar'), a.rindex('bar'), a.count('bar')
+        (1, 3, 2)
+        >>> a.push('bar').count('bar')
+        3
         """
-        return id(self)
+        self.__value_index = {}
+        self.__value_index_incomplete = False
+        self.__value_index_stale = False
+        self.__index_from(0)
+        return self
 
-    # ---------------------------------------------------------------------------------
-    #   Methods for Comparing
-    #   https://docs.ruby-lang.org/en/master/Array.html
-    # ---------------------------------------------------------------------------------
+    # Private Method
+    # Adds the elements from position start on to the value index.
+    def __index_from(self, start: int) -> None:
+        value_index = self.__value_index
+        for position in range(start, len(self)):
+            try:
+                key = _hash_key(self[position])
+            except TypeError:
+                self.__value_index_incomplete = True
+                continue
+            value_index.setdefault(key, []).append(position)
+
+    # Not part of Ruby, see build_index.
+    def drop_index(self) -> Array:
+        """
+        Removes the index created by build_index; returns self.
 
-    # <=> RENAMED to compare
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-3C-3D-3E
-    def compare(self, other_array: Array) -> int:
+        Returns
+        -------
+        Self
+            Returns self.
         """
-        Compare Arrays and returns -1, 0 or 1.
+        self.__value_index = None
+        self.__value_index_stale = False
+        return self
 
-        if self == other_array, returns 0
-        if self < other_array, returns -1
-        if self > other_array, returns 1
+    # Private Method
+    # Ascending positions of obj from the value index, None when lookups must scan instead.
+    def __indexed_positions(self, obj: Any) -> Optional[List[int]]:
+        if self.__value_index is None:
+            return None
+        if self.__value_index_stale:
+            self.build_index()
+        if self.__value_index_incomplete:
+            return None
+        try:
+            return self.__value_index.get(_hash_key(obj), [])
+        except TypeError:
+            return None
 
-        Returns -1, 0, or 1 as self is less than, equal to, or greater than other_array. For each index i in self,
-        evaluates result = self[i] compares other_array[i]
-        Returns -1 if any result is -1:
-        Returns 1 if any result is 1:
-        When all results are zero:
-        Returns -1 if array is smaller than other_array:
-        Returns 1 if array is larger than other_array
-        Returns 0 if array and other_array are the same size:
+    # Private Method
+    # Called by every mutator before changing self.
+    def __modifying(self) -> None:
+        if self.__frozen:
+            raise FrozenError(f"can't modify frozen {type(self).__name__}: {self!r}")
 
-        Parameters
-        ----------
-        other_array:
-            Array Object to compare.
+    # Private Method
+    # Called by every mutator. appended_from is the old length when elements were only appended.
+    def __mutated(self, appended_from: Optional[int] = None) -> None:
+        self.__content_hash = None
+        if self.__value_index is None or self.__value_index_stale:
+            return
+        if appended_from is None:
+            self.__value_index_stale = True
+            return
+        self.__index_from(appended_from)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-hash
+    def hash(self) -> int:
+        """
+        Returns the integer hash value for self.
+
+        Two Arrays with the same content (compared with ==) have the same hash value.
+        The value of a frozen Array is computed once and cached. Nested lists are walked without
+        recursion, so any depth of nesting can be hashed.
 
         Returns
         -------
         int
-            -1, 0 or 1 based result of comparision between the arrays.
+            Hash value of the content of self.
 
         Examples
         --------
-        >>> Array([0, 1, 2]).compare(Array([0, 1, 3]))
-        -1
-        >>> Array([0, 1, 2]).compare(Array([0, 1, 1]))
-        1
-        >>> Array([0, 1, 2]).compare(Array([0, 1, 2, 3]))
-        -1
-        >>> Array([0, 1, 2]).compare(Array([0, 1]))
-        1
-        >>> Array([0, 1, 2]).compare(Array([0, 1, 2]))
-        0
+        >>> Array([1, [2], {'a': 3}]).hash() == Array([1, [2], {'a': 3}]).hash()
+        True
         """
+        content_hash = self.__content_hash
+        if content_hash is None:
+            content_hash = hash(_hash_key(self))
+            if self.__frozen:
+                self.__content_hash = content_hash
+        return content_hash
+
+    def __hash__(self) -> int:
+        # Only frozen Arrays can be used as dict keys or set members, their content can't change.
+        if not self.__frozen:
+            raise TypeError(f"unhashable type: '{type(self).__name__}' (freeze it to use it as a key)")
+        return self.hash()
+
+    # https://docs.ruby-lang.org/en/master/Object.html#method-i-freeze
+    def freeze(self) -> Array:
+        """
+        Freezes self, making it immutable; returns self.
 
-        if self == other_array:
-            return 0
-        elif self < other_array:
-            return -1
-        else:
-            return 1
+        Every mutator then raises FrozenError, and self becomes hashable (see hash).
+        Like Ruby, freezing is shallow: the elements themselves are not frozen.
 
-    # No Need to Implement
-    # ==
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-3C-3D-3E
+        As __hash__ is defined on the class, collections.abc.Hashable can't tell a frozen Array from
+        one that is not: use frozen, or try hash(), to know whether an Array can be a key.
 
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-eql-3F
-    def eql(self, other_array: Array) -> bool:
+        Returns
+        -------
+        Self
+            Returns self.
+
+        Examples
+        --------
+        >>> a = Array([1, 2]).freeze()
+        >>> {a: 'memoized'}[Array([1, 2]).freeze()]
+        'memoized'
+        >>> a.push(3)
+        Traceback (most recent call last):
+        ...
+        rubylang.ruby_array.FrozenError: can't modify frozen Array: [1, 2]
         """
-        Checks if two Arrays are Equal.
+        self.__frozen = True
+        return self
 
-        Returns true if self and other_array are the same size, and if,
-        for each index i in self, self[i] == other_array[i]
+    # frozen? RENAMED to frozen
+    # https://docs.ruby-lang.org/en/master/Object.html#method-i-frozen-3F
+    def frozen(self) -> bool:
+        """
+        Returns whether self is frozen, see freeze.
 
-        Parameters
-        ----------
-        other_array: Self
+        Examples
+        --------
+        >>> Array([1]).frozen(), Array([1]).freeze().frozen()
+        (False, True)
+        """
+        return self.__frozen
+
+    # https://docs.ruby-lang.org/en/master/Object.html#method-i-dup
+    def dup(self) -> Array:
+        """
+        Returns a new, not frozen, shallow copy of self.
 
+        The elements are copied in a single C level pass without calling any Python code. The cached
+        hash of a frozen self is shared with the copy until the copy is first mutated.
 
         Returns
         -------
-        bool
-            True if both arrays are equal, False otherwise
+        Array
+            New Array with the elements of self.
 
         Examples
         --------
-        >>> Array(["foo", 'bar', 2]).eql(Array(["foo", 'bar', 2]))
-        True
+        >>> a = Array([1, 2]).freeze()
+        >>> b = a.dup().push(3)
+        >>> a, b, b.frozen()
+        ([1, 2], [1, 2, 3], False)
+        """
+        copy = type(self)(self)
+        copy.__content_hash = self.__content_hash
+        return copy
 
-        >>> Array(["foo", 'bar', "2"]).eql(Array(["foo", 'bar', 2]))
-        False
+    # https://docs.ruby-lang.org/en/master/Object.html#method-i-clone
+    def clone(self, *, freeze: Optional[bool] = None) -> Array:
+        """
+        Returns a shallow copy of self, frozen if self is frozen, unless freeze says otherwise.
+
+        Parameters
+        ----------
+        freeze: Optional[bool] = None
+            Whether the copy is frozen, by default the same as self.
+
+        Returns
+        -------
+        Array
+            New Array with the elements of self.
+
+        Examples
+        --------
+        >>> Array([1]).freeze().clone().frozen()
+        True
+        """
+        if freeze is None:
+            freeze = self.__frozen
+        copy = self.dup()
+        if freeze:
+            copy.freeze()
+        return copy
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Fetching
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Fetching
+    # ---------------------------------------------------------------------------------
+
+    # Private Method
+    # Binary search shared by bsearch and bsearch_index, the mode is chosen by each block result.
+    def __bsearch(self, block: Callable[[Any], Any]) -> Optional[int]:
+        low, high = 0, len(self)
+        found = None
+        while low < high:
+            mid = (low + high) // 2
+            result = block(self[mid])
+            if result is True:
+                # find-minimum mode: mid matches, look for an earlier match.
+                found = high = mid
+            elif result is False or result is None:
+                low = mid + 1
+            elif isinstance(result, (int, float)):
+                # find-any mode: positive means the wanted element is to the right.
+                if result == 0:
+                    return mid
+                if result > 0:
+                    low = mid + 1
+                else:
+                    high = mid
+            else:
+                raise TypeError(f"wrong argument type {type(result).__name__} (must be numeric, True, False or None)")
+        return found
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-bsearch
+    def bsearch(self, *, block: Callable[[Any], Any]) -> Any:
+        """
+        Returns an element from self selected by a binary search, in O(log n) block calls.
+
+        self must be sorted with respect to the block. The mode is chosen by the block results:
+        find-minimum mode, the block returns True or False (or None); returns the first element for which the
+        block returns True, assuming it returns False for every element before it and True after.
+        find-any mode, the block returns a number; returns an element for which the block returns 0, assuming
+        it returns positive numbers before such elements and negative numbers after them.
+        Returns None if no such element is found.
+
+        Parameters
+        ----------
+        block: Callable[[Any], Any]
+            The function in which the probed elements will be passed.
+
+        Returns
+        -------
+        Any
+            The element found, None otherwise.
+
+        Examples
+        --------
+        >>> a = Array([0, 4, 7, 10, 12])
+        >>> a.bsearch(block=lambda x: x >= 6)
+        7
+        >>> a.bsearch(block=lambda x: 10 - x)
+        10
+        >>> a.bsearch(block=lambda x: x >= 100) is None
+        True
+        """
+        position = self.__bsearch(block)
+        return None if position is None else self[position]
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-bsearch_index
+    def bsearch_index(self, *, block: Callable[[Any], Any]) -> Optional[int]:
+        """
+        Searches self as described at method bsearch, but returns the index of the found element.
+
+        Parameters
+        ----------
+        block: Callable[[Any], Any]
+            The function in which the probed elements will be passed.
+
+        Returns
+        -------
+        Optional[int]
+            Index of the element found, None otherwise.
+
+        Examples
+        --------
+        >>> a = Array([0, 4, 7, 10, 12])
+        >>> a.bsearch_index(block=lambda x: x >= 6)
+        2
+        >>> a.bsearch_index(block=lambda x: 12 - x)
+        4
+        """
+        return self.__bsearch(block)
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Converting
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Converting
+    # ---------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-pack
+    def pack(self, template: str, *, buffer: Optional[bytearray] = None) -> bytes | bytearray:
+        """
+        Packs the elements of self into binary data as directed by template.
+
+        Supports the integer (C c S s L l Q q n N v V), float (e E g G f d), string (a A Z), UTF-8 (U)
+        and BER-compressed integer (w) directives, each followed by an optional count or *.
+        See rubylang.ruby_pack for the details and rubylang.ruby_pack.unpack for the inverse.
+        Templates are compiled once and cached, and runs of numeric directives are packed in bulk.
+
+        Parameters
+        ----------
+        template: str
+            The directives, e.g. 'n*' or 'CCa4'.
+        buffer: Optional[bytearray] = None
+            When given, the packed data is appended to it and buffer is returned.
+
+        Returns
+        -------
+        bytes | bytearray
+            The packed data, or buffer when given.
+
+        Examples
+        --------
+        >>> Array([1, 2]).pack('n*')
+        b'\\x00\\x01\\x00\\x02'
+        >>> Array([65, 'bc', 1.0]).pack('Ca3e')
+        b'Abc\\x00\\x00\\x00\\x80?'
+        >>> Array([256, -1]).pack('CC')
+        b'\\x00\\xff'
+        """
+        from .ruby_pack import pack
+
+        return pack(self, template, buffer)
+
+    # Not part of Ruby, packs without allocating the result.
+    def pack_into(self, template: str, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        """
+        Packs the elements of self as directed by template (see pack) straight into a writable buffer.
+
+        Parameters
+        ----------
+        template: str
+            The directives, e.g. 'n*' or 'CCa4'.
+        buffer: bytearray | memoryview
+            Writable buffer, e.g. a bytearray, a memoryview or an mmap.
+        offset: int = 0
+            Position in buffer where writing starts.
+
+        Returns
+        -------
+        int
+            Position in buffer right after the packed data.
+
+        Examples
+        --------
+        >>> buffer = bytearray(6)
+        >>> Array([1, 2]).pack_into('v*', buffer, 1)
+        5
+        >>> buffer
+        bytearray(b'\\x00\\x01\\x00\\x02\\x00\\x00')
+        """
+        from .ruby_pack import pack_into
+
+        return pack_into(self, template, buffer, offset)
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Comparing
+    #   https://docs.ruby-lang.org/en/master/Array.html
+    # ---------------------------------------------------------------------------------
+
+    # Private Method
+    # First difference between the lists left and right, in a single pass, as (path, value, other value);
+    # None if they are equal. path holds the indices down the nested lists, and a value past the end of
+    # the shorter list is _MISSING. Nested lists are compared with an explicit stack, a pair of lists
+    # already being compared on the path (a recursive Array) is considered equal.
+    @staticmethod
+    def __first_difference(left: list, right: list) -> Optional[Tuple[Tuple[int, ...], Any, Any]]:
+        # Nested lists are compared in C until C runs out of stack once, from then on slices holding
+        # lists are compared element by element here.
+        nested_in_c = True
+
+        # Positions i where vals[i] and others[i] may differ, in ascending order, up to the shorter length,
+        # comparing one slice of _COMPARE_CHUNK elements at a time. Pairs of lists and identical elements
+        # unequal to themselves (NaN) may be yielded too.
+        def unequal_positions(vals: list, others: list) -> Iterator[int]:
+            nonlocal nested_in_c
+            size = min(len(vals), len(others))
+            for start in range(0, size, _COMPARE_CHUNK):
+                stop = min(start + _COMPARE_CHUNK, size)
+                chunk = list.__getitem__(vals, slice(start, stop))
+                other_chunk = list.__getitem__(others, slice(start, stop))
+                if nested_in_c or not any(map(isinstance, chunk, repeat(list))):
+                    try:
+                        positions = [] if chunk == other_chunk else list(
+                            compress(count(start), map(operator.ne, chunk, other_chunk)))
+                    except RecursionError:
+                        nested_in_c = False
+                    else:
+                        yield from positions
+                        continue
+                for position, val, other in zip(count(start), chunk, other_chunk):
+                    if val is not other and (isinstance(val, list) and isinstance(other, list) or val != other):
+                        yield position
+
+        stack = [(left, right, unequal_positions(left, right))]
+        path: List[int] = []
+        on_path = {(id(left), id(right))}
+        while stack:
+            vals, others, positions = stack[-1]
+            for position in positions:
+                val, other = vals[position], others[position]
+                if val is other:
+                    continue
+                if not (isinstance(val, list) and isinstance(other, list)):
+                    return (*path, position), val, other
+                if (id(val), id(other)) not in on_path:
+                    stack.append((val, other, unequal_positions(val, other)))
+                    path.append(position)
+                    on_path.add((id(val), id(other)))
+                    break
+            else:
+                if len(vals) != len(others):
+                    position = min(len(vals), len(others))
+                    val = vals[position] if position < len(vals) else _MISSING
+                    other = others[position] if position < len(others) else _MISSING
+                    return (*path, position), val, other
+                stack.pop()
+                on_path.discard((id(vals), id(others)))
+                if path:
+                    path.pop()
+        return None
+
+    # <=> RENAMED to compare
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-3C-3D-3E
+    def compare(self, other_array: Array) -> Optional[int]:
+        """
+        Compare Arrays and returns -1, 0, 1 or None.
+
+        if self == other_array, returns 0
+        if self < other_array, returns -1
+        if self > other_array, returns 1
+        if the elements that differ first can't be ordered, returns None
+
+        Returns -1, 0, or 1 as self is less than, equal to, or greater than other_array. For each index i in self,
+        evaluates result = self[i] compares other_array[i]
+        Returns -1 if any result is -1:
+        Returns 1 if any result is 1:
+        When all results are zero:
+        Returns -1 if array is smaller than other_array:
+        Returns 1 if array is larger than other_array
+        Returns 0 if array and other_array are the same size:
+
+        The Arrays are scanned once up to the first difference, see mismatch. Nested Arrays are compared
+        the same way, with an explicit stack instead of recursion.
+
+        Parameters
+        ----------
+        other_array:
+            Array Object to compare.
+
+        Returns
+        -------
+        Optional[int]
+            -1, 0 or 1 based result of comparision between the arrays, None if they can't be compared.
+
+        Examples
+        --------
+        >>> Array([0, 1, 2]).compare(Array([0, 1, 3]))
+        -1
+        >>> Array([0, 1, 2]).compare(Array([0, 1, 1]))
+        1
+        >>> Array([0, 1, 2]).compare(Array([0, 1, 2, 3]))
+        -1
+        >>> Array([0, 1, 2]).compare(Array([0, 1]))
+        1
+        >>> Array([0, 1, 2]).compare(Array([0, 1, 2]))
+        0
+        >>> Array([0, [1, 2]]).compare(Array([0, [1, 'a']])) is None
+        True
+        """
+        if not isinstance(other_array, list):
+            return None
+        difference = self.__first_difference(self, other_array)
+        if difference is None:
+            return 0
+        _, val, other = difference
+        if val is _MISSING:
+            return -1
+        if other is _MISSING:
+            return 1
+        try:
+            if val < other:
+                return -1
+            if other < val:
+                return 1
+        except TypeError:
+            pass
+        return None
+
+    # No Need to Implement
+    # ==
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-3C-3D-3E
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-eql-3F
+    def eql(self, other_array: Array) -> bool:
+        """
+        Checks if two Arrays are Equal.
+
+        Returns true if self and other_array are the same size, and if,
+        for each index i in self, self[i] == other_array[i]
+
+        Parameters
+        ----------
+        other_array: Self
+
+
+        Returns
+        -------
+        bool
+            True if both arrays are equal, False otherwise
+
+        Examples
+        --------
+        >>> Array(["foo", 'bar', 2]).eql(Array(["foo", 'bar', 2]))
+        True
+
+        >>> Array(["foo", 'bar', "2"]).eql(Array(["foo", 'bar', 2]))
+        False
 
         Notes
         -----
         This Method should compare based on .eql? on both objects,
         But simply comparing using == since Python does not follow .eql? convension.
+        Arrays nested deeper than the recursion limit are compared with an explicit stack.
+        """
+        if not isinstance(other_array, list):
+            return False
+        try:
+            return list.__eq__(self, other_array)
+        except RecursionError:
+            return self.__first_difference(self, other_array) is None
+
+    # Not part of Ruby, for diffing nested Arrays.
+    def mismatch(self, other_array: list) -> Optional[Tuple[int, ...]]:
+        """
+        Returns the path to the first element that differs between self and other_array, None if they are equal.
+
+        The path holds one index per level of nesting. When one Array is a prefix of the other, the
+        last index is the length of the shorter one. Scans once up to the difference, nested Arrays
+        with an explicit stack.
+
+        Parameters
+        ----------
+        other_array: list
+            Array to compare self with.
+
+        Returns
+        -------
+        Optional[Tuple[int, ...]]
+            Indices leading to the first difference, None if there is none.
+
+        Raises
+        ------
+        TypeError
+            If other_array is not a list.
+
+        Examples
+        --------
+        >>> Array([0, [1, [2, 3]], 4]).mismatch([0, [1, [2, 5]], 4])
+        (1, 1, 1)
+        >>> Array([0, 1]).mismatch([0, 1, 2])
+        (2,)
+        >>> Array([0, 1]).mismatch([0, 1]) is None
+        True
         """
-        return self == other_array
+        if not isinstance(other_array, list):
+            raise TypeError(f"no implicit conversion of {type(other_array).__name__} into Array")
+        difference = self.__first_difference(self, other_array)
+        return None if difference is None else difference[0]
 
     # ---------------------------------------------------------------------------------
-    #   Methods for Assigning
-    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Assigning
+    #   Methods for Fetching
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Fetching
     # ---------------------------------------------------------------------------------
 
-    # No Need to Implement
-    # []= : Assigns specified elements with a given object.
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-5B-5D-3D
+    # Private Method
+    # Ruby style error for values that can't be ordered, naming the first incomparable pair.
+    @staticmethod
+    def __comparison_error(values: List[Any]) -> TypeError:
+        first = values[0]
+        for val in values:
+            try:
+                first < val
+                val < first
+            except TypeError:
+                return TypeError(f"comparison of {type(first).__name__} with {type(val).__name__} failed")
+        return TypeError("comparison failed")
 
-    # push, append, <<: Appends trailing elements.
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-push
-    def push(self, *objects: Any) -> Array:
+    # Private Method
+    # Shared by min, max, min_by and max_by. keys[i] orders self[i], each key is computed once by the caller.
+    def __extreme(self, keys: List[Any], n: Optional[int], largest: bool) -> Any:
+        if n is not None and n < 0:
+            raise ValueError(f"negative size ({n})")
+        if not keys:
+            return None if n is None else Array([])
+
+        positions = range(len(keys))
+        try:
+            if n is None:
+                pick = max if largest else min
+                return self[pick(positions, key=keys.__getitem__)]
+            # Bounded heap, O(len(self) * log(n)) instead of sorting everything.
+            select = heapq.nlargest if largest else heapq.nsmallest
+            return Array([self[i] for i in select(n, positions, key=keys.__getitem__)])
+        except TypeError:
+            raise self.__comparison_error(keys) from None
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-min
+    def min(self, n: Optional[int] = None, *, block: Optional[Callable[[Any, Any], int]] = None) -> Any:
         """
-        Appends trailing elements. Also aliased as: append_multiple
+        Returns one of the following: The minimum-valued element from self, or a new Array of minimum-valued elements.
 
-        Appends each argument in objects to self; returns self:
-        Appends each argument as one element, even if it is another Array:
+        With no argument and no block, returns the element in self having the minimum value; None if self is empty.
+        With argument n and no block, returns a new Array with at most n elements, in ascending order.
+        With a block given, the block is a comparator: it is called with two elements and returns
+        a negative number, 0 or a positive number, like Ruby's <=>.
 
         Parameters
         ----------
-        objects: Any
-            Elements to be appended to self.
+        n: Optional[int] = None
+            Number of minimum elements to return.
+        block: Optional[Callable[[Any, Any], int]] = None
+            Comparator used instead of <.
 
         Returns
         -------
-        Self
-            Returns self.
+        Any | Array
+            The minimum element, or an Array of the n minimum elements.
 
         Examples
         --------
-        >>> a = Array(['foo', 'bar', 2])
-        >>> a.push('baz','bat')
-        ['foo', 'bar', 2, 'baz', 'bat']
-
-        >>> b = Array(['foo', 'bar', 2])
-        >>> c = b.append(['baz', 'bat'],Array(['bam', 'bad']))
-        >>> c
-        ['foo', 'bar', 2, ['baz', 'bat'], ['bam', 'bad']]
-        >>> b
-        ['foo', 'bar', 2, ['baz', 'bat'], ['bam', 'bad']]
+        >>> Array([0, 1, 2]).min()
+        0
+        >>> Array([0, 1, 2, 3]).min(3)
+        [0, 1, 2]
+        >>> Array(['0', '00', '000']).min(block=lambda a, b: len(a) - len(b))
+        '0'
+        >>> Array([1, 'a']).min()
+        Traceback (most recent call last):
+        ...
+        TypeError: comparison of int with str failed
         """
-        self.extend(objects)
-        return self
-
-    # push, append, <<: Appends trailing elements.
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-append
-    # ==> [alias]
-    append = push
+        keys = list(map(cmp_to_key(block), self)) if block else self
+        return self.__extreme(keys, n, largest=False)
 
-    # INEFFICIENT, OPTIMIZE, we can right shift bulk and copy once instead of each element.
-    # unshift, prepend: Prepends leading elements.
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-unshift
-    def unshift(self, *objects: Any) -> Array:
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-max
+    def max(self, n: Optional[int] = None, *, block: Optional[Callable[[Any, Any], int]] = None) -> Any:
         """
-        Prepends the given objects to self: Also aliased as: prepend
+        Returns one of the following: The maximum-valued element from self, or a new Array of maximum-valued elements.
 
-        Prepend (Inserts at beginning) each argument in objects to self; returns self:
-        Prepend each argument as one element, even if it is another Array:
+        With no argument and no block, returns the element in self having the maximum value; None if self is empty.
+        With argument n and no block, returns a new Array with at most n elements, in descending order.
+        With a block given, the block is a comparator, see min.
 
         Parameters
         ----------
-        objects : Any
-            Elements to be Prepended to self.
+        n: Optional[int] = None
+            Number of maximum elements to return.
+        block: Optional[Callable[[Any, Any], int]] = None
+            Comparator used instead of <.
 
         Returns
         -------
-        Self
-            Returns self.
+        Any | Array
+            The maximum element, or an Array of the n maximum elements.
 
         Examples
         --------
-        >>> a =  Array(['foo', 'bar', 2])
-        >>> a.unshift('bam', 'bat', [1, 2])
-        ['bam', 'bat', [1, 2], 'foo', 'bar', 2]
-        >>> a
-        ['bam', 'bat', [1, 2], 'foo', 'bar', 2]
+        >>> Array([0, 1, 2]).max()
+        2
+        >>> Array([0, 1, 2, 3]).max(3)
+        [3, 2, 1]
+        >>> Array([]).max() is None
+        True
         """
-        for value in reversed(objects):
-            self.insert(0, value)
+        keys = list(map(cmp_to_key(block), self)) if block else self
+        return self.__extreme(keys, n, largest=True)
 
-        return self
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-minmax
+    def minmax(self, *, block: Optional[Callable[[Any, Any], int]] = None) -> Array:
+        """
+        Returns a new 2-element Array containing the minimum and maximum values from self.
 
-    # unshift, prepend: Prepends leading elements.
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-prepend
-    # ==> [alias]
-    prepend = unshift
+        With a block given, the block is a comparator, see min. Returns [None, None] if self is empty.
 
-    # insert: Inserts given objects at a given offset; does not replace elements.
-    # https://docs.ruby-lang.org/en/master/Array.html#method-i-insert
-    def insert(self, _index: SupportsIndex, _object: Any) -> Array:
+        Returns
+        -------
+        Array
+            [minimum, maximum]
+
+        Examples
+        --------
+        >>> Array([0, 1, 2]).minmax()
+        [0, 2]
+        >>> Array(['0', '00', '000']).minmax(block=lambda a, b: len(a) - len(b))
+        ['0', '000']
         """
-        Inserts given objects at a given offset; does not replace elements.
+        keys = list(map(cmp_to_key(block), self)) if block else self
+        return Array([self.__extreme(keys, None, largest=False), self.__extreme(keys, None, largest=True)])
 
-        Inserts given objects before or after the element at Integer index offset; returns self.
-        When index is non-negative, inserts all given objects before the element at offset index:
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-min_by
+    def min_by(self, n: Optional[int] = None, *, block: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Returns the element(s) for which the block returns the minimum value(s).
 
+        The block is called exactly once per element.
+        With no argument, returns the element with the minimum block value; None if self is empty.
+        With argument n, returns a new Array of at most n elements, in ascending order of block value.
+        With no block, returns a new Enumerator(Iterator).
 
         Parameters
         ----------
-        _index: int
-            The index in which the object should be inserted.
-        _object: Any
-            The object to be inserted.
+        n: Optional[int] = None
+            Number of elements to return.
+        block: Optional[Callable[[Any], Any]] = None
+            The function in which each element will be passed to compute its sort key.
 
         Returns
         -------
-        Self:
-            Returns self
+        Any | Array | Iterable
+            The element with the minimum block value, or an Array of n such elements.
 
         Examples
         --------
+        >>> Array(['abcd', 'a', 'ab']).min_by(block=len)
+        'a'
+        >>> Array(['abcd', 'a', 'ab']).min_by(2, block=len)
+        ['a', 'ab']
+        """
+        if block is None:
+            return iter(self)
+        return self.__extreme(list(map(block, self)), n, largest=False)
 
-
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-max_by
+    def max_by(self, n: Optional[int] = None, *, block: Optional[Callable[[Any], Any]] = None) -> Any:
         """
-        super().insert(_index, _object)
-        return self
+        Returns the element(s) for which the block returns the maximum value(s).
+
+        The block is called exactly once per element.
+        With argument n, returns a new Array of at most n elements, in descending order of block value.
+        See min_by.
+
+        Examples
+        --------
+        >>> Array(['abcd', 'a', 'ab']).max_by(block=len)
+        'abcd'
+        >>> Array(['abcd', 'a', 'ab']).max_by(2, block=len)
+        ['abcd', 'ab']
+        """
+        if block is None:
+            return iter(self)
+        return self.__extreme(list(map(block, self)), n, largest=True)
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-sort_by
+    def sort_by(self, *, block: Optional[Callable[[Any], Any]] = None) -> Array | Iterable:
+        """
+        Returns a new Array sorted by the values the block returns for each element.
+
+        The block is called exactly once per element, its results are cached and only they are compared.
+        The sort is stable. With no block, returns a new Enumerator(Iterator).
+
+        Parameters
+        ----------
+        block: Optional[Callable[[Any], Any]] = None
+            The function in which each element will be passed to compute its sort key.
+
+        Returns
+        -------
+        Array | Iterable
+            New sorted Array.
+
+        Examples
+        --------
+        >>> Array(['abcd', 'a', 'ab', 'b']).sort_by(block=len)
+        ['a', 'b', 'ab', 'abcd']
+        >>> Array([1, 'a']).sort_by(block=lambda x: x)
+        Traceback (most recent call last):
+        ...
+        TypeError: comparison of int with str failed
+        """
+        if block is None:
+            return iter(self)
+        keys = list(map(block, self))
+        try:
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+        except TypeError:
+            raise self.__comparison_error(keys) from None
+        return Array([self[i] for i in order])
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-uniq
+    def uniq(self, *, block: Optional[Callable[[Any], Any]] = None) -> Array:
+        """
+        Returns a new Array containing those elements from self that are not duplicates, the first occurrence always
+        being retained.
+
+        With no block given, identifies and omits duplicates using ==.
+        With a block given, calls the block for each element; identifies (using ==) and omits duplicate values,
+        that is, those elements for which the block returns the same value.
+        Runs in O(n) by hashing, unhashable lists and dicts are hashed through a canonical key.
+
+        Parameters
+        ----------
+        block: Optional[Callable[[Any], Any]] = None
+            The function in which each element will be passed to compute the value compared.
+
+        Returns
+        -------
+        Array
+            New Array without duplicates.
+
+        Examples
+        --------
+        >>> Array([0, 0, 1, 1, 2, 2]).uniq()
+        [0, 1, 2]
+        >>> Array(['a', 'aa', 'aaa', 'b', 'bb', 'bbb']).uniq(block=len)
+        ['a', 'aa', 'aaa']
+        >>> Array([[1], {"class": "Hash"}, [1], {"class": "Hash"}]).uniq()
+        [[1], {'class': 'Hash'}]
+        """
+        seen = _KeySet()
+        if block is None:
+            return Array([val for val in self if seen.add(val)])
+        return Array([val for val in self if seen.add(block(val))])
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-flatten
+    def flatten(self, depth: Optional[int] = None) -> Array:
+        """
+        Returns a new Array that is a recursive flattening of self.
+
+        Each nested list (or Array) is replaced by its elements, down to depth levels.
+        With no depth or a negative depth, flattens all levels. With depth 0, returns a copy of self.
+        Uses an explicit stack, so nesting is not limited by the recursion limit, and each leaf is copied once.
+
+        Parameters
+        ----------
+        depth: Optional[int] = None
+            Number of levels to flatten.
+
+        Returns
+        -------
+        Array
+            New flattened Array.
+
+        Raises
+        ------
+        ValueError
+            When flattening all levels of an Array that contains itself.
+
+        Examples
+        --------
+        >>> a = Array([0, [1, [2, 3], 4], 5])
+        >>> a.flatten()
+        [0, 1, 2, 3, 4, 5]
+        >>> a.flatten(1)
+        [0, 1, [2, 3], 4, 5]
+        >>> b = Array([0, 1])
+        >>> _ = b.push(b)
+        >>> b.flatten()
+        Traceback (most recent call last):
+        ...
+        ValueError: tried to flatten recursive array
+        """
+        return Array(self.each_flat(depth))
+
+    # Not part of Ruby, the streaming form of flatten.
+    def each_flat(self, depth: Optional[int] = None) -> Iterator:
+        """
+        Returns an Enumerator(Iterator) over the elements of self flattened down to depth levels, see flatten.
+
+        Elements are produced one at a time, without building the flattened Array.
+
+        Examples
+        --------
+        >>> flat = Array([0, [1, [2, 3], 4], 5]).each_flat()
+        >>> next(flat), next(flat), next(flat)
+        (0, 1, 2)
+        """
+        if depth is not None and depth < 0:
+            depth = None
+        # Recursion can only loop forever without a depth, which is when Ruby checks for it too.
+        check_recursion = depth is None
+
+        stack = [iter(self)]
+        # ids of the lists being flattened, outermost first, and the same ids as a set for lookups.
+        path = [id(self)]
+        on_path = {id(self)}
+        while stack:
+            for val in stack[-1]:
+                if isinstance(val, list) and (depth is None or len(stack) <= depth):
+                    if check_recursion and id(val) in on_path:
+                        raise ValueError("tried to flatten recursive array")
+                    stack.append(iter(val))
+                    path.append(id(val))
+                    on_path.add(id(val))
+                    break
+                yield val
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Combining
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Combining
+    # ---------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-difference
+    def difference(self, *other_arrays: Iterable) -> Array:
+        """
+        Returns a new Array containing only those elements from self that are not found in any of the other_arrays.
+
+        Items are compared using ==, order from self is preserved, duplicates in self are kept.
+        Runs in O(n + m) by hashing the other arrays.
+
+        Parameters
+        ----------
+        other_arrays: Iterable
+            Arrays whose elements are removed.
+
+        Returns
+        -------
+        Array
+            New Array.
+
+        Examples
+        --------
+        >>> Array([0, 1, 1, 2, 1, 1, 3, 1, 1]).difference(Array([1]))
+        [0, 2, 3]
+        >>> Array([0, 1, 2, 3]).difference([3, 0], [1, 3])
+        [2]
+        """
+        removed = _KeySet()
+        for other in other_arrays:
+            for val in other:
+                removed.add(val)
+        return Array([val for val in self if val not in removed])
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-intersection
+    def intersection(self, *other_arrays: Iterable) -> Array:
+        """
+        Returns a new Array containing each element found both in self and in all of the given other_arrays.
+
+        Duplicates are omitted, items are compared using ==, order from self is preserved.
+
+        Examples
+        --------
+        >>> Array([0, 1, 2, 3]).intersection([0, 1, 2], [0, 1, 3])
+        [0, 1]
+        >>> Array([0, 0, 1, 1, 2, 3]).intersection([1, 0])
+        [0, 1]
+        """
+        kept = self.uniq()
+        for other in other_arrays:
+            present = _KeySet(other)
+            kept = Array([val for val in kept if val in present])
+        return kept
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-union
+    def union(self, *other_arrays: Iterable) -> Array:
+        """
+        Returns a new Array that is the union of self and all given Arrays other_arrays.
+
+        Duplicates are removed, the first occurrence is kept, order is preserved.
+
+        Examples
+        --------
+        >>> Array([0, 1, 2, 3]).union([4, 5], [6, 7])
+        [0, 1, 2, 3, 4, 5, 6, 7]
+        >>> Array([0, 1, 1]).union([2, 1], [3, 1])
+        [0, 1, 2, 3]
+        """
+        seen = _KeySet()
+        merged = Array([val for val in self if seen.add(val)])
+        for other in other_arrays:
+            merged.extend(val for val in other if seen.add(val))
+        return merged
+
+    # intersect? RENAMED to intersect
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-intersect-3F
+    def intersect(self, other_array: Iterable) -> bool:
+        """
+        Returns true if the Array and other_array have at least one element in common, otherwise returns false.
+
+        Stops at the first common element.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).intersect([3, 4, 5])
+        True
+        >>> Array([1, 2, 3]).intersect([5, 6, 7])
+        False
+        """
+        present = _KeySet(other_array)
+        return any(val in present for val in self)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-7C
+    def __or__(self, other_array: Iterable) -> Array:
+        """
+        Returns the union of self and other_array, see union.
+
+        >>> Array([0, 1]) | Array([2, 0])
+        [0, 1, 2]
+        """
+        return self.union(other_array)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-26
+    def __and__(self, other_array: Iterable) -> Array:
+        """
+        Returns the intersection of self and other_array, see intersection.
+
+        >>> Array([0, 1, 2, 3]) & Array([1, 2])
+        [1, 2]
+        """
+        return self.intersection(other_array)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-2D
+    def __sub__(self, other_array: Iterable) -> Array:
+        """
+        Returns the difference of self and other_array, see difference.
+
+        >>> Array([0, 1, 1, 2]) - Array([1])
+        [0, 2]
+        """
+        return self.difference(other_array)
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Assigning
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Assigning
+    # ---------------------------------------------------------------------------------
+
+    # []= : Assigns specified elements with a given object.
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-5B-5D-3D
+    def __setitem__(self, key, value) -> None:
+        self.__modifying()
+        super().__setitem__(key, value)
+        self.__mutated()
+
+    def __delitem__(self, key) -> None:
+        self.__modifying()
+        super().__delitem__(key)
+        self.__mutated()
+
+    def __iadd__(self, other: Iterable) -> Array:
+        self.__modifying()
+        appended_from = len(self)
+        super().__iadd__(other)
+        self.__mutated(appended_from)
+        return self
+
+    def __imul__(self, n: int) -> Array:
+        self.__modifying()
+        super().__imul__(n)
+        self.__mutated()
+        return self
+
+    def extend(self, iterable: Iterable) -> None:
+        self.__modifying()
+        appended_from = len(self)
+        super().extend(iterable)
+        self.__mutated(appended_from)
+
+    # push, append, <<: Appends trailing elements.
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-push
+    def push(self, *objects: Any) -> Array:
+        """
+        Appends trailing elements. Also aliased as: append_multiple
+
+        Appends each argument in objects to self; returns self:
+        Appends each argument as one element, even if it is another Array:
+
+        Parameters
+        ----------
+        objects: Any
+            Elements to be appended to self.
+
+        Returns
+        -------
+        Self
+            Returns self.
+
+        Examples
+        --------
+        >>> a = Array(['foo', 'bar', 2])
+        >>> a.push('baz','bat')
+        ['foo', 'bar', 2, 'baz', 'bat']
+
+        >>> b = Array(['foo', 'bar', 2])
+        >>> c = b.append(['baz', 'bat'],Array(['bam', 'bad']))
+        >>> c
+        ['foo', 'bar', 2, ['baz', 'bat'], ['bam', 'bad']]
+        >>> b
+        ['foo', 'bar', 2, ['baz', 'bat'], ['bam', 'bad']]
+        """
+        self.extend(objects)
+        return self
+
+    # push, append, <<: Appends trailing elements.
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-append
+    # ==> [alias]
+    append = push
+
+    # unshift, prepend: Prepends leading elements.
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-unshift
+    def unshift(self, *objects: Any) -> Array:
+        """
+        Prepends the given objects to self: Also aliased as: prepend
+
+        Prepend (Inserts at beginning) each argument in objects to self; returns self:
+        Prepend each argument as one element, even if it is another Array:
+
+        Parameters
+        ----------
+        objects : Any
+            Elements to be Prepended to self.
+
+        Returns
+        -------
+        Self
+            Returns self.
+
+        Examples
+        --------
+        >>> a =  Array(['foo', 'bar', 2])
+        >>> a.unshift('bam', 'bat', [1, 2])
+        ['bam', 'bat', [1, 2], 'foo', 'bar', 2]
+        >>> a
+        ['bam', 'bat', [1, 2], 'foo', 'bar', 2]
+
+        Notes
+        -----
+        Existing elements are shifted right once for all the objects, not once per object.
+        Use DequeArray when elements are prepended or shifted repeatedly.
+        """
+        # Slice assignment moves the existing elements a single time.
+        self[0:0] = objects
+
+        return self
+
+    # unshift, prepend: Prepends leading elements.
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-prepend
+    # ==> [alias]
+    prepend = unshift
+
+    # insert: Inserts given objects at a given offset; does not replace elements.
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-insert
+    def insert(self, _index: SupportsIndex, _object: Any) -> Array:
+        """
+        Inserts given objects at a given offset; does not replace elements.
+
+        Inserts given objects before or after the element at Integer index offset; returns self.
+        When index is non-negative, inserts all given objects before the element at offset index:
+
+
+        Parameters
+        ----------
+        _index: int
+            The index in which the object should be inserted.
+        _object: Any
+            The object to be inserted.
+
+        Returns
+        -------
+        Self:
+            Returns self
+
+        Examples
+        --------
+
+
+        """
+        self.__modifying()
+        super().insert(_index, _object)
+        self.__mutated()
+        return self
+
+    # map!, collect! RENAMED to map_bang, collect_bang
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-map-21
+    def map_bang(self, *, block: Optional[Callable[[Any], Any]] = None) -> Array | Iterator:
+        """
+        Replaces each element with the value returned by the block for it, in place; returns self.
+        Also aliased as: collect_bang
+        With no block, returns a new Enumerator(Iterator).
+
+        Each element is overwritten in its slot as the block returns, no second list is built.
+
+        Parameters
+        ----------
+        block: Optional[Callable[[Any], Any]] = None
+            The function in which each element will be passed.
+
+        Returns
+        -------
+        Self | Iterator
+            Returns self.
+
+        Examples
+        --------
+        >>> a = Array([1, 2, 3])
+        >>> a.map_bang(block=lambda x: x * 10)
+        [10, 20, 30]
+        """
+        if block is None:
+            return iter(self)
+        self.__modifying()
+        try:
+            for position, val in enumerate(list.__iter__(self)):
+                list.__setitem__(self, position, block(val))
+        finally:
+            self.__mutated()
+        return self
+
+    # ==> [alias]
+    collect_bang = map_bang
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Deleting
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Deleting
+    # ---------------------------------------------------------------------------------
+
+    # Python list methods, overridden so that they keep the value index (see build_index) in sync
+    # and raise on frozen Arrays.
+    def pop(self, _index: SupportsIndex = -1) -> Any:
+        self.__modifying()
+        value = super().pop(_index)
+        self.__mutated()
+        return value
+
+    def remove(self, value: Any) -> None:
+        self.__modifying()
+        super().remove(value)
+        self.__mutated()
+
+    def clear(self) -> None:
+        self.__modifying()
+        super().clear()
+        self.__mutated()
+
+    def sort(self, *, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        self.__modifying()
+        super().sort(key=key, reverse=reverse)
+        self.__mutated()
+
+    def reverse(self) -> None:
+        self.__modifying()
+        super().reverse()
+        self.__mutated()
+
+    # flatten! RENAMED to flatten_bang
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-flatten-21
+    def flatten_bang(self, depth: Optional[int] = None) -> Optional[Array]:
+        """
+        Replaces each nested list in self with the elements from that list, see flatten; returns self
+        if any changes, None otherwise.
+
+        Examples
+        --------
+        >>> a = Array([0, [1, [2, 3], 4], 5])
+        >>> a.flatten_bang(1)
+        [0, 1, [2, 3], 4, 5]
+        >>> a.flatten_bang()
+        [0, 1, 2, 3, 4, 5]
+        >>> a.flatten_bang() is None
+        True
+        """
+        # Frozen Arrays raise even when nothing would change, like Ruby.
+        self.__modifying()
+        if depth == 0 or not any(isinstance(val, list) for val in self):
+            return None
+        self[:] = self.flatten(depth)
+        return self
+
+    # uniq! RENAMED to uniq_bang
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-uniq-21
+    def uniq_bang(self, *, block: Optional[Callable[[Any], Any]] = None) -> Optional[Array]:
+        """
+        Removes duplicate elements from self, the first occurrence always being retained; returns self
+        if any elements removed, None otherwise. See uniq.
+
+        Examples
+        --------
+        >>> a = Array([0, 0, 1, 1, 2, 2])
+        >>> a.uniq_bang()
+        [0, 1, 2]
+        >>> a.uniq_bang() is None
+        True
+        """
+        self.__modifying()
+        unique = self.uniq(block=block)
+        if len(unique) == len(self):
+            return None
+        self[:] = unique
+        return self
+
+    # Private Method
+    # Keeps the elements for which keep returns truthy, in order, in a single two pointer pass:
+    # kept elements are moved down over the dropped ones and the tail is truncated once.
+    # Returns whether any element was dropped. If keep raises, the elements not yet read are kept.
+    def __retain(self, keep: Callable[[Any], Any]) -> bool:
+        self.__modifying()
+        write = read = 0
+        try:
+            for val in list.__iter__(self):
+                if keep(val):
+                    if write != read:
+                        list.__setitem__(self, write, val)
+                    write += 1
+                read += 1
+        finally:
+            if write != read:
+                list.__delitem__(self, slice(write, read))
+                self.__mutated()
+        return write != read
+
+    # select!, filter! RENAMED to select_bang, filter_bang
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-select-21
+    def select_bang(self, *, block: Optional[Callable[[Any], Any]] = None) -> Optional[Array] | Iterator:
+        """
+        Keeps only the elements for which the block returns a truthy value, in place; returns self
+        if any elements removed, None otherwise. Also aliased as: filter_bang
+        With no block, returns a new Enumerator(Iterator).
+
+        The elements are compacted in a single pass without building a second list.
+
+        Parameters
+        ----------
+        block: Optional[Callable[[Any], Any]] = None
+            The function in which each element will be passed.
+
+        Returns
+        -------
+        Optional[Self] | Iterator
+            Returns self if any elements removed, None otherwise.
+
+        Examples
+        --------
+        >>> a = Array([1, 2, 3, 4, 5])
+        >>> a.select_bang(block=lambda x: x % 2)
+        [1, 3, 5]
+        >>> a.select_bang(block=lambda x: x % 2) is None
+        True
+        """
+        if block is None:
+            return iter(self)
+        return self if self.__retain(block) else None
+
+    # ==> [alias]
+    filter_bang = select_bang
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-keep_if
+    def keep_if(self, *, block: Optional[Callable[[Any], Any]] = None) -> Array | Iterator:
+        """
+        Same as select_bang, but always returns self.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).keep_if(block=lambda x: x > 5)
+        []
+        """
+        if block is None:
+            return iter(self)
+        self.__retain(block)
+        return self
+
+    # reject! RENAMED to reject_bang
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-reject-21
+    def reject_bang(self, *, block: Optional[Callable[[Any], Any]] = None) -> Optional[Array] | Iterator:
+        """
+        Removes the elements for which the block returns a truthy value, in place; returns self
+        if any elements removed, None otherwise. See select_bang.
+
+        Examples
+        --------
+        >>> a = Array(['foo', 'bar', 2, 'bat'])
+        >>> a.reject_bang(block=lambda x: isinstance(x, str))
+        [2]
+        >>> a.reject_bang(block=lambda x: isinstance(x, str)) is None
+        True
+        """
+        if block is None:
+            return iter(self)
+        return self if self.__retain(lambda val: not block(val)) else None
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-delete_if
+    def delete_if(self, *, block: Optional[Callable[[Any], Any]] = None) -> Array | Iterator:
+        """
+        Same as reject_bang, but always returns self.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).delete_if(block=lambda x: x > 5)
+        [1, 2, 3]
+        """
+        if block is None:
+            return iter(self)
+        self.__retain(lambda val: not block(val))
+        return self
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-delete
+    def delete(self, obj: Any, *, block: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Removes all the elements that are obj or == obj in a single pass; returns the last removed element.
+
+        When no element is removed, returns block(obj) if a block is given, None otherwise.
+
+        Parameters
+        ----------
+        obj: Any
+            The object whose equal elements are removed.
+        block: Optional[Callable[[Any], Any]] = None
+            Called with obj when no element is removed, its result is returned.
+
+        Returns
+        -------
+        Any
+            The last removed element, or the block result or None when nothing was removed.
+
+        Examples
+        --------
+        >>> a = Array(['bar', 'foo', 'baz', 'foo'])
+        >>> a.delete('foo'), a
+        ('foo', ['bar', 'baz'])
+        >>> a.delete('qux', block=lambda x: f'{x} not found')
+        'qux not found'
+        """
+        deleted = self._RLDefault(None)
+
+        def keep(val: Any) -> bool:
+            nonlocal deleted
+            # Identity first, like the containment check, so an element unequal to itself (NaN) is removed too.
+            if val is obj or val == obj:
+                deleted = val
+                return False
+            return True
+
+        self.__modifying()
+        # The containment check runs in C, nothing is rewritten when obj is absent.
+        if obj in self:
+            self.__retain(keep)
+        if isinstance(deleted, self._RLDefault):
+            return None if block is None else block(obj)
+        return deleted
+
+    # compact! RENAMED to compact_bang
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-compact-21
+    def compact_bang(self) -> Optional[Array]:
+        """
+        Removes all None elements in place; returns self if any elements removed, None otherwise.
+
+        Examples
+        --------
+        >>> a = Array([None, 0, None, False, ''])
+        >>> a.compact_bang()
+        [0, False, '']
+        >>> a.compact_bang() is None
+        True
+        """
+        self.__modifying()
+        # The containment check runs in C, and so does is_not(None, val), without a Python frame per element.
+        if None not in self:
+            return None
+        return self if self.__retain(partial(operator.is_not, None)) else None
+
+    # slice! RENAMED to slice_bang
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-slice-21
+    def slice_bang(self, start: Union[int, slice], length: Optional[int] = None) -> Any:
+        """
+        Removes and returns the elements selected by the arguments, with one move of the tail.
+
+        With an int start and no length, removes and returns the element at start, None if out of range.
+        With start and length, removes and returns an Array of at most length elements from start,
+        None if start is out of range or length is negative. With a slice, removes and returns an
+        Array of the elements it selects.
+
+        Parameters
+        ----------
+        start: int | slice
+            The index of the first removed element, or the slice of removed elements.
+        length: Optional[int] = None
+            The count of removed elements.
+
+        Returns
+        -------
+        Any
+            The removed element or Array of elements, or None.
+
+        Examples
+        --------
+        >>> a = Array(['foo', 'bar', 2, 'baz'])
+        >>> a.slice_bang(1), a
+        ('bar', ['foo', 2, 'baz'])
+        >>> a.slice_bang(-2, 2), a
+        ([2, 'baz'], ['foo'])
+        >>> a.slice_bang(3) is None, a.slice_bang(2, 1) is None, a.slice_bang(1, 1)
+        (True, True, [])
+        """
+        self.__modifying()
+        if isinstance(start, slice):
+            removed = Array(list.__getitem__(self, start))
+            if removed:
+                del self[start]
+            return removed
+        size = len(self)
+        if start < 0:
+            start += size
+        if length is None:
+            return self.pop(start) if 0 <= start < size else None
+        if not 0 <= start <= size or length < 0:
+            return None
+        removed = Array(list.__getitem__(self, slice(start, start + length)))
+        if removed:
+            del self[start:start + length]
+        return removed
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Grouping
+    #   https://ruby-doc.org/3.1.3/Enumerable.html
+    # ---------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-group_by
+    def group_by(self, *, block: Optional[Callable[[Any], Any]] = None) -> Hash | Iterable:
+        """
+        Groups the elements by the value the block returns for them.
+
+        Returns a Hash whose keys are the block results and whose values are Arrays of the elements
+        having that result, in the order of self. Single pass, the block is called once per element.
+        An unhashable block result, such as a list, is keyed by a frozen copy equal to it.
+        With no block, returns a new Enumerator(Iterator).
+
+        Parameters
+        ----------
+        block: Optional[Callable[[Any], Any]] = None
+            The function in which each element will be passed to compute its group.
+
+        Returns
+        -------
+        Hash | Iterable
+            Groups keyed by block result.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 4, 5]).group_by(block=lambda x: x % 2)
+        {1: [1, 3, 5], 0: [2, 4]}
+        """
+        from .ruby_hash import Hash
+
+        if block is None:
+            return iter(self)
+        groups: Hash = Hash()
+        for val in self:
+            key = block(val)
+            try:
+                group = groups.get(key)
+            except TypeError:
+                # An unhashable key is stored as an equal hashable copy of its first occurrence.
+                key = _frozen_key(key)
+                group = groups.get(key)
+            if group is None:
+                groups[key] = group = Array([])
+            group.append(val)
+        return groups
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-tally
+    def tally(self) -> Hash:
+        """
+        Returns a Hash of the count of each element, keys in order of first occurrence.
+
+        Unhashable elements, such as nested lists, are keyed by a frozen copy equal to them.
+
+        Examples
+        --------
+        >>> Array(['a', 'b', 'a', 'c', 'a']).tally()
+        {'a': 3, 'b': 1, 'c': 1}
+        >>> Array([[1], [2], [1]]).tally()
+        {[1]: 2, [2]: 1}
+        """
+        from .ruby_hash import Hash
+
+        # Counter counts in C.
+        try:
+            return Hash(Counter(self))
+        except TypeError:
+            # Unhashable elements are counted under an equal hashable copy of their first occurrence.
+            return Hash(Counter(map(_frozen_key, self)))
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-partition
+    def partition(self, *, block: Optional[Callable[[Any], Any]] = None) -> Array | Iterable:
+        """
+        Returns an Array of two Arrays, the elements for which the block is truthy, then the others.
+
+        Single pass, the block is called once per element. With no block, returns a new Enumerator(Iterator).
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 4, 5]).partition(block=lambda x: x % 2)
+        [[1, 3, 5], [2, 4]]
+        """
+        if block is None:
+            return iter(self)
+        selected, rejected = Array([]), Array([])
+        keep, drop = selected.append, rejected.append
+        for val in self:
+            if block(val):
+                keep(val)
+            else:
+                drop(val)
+        return Array([selected, rejected])
+
+    # Private Method
+    # Shared by chunk_while and slice_when, starts a new chunk where block(previous, current) is `split_on`.
+    def __chunks(self, block: Callable[[Any, Any], Any], split_on: bool) -> Iterator[Array]:
+        if not self:
+            return
+        chunk = Array([self[0]])
+        previous = self[0]
+        for val in islice(self, 1, None):
+            if bool(block(previous, val)) is split_on:
+                yield chunk
+                chunk = Array([])
+            chunk.append(val)
+            previous = val
+        yield chunk
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-chunk_while
+    def chunk_while(self, *, block: Callable[[Any, Any], Any]) -> Iterator[Array]:
+        """
+        Returns an Enumerator(Iterator) of Arrays, splitting self between consecutive elements for which
+        the block returns a falsy value.
+
+        The block is called with each pair of consecutive elements. Chunks are produced one at a time.
+
+        Examples
+        --------
+        >>> list(Array([1, 2, 4, 9, 10, 11, 12, 15]).chunk_while(block=lambda a, b: b == a + 1))
+        [[1, 2], [4], [9, 10, 11, 12], [15]]
+        """
+        return self.__chunks(block, split_on=False)
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-slice_when
+    def slice_when(self, *, block: Callable[[Any, Any], Any]) -> Iterator[Array]:
+        """
+        Returns an Enumerator(Iterator) of Arrays, splitting self between consecutive elements for which
+        the block returns a truthy value.
+
+        Examples
+        --------
+        >>> list(Array([1, 2, 4, 9, 10, 11, 12, 15]).slice_when(block=lambda a, b: b != a + 1))
+        [[1, 2], [4], [9, 10, 11, 12], [15]]
+        """
+        return self.__chunks(block, split_on=True)
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Iterating
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Iterating
+    # ---------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-each_slice
+    def each_slice(self, n: int, *, block: Optional[Callable[[Array], Any]] = None) -> Array | Iterator[Array]:
+        """
+        Calls the block with each successive disjoint n-element slice; returns self.
+
+        The last slice has fewer than n elements when len(self) is not a multiple of n.
+        With no block, returns an Enumerator(Iterator) creating the slices one at a time.
+
+        Parameters
+        ----------
+        n: int
+            Slice size.
+        block: Optional[Callable[[Array], Any]] = None
+            The function in which each slice will be passed.
+
+        Returns
+        -------
+        Self | Iterator[Array]
+            Returns self, or the iterator when no block is given.
+
+        Examples
+        --------
+        >>> list(Array([1, 2, 3, 4, 5]).each_slice(2))
+        [[1, 2], [3, 4], [5]]
+        >>> _ = Array([1, 2, 3]).each_slice(2, block=print)
+        [1, 2]
+        [3]
+        """
+        if n < 1:
+            raise ValueError("invalid slice size")
+        values = iter(self)
+        # Each slice is filled straight from the iterator, without an intermediate list.
+        slices = (Array(islice(values, n)) for _ in range(0, len(self), n))
+        if block is None:
+            return slices
+        for piece in slices:
+            block(piece)
+        return self
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-each_cons
+    def each_cons(self, n: int, *, block: Optional[Callable[[Array], Any]] = None) -> Array | Iterator[Array]:
+        """
+        Calls the block with each successive overlapping n-element window; returns self.
+
+        There are len(self) - n + 1 windows, none when n > len(self).
+        With no block, returns an Enumerator(Iterator) creating the windows one at a time.
+
+        Parameters
+        ----------
+        n: int
+            Window size.
+        block: Optional[Callable[[Array], Any]] = None
+            The function in which each window will be passed.
+
+        Returns
+        -------
+        Self | Iterator[Array]
+            Returns self, or the iterator when no block is given.
+
+        Examples
+        --------
+        >>> list(Array([1, 2, 3, 4]).each_cons(3))
+        [[1, 2, 3], [2, 3, 4]]
+        """
+        if n < 1:
+            raise ValueError("invalid size")
+        windows = self.__windows(n)
+        if block is None:
+            return windows
+        for window in windows:
+            block(window)
+        return self
+
+    # Private Method
+    # Windows of each_cons, each copied once into a new Array from a deque sliding over self.
+    def __windows(self, n: int) -> Iterator[Array]:
+        values = iter(self)
+        window = deque(islice(values, n - 1), maxlen=n)
+        for val in values:
+            window.append(val)
+            yield Array(window)
+
+    # Private Method
+    # Shared by the combinatorics methods: calls the block with each tuple and returns self,
+    # or returns an Enumerator over the tuples when there is no block.
+    def __combinatorics(self, factory: Callable[[], Iterator[tuple]], size: Callable[[], int],
+                        description: str, block: Optional[Callable[[tuple], Any]]) -> Array | Enumerator:
+        from .ruby_enumerator import Enumerator
+
+        if block is None:
+            return Enumerator(factory, size, description)
+        for values in factory():
+            block(values)
+        return self
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-product
+    def product(self, *other_arrays: Iterable, block: Optional[Callable[[tuple], Any]] = None) -> Array | Enumerator:
+        """
+        Computes all combinations of elements from all the Arrays, including both self and other_arrays.
+
+        With a block given, calls the block with each combination (as a tuple); returns self.
+        With no block, returns an Enumerator producing the combinations one at a time, whose size is
+        computed without producing them. Call to_a on it to get them all as an Array.
+        Unlike Ruby, which returns an Array, nothing is materialized without a block.
+
+        Parameters
+        ----------
+        other_arrays: Iterable
+            Arrays combined with self.
+        block: Optional[Callable[[tuple], Any]] = None
+            The function in which each combination will be passed.
+
+        Returns
+        -------
+        Self | Enumerator
+            Returns self with a block, an Enumerator otherwise.
+
+        Examples
+        --------
+        >>> Array([0, 1]).product([2, 3]).to_a()
+        [(0, 2), (0, 3), (1, 2), (1, 3)]
+        >>> Array([0, 1]).product([2, 3], [4, 5]).size()
+        8
+        """
+        others = [list(other) for other in other_arrays]
+        return self.__combinatorics(
+            lambda: product(self, *others),
+            lambda: math.prod(map(len, others), start=len(self)),
+            "product", block,
+        )
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-combination
+    def combination(self, n: int, *, block: Optional[Callable[[tuple], Any]] = None) -> Array | Enumerator:
+        """
+        Calls the block with combinations of n elements of self; returns self. See product for no block.
+
+        Each combination is a tuple, in the order of self; no combination is repeated.
+
+        Examples
+        --------
+        >>> Array([0, 1, 2]).combination(2).to_a()
+        [(0, 1), (0, 2), (1, 2)]
+        >>> Array(range(100)).combination(50).size()
+        100891344545564193334812497256
+        """
+        return self.__combinatorics(
+            lambda: combinations(self, n) if n >= 0 else iter(()),
+            lambda: math.comb(len(self), n) if n >= 0 else 0,
+            f"combination({n})", block,
+        )
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-permutation
+    def permutation(self, n: Optional[int] = None, *,
+                    block: Optional[Callable[[tuple], Any]] = None) -> Array | Enumerator:
+        """
+        Calls the block with permutations of n elements of self (all elements by default); returns self.
+        See product for no block.
+
+        Examples
+        --------
+        >>> Array([0, 1, 2]).permutation(2).to_a()
+        [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)]
+        >>> Array([0, 1, 2]).permutation().size()
+        6
+        """
+        return self.__combinatorics(
+            lambda: permutations(self, n) if n is None or n >= 0 else iter(()),
+            lambda: math.perm(len(self), n) if n is None or n >= 0 else 0,
+            f"permutation({'' if n is None else n})", block,
+        )
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-repeated_combination
+    def repeated_combination(self, n: int, *,
+                             block: Optional[Callable[[tuple], Any]] = None) -> Array | Enumerator:
+        """
+        Calls the block with combinations of n elements of self, elements may be repeated; returns self.
+        See product for no block.
+
+        Examples
+        --------
+        >>> Array([0, 1, 2]).repeated_combination(2).to_a()
+        [(0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2)]
+        """
+        def size() -> int:
+            if n < 0:
+                return 0
+            if n == 0:
+                return 1
+            return math.comb(len(self) + n - 1, n)
+
+        return self.__combinatorics(
+            lambda: combinations_with_replacement(self, n) if n >= 0 else iter(()),
+            size, f"repeated_combination({n})", block,
+        )
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-repeated_permutation
+    def repeated_permutation(self, n: int, *,
+                             block: Optional[Callable[[tuple], Any]] = None) -> Array | Enumerator:
+        """
+        Calls the block with permutations of n elements of self, elements may be repeated; returns self.
+        See product for no block.
+
+        Examples
+        --------
+        >>> Array([0, 1]).repeated_permutation(2).to_a()
+        [(0, 0), (0, 1), (1, 0), (1, 1)]
+        >>> Array(range(10)).repeated_permutation(30).size()
+        1000000000000000000000000000000
+        """
+        return self.__combinatorics(
+            lambda: product(self, repeat=n) if n >= 0 else iter(()),
+            lambda: len(self) ** n if n >= 0 else 0,
+            f"repeated_permutation({n})", block,
+        )
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-lazy
+    def lazy(self) -> Lazy:
+        """
+        Returns a lazy enumerator over self.
+
+        Methods chained on the lazy enumerator (map, select, reject, take_while, drop_while, take,
+        flat_map, uniq, with_index) are fused into one generator pipeline, evaluated only when
+        first, to_a / force or iteration asks for values.
+
+        Returns
+        -------
+        Lazy
+            Lazy enumerator whose source is self.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 4, 5]).lazy().map(block=lambda x: x * 2).select(block=lambda x: x > 4).first(2)
+        [6, 8]
+        """
+        from .ruby_lazy import Lazy
+
+        return Lazy(self)
+
+    # Not part of Ruby, runs blocks on a pool of workers.
+    def parallel(self, workers: Optional[int] = None, *,
+                 executor: Optional[Executor] = None,
+                 threads: bool = False,
+                 chunk_size: Optional[int] = None) -> Parallel:
+        """
+        Returns a proxy evaluating blocks on a pool of workers.
+
+        all, any, none, one, count, index, map, select and reject on the proxy split self into chunks and
+        run the block on a ProcessPoolExecutor, or a ThreadPoolExecutor with threads=True.
+        Results keep the order of self, and any, all, none, one and index cancel pending chunks once
+        the answer is known.
+
+        Parameters
+        ----------
+        workers: Optional[int] = None
+            Number of workers, defaults to os.cpu_count().
+        executor: Optional[Executor] = None
+            Existing executor to run the chunks on, it is not shut down by the proxy.
+        threads: bool = False
+            Use threads instead of processes, for I/O bound blocks.
+        chunk_size: Optional[int] = None
+            Elements per chunk, defaults to a quarter of an even share per worker.
+
+        Returns
+        -------
+        Parallel
+            Proxy running block methods in parallel over self.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 4]).parallel(2, threads=True).count(block=lambda x: x > 2)
+        2
+        """
+        from .ruby_parallel import Parallel
+
+        return Parallel(self, workers, executor=executor, threads=threads, chunk_size=chunk_size)
+
+    # ---------------------------------------------------------------------------------
+    #   Async Methods
+    #   Not part of Ruby, block taking methods awaiting coroutine blocks concurrently.
+    # ---------------------------------------------------------------------------------
+
+    # Private Method
+    # Shared checks of the async methods. Returns True when the call can be answered without awaiting.
+    def __sync_answer(self, obj: Any, block: Optional[Callable[[Any], Any]], limit: int) -> bool:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        if self.__is_passed_args(obj) and block:
+            warnings.warn("Both argument and block is given. block will be ignored")
+        return self.__is_passed_args(obj) or block is None
+
+    # Async counterpart of all?
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-all-3F
+    async def async_all(self, obj: Optional[Any] = _RLDefault(None), *,
+                        block: Optional[Callable[[Any], Any]] = None,
+                        limit: int = 16) -> bool:
+        """
+        Returns whether all elements meet a given criterion, awaiting coroutine blocks concurrently.
+
+        At most limit blocks are awaited at the same time. Outstanding blocks are cancelled at the
+        first falsy result. Without a block, behaves as all.
+
+        Parameters
+        ----------
+        obj: Optional[Any] = None
+            The object to be compared with all elements.
+        block: Optional[Callable[[Any], Any]]
+            Coroutine function (or function) in which each element will be passed.
+        limit: int = 16
+            Maximum number of blocks awaited at the same time.
+
+        Returns
+        -------
+        bool
+            Returns true if all elements of self meet a given criterion.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> async def positive(value):
+        ...     await asyncio.sleep(0)
+        ...     return value > 0
+        ...
+        >>> asyncio.run(Array([1, 2, 3]).async_all(block=positive))
+        True
+        """
+        if self.__sync_answer(obj, block, limit):
+            return self.all(obj)
+        from .ruby_async import async_exists
+
+        return not await async_exists(self, block, limit, truthy=False)
+
+    # Async counterpart of any?
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-any-3F
+    async def async_any(self, obj: Optional[Any] = _RLDefault(None), *,
+                        block: Optional[Callable[[Any], Any]] = None,
+                        limit: int = 16) -> bool:
+        """
+        Returns whether any element meets a given criterion, awaiting coroutine blocks concurrently.
+
+        Outstanding blocks are cancelled at the first truthy result. See async_all.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> async def cached(value):
+        ...     await asyncio.sleep(0)
+        ...     return value == 'hit'
+        ...
+        >>> asyncio.run(Array(['miss', 'hit', 'miss']).async_any(block=cached, limit=2))
+        True
+        """
+        if self.__sync_answer(obj, block, limit):
+            return self.any(obj)
+        from .ruby_async import async_exists
+
+        return await async_exists(self, block, limit, truthy=True)
+
+    # Async counterpart of none?
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-none-3F
+    async def async_none(self, obj: Optional[Any] = _RLDefault(None), *,
+                         block: Optional[Callable[[Any], Any]] = None,
+                         limit: int = 16) -> bool:
+        """
+        Returns whether no element meets a given criterion, awaiting coroutine blocks concurrently.
+
+        Outstanding blocks are cancelled at the first truthy result. See async_all.
+        """
+        return not await self.async_any(obj, block=block, limit=limit)
+
+    # Async counterpart of one?
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-one-3F
+    async def async_one(self, obj: Optional[Any] = _RLDefault(None), *,
+                        block: Optional[Callable[[Any], Any]] = None,
+                        limit: int = 16) -> bool:
+        """
+        Returns whether exactly one element meets a given criterion, awaiting coroutine blocks concurrently.
+
+        Outstanding blocks are cancelled at the second truthy result. See async_all.
+        """
+        if self.__sync_answer(obj, block, limit):
+            return self.one(obj)
+        from .ruby_async import async_count
+
+        return await async_count(self, block, limit, stop_at=2) == 1
+
+    # Async counterpart of count
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-count
+    async def async_count(self, obj: Optional[Any] = _RLDefault(None), *,
+                          block: Optional[Callable[[Any], Any]] = None,
+                          limit: int = 16) -> int:
+        """
+        Returns the count of elements that meet a given criterion, awaiting coroutine blocks concurrently.
+
+        See async_all.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> async def large(value):
+        ...     return value > 1
+        ...
+        >>> asyncio.run(Array([0, 1, 2, 3]).async_count(block=large))
+        2
+        """
+        if self.__sync_answer(obj, block, limit):
+            return self.count(obj)
+        from .ruby_async import async_count
+
+        return await async_count(self, block, limit)
+
+    # Async counterpart of index
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-index
+    async def async_index(self, obj: Optional[Any] = _RLDefault(None), *,
+                          block: Optional[Callable[[Any], Any]] = None,
+                          limit: int = 16) -> int | None | Iterable:
+        """
+        Returns the index of the first element that meets a given criterion, awaiting coroutine blocks
+        concurrently. Also aliased as: async_find_index
+
+        Blocks finish out of order, the result is still the first index in the order of self.
+        Outstanding blocks are cancelled once a truthy result has no unfinished block before it.
+        See async_all.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> async def is_bar(value):
+        ...     return value == 'bar'
+        ...
+        >>> asyncio.run(Array(['foo', 'bar', 2, 'bar']).async_index(block=is_bar))
+        1
+        """
+        if self.__sync_answer(obj, block, limit):
+            return self.index(obj)
+        from .ruby_async import async_index
+
+        return await async_index(self, block, limit)
+
+    # ==> [alias]
+    async_find_index = async_index
+
+    # Async counterpart of map
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-map
+    async def async_map(self, *, block: Callable[[Any], Any], limit: int = 16) -> Array:
+        """
+        Returns a new Array of the block results in the order of self, awaiting coroutine blocks
+        concurrently. Also aliased as: async_collect
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> async def double(value):
+        ...     return value * 2
+        ...
+        >>> asyncio.run(Array([1, 2, 3]).async_map(block=double))
+        [2, 4, 6]
+        """
+        from .ruby_async import async_results
+
+        return Array(await async_results(self, block, limit))
+
+    # ==> [alias]
+    async_collect = async_map
+
+    # Async counterpart of select
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-select
+    async def async_select(self, *, block: Callable[[Any], Any], limit: int = 16) -> Array:
+        """
+        Returns a new Array of the elements for which the block is truthy, awaiting coroutine blocks
+        concurrently. Also aliased as: async_filter
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> async def even(value):
+        ...     return value % 2 == 0
+        ...
+        >>> asyncio.run(Array([1, 2, 3, 4]).async_select(block=even))
+        [2, 4]
+        """
+        from .ruby_async import async_results
+
+        keep = await async_results(self, block, limit)
+        return Array([val for val, truthy in zip(self, keep) if truthy])
+
+    # ==> [alias]
+    async_filter = async_select
+
+    # Async counterpart of reject
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-reject
+    async def async_reject(self, *, block: Callable[[Any], Any], limit: int = 16) -> Array:
+        """
+        Returns a new Array of the elements for which the block is falsy, awaiting coroutine blocks
+        concurrently.
+        """
+        from .ruby_async import async_results
+
+        drop = await async_results(self, block, limit)
+        return Array([val for val, falsy in zip(self, drop) if not falsy])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,127 @@
+from __future__ import annotations
+from typing import List, Set, Optional, Any, Callable, Iterable
+
+import asyncio
+import inspect
+
+"""
+Async block evaluation for Array.
+
+Backs Array.async_all, async_any, async_none, async_one, async_count, async_index, async_map,
+async_select and async_reject. Blocks may be coroutine functions (or plain functions). At most
+`limit` blocks are awaited at the same time, by `limit` workers pulling elements from a shared
+iterator, so memory stays O(limit) whatever the size of the Array. As soon as the answer is known
+the outstanding blocks are cancelled.
+"""
+
+# decide(position, result, pending) returns True once the answer is known.
+# pending holds the positions whose block is still being awaited.
+_Decide = Callable[[int, Any, Set[int]], bool]
+
+
+class _Decided(Exception):
+    """
+    Raised by a worker to stop the other workers once the answer is known.
+    """
+
+
+async def _evaluate(values: Iterable, block: Callable[[Any], Any], limit: int, decide: _Decide) -> None:
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    elements = enumerate(values)
+    pending: Set[int] = set()
+
+    async def worker() -> None:
+        # The iterator is shared, each element is taken by exactly one worker.
+        for position, val in elements:
+            pending.add(position)
+            result = block(val)
+            if inspect.isawaitable(result):
+                result = await result
+            pending.discard(position)
+            if decide(position, result, pending):
+                raise _Decided
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(limit)]
+    try:
+        await asyncio.gather(*workers)
+    except _Decided:
+        pass
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def async_exists(values: Iterable, block: Callable[[Any], Any], limit: int, truthy: bool) -> bool:
+    """
+    Returns True as soon as one block result has the truthiness `truthy`, cancelling the other blocks.
+    """
+    found = False
+
+    def decide(position: int, result: Any, pending: Set[int]) -> bool:
+        nonlocal found
+        if bool(result) is truthy:
+            found = True
+        return found
+
+    await _evaluate(values, block, limit, decide)
+    return found
+
+
+async def async_count(values: Iterable, block: Callable[[Any], Any], limit: int,
+                      stop_at: Optional[int] = None) -> int:
+    """
+    Counts truthy block results, stopping early once stop_at results are truthy.
+    """
+    truthy_count = 0
+
+    def decide(position: int, result: Any, pending: Set[int]) -> bool:
+        nonlocal truthy_count
+        if result:
+            truthy_count += 1
+        return stop_at is not None and truthy_count >= stop_at
+
+    await _evaluate(values, block, limit, decide)
+    return truthy_count
+
+
+async def async_index(values: Iterable, block: Callable[[Any], Any], limit: int) -> Optional[int]:
+    """
+    Returns the position of the first truthy block result in the order of values.
+
+    Blocks finish out of order, so a hit is only final once every earlier position has finished.
+    """
+    first: Optional[int] = None
+
+    def decide(position: int, result: Any, pending: Set[int]) -> bool:
+        nonlocal first
+        if result and (first is None or position < first):
+            first = position
+        return first is not None and all(waiting > first for waiting in pending)
+
+    await _evaluate(values, block, limit, decide)
+    return first
+
+
+async def async_results(values: Iterable, block: Callable[[Any], Any], limit: int) -> List[Any]:
+    """
+    Returns every block result, in the order of values.
+    """
+    results = {}
+
+    def decide(position: int, result: Any, pending: Set[int]) -> bool:
+        results[position] = result
+        return False
+
+    await _evaluate(values, block, limit, decide)
+    return [results[position] for position in range(len(results))]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
@@ -0,0 +1,438 @@
+from __future__ import annotations
+from typing import Optional, Any, Callable, Iterable, Iterator, SupportsIndex
+from collections import deque
+from itertools import islice
+
+import warnings
+
+from .ruby_array import Array
+
+"""
+Deque backed sibling of Array, for Arrays used as work queues.
+
+Prepending, shifting and popping from both ends are amortized O(1) instead of
+moving every element of a list.
+"""
+
+_RLDefault = Array._RLDefault
+
+
+class DequeArray(deque):
+    """
+    Ruby Array backed by collections.deque.
+
+    Offers the same Ruby API as Array, with O(1) push, unshift, prepend, shift and pop at both ends.
+    Indexing near the ends is O(1), indexing in the middle is O(n).
+    https://ruby-doc.org/3.1.3/Array.html
+    """
+
+    def __init__(self, value: Iterable = ()) -> None:
+        super().__init__(value)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return type(self)(islice(self, start, max(start, stop)))
+            return type(self)(list(self)[key])
+        return super().__getitem__(key)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def to_a(self) -> Array:
+        """
+        Returns a list backed Array with the elements of self.
+
+        Returns
+        -------
+        Array
+            New Array containing the elements of self.
+
+        Examples
+        --------
+        >>> DequeArray([1, 2, 3]).to_a()
+        [1, 2, 3]
+        """
+        return Array(self)
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Querying.
+    # https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Querying
+    # -----------------------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-length
+    def length(self) -> int:
+        """
+        The length or size of the Array. Also aliased as: size
+
+        Examples
+        --------
+        >>> DequeArray([1, None, 'a']).length()
+        3
+        """
+        return len(self)
+
+    # ==> [alias]
+    size = length
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-include-3F
+    def include(self, item: object) -> bool:
+        """
+        Returns whether any element == a given object.
+
+        Examples
+        --------
+        >>> DequeArray(['cat', 99]).include(99)
+        True
+        """
+        return item in self
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-empty-3F
+    def empty(self) -> bool:
+        """
+        Returns whether there are no elements.
+
+        Examples
+        --------
+        >>> DequeArray([]).empty()
+        True
+        """
+        return not bool(self)
+
+    # Private Method
+    # Lazily yields the values tested by all?, any?, none?, one? and count, same rules as Array.
+    def __predicate_values(self, obj: Any, block: Optional[Callable[[Any], Any]]) -> Iterator:
+        if isinstance(obj, _RLDefault):
+            return iter(self) if block is None else (block(val) for val in self)
+        if block:
+            warnings.warn("Both argument and block is given. block will be ignored")
+        return (val == obj for val in self)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-all-3F
+    def all(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether all elements meet a given criterion. See Array.all
+
+        Examples
+        --------
+        >>> DequeArray([1, 1]).all(1)
+        True
+        """
+        return all(self.__predicate_values(obj, block))
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-any-3F
+    def any(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether any element meets a given criterion. See Array.any
+
+        Examples
+        --------
+        >>> DequeArray([0, None, 5]).any()
+        True
+        """
+        return any(self.__predicate_values(obj, block))
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-none-3F
+    def none(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether no element meets a given criterion. See Array.none
+
+        Examples
+        --------
+        >>> DequeArray([1, 2]).none(block=lambda x: x > 5)
+        True
+        """
+        return not any(self.__predicate_values(obj, block))
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-one-3F
+    def one(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether exactly one element meets a given criterion. See Array.one
+
+        Examples
+        --------
+        >>> DequeArray([0, None, True]).one()
+        True
+        """
+        truthy_values = filter(None, self.__predicate_values(obj, block))
+        return next(truthy_values, False) is not False and next(truthy_values, False) is False
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-count
+    def count(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> int:
+        """
+        Returns the count of elements that meet a given criterion. See Array.count
+
+        Examples
+        --------
+        >>> DequeArray([0, 1, 2, 0.0]).count(0)
+        2
+        >>> DequeArray([0, 1, 2, 3]).count(block=lambda x: x > 1)
+        2
+        """
+        if isinstance(obj, _RLDefault) and block is None:
+            return len(self)
+        if not isinstance(obj, _RLDefault) and block is None:
+            return super().count(obj)
+        return sum(1 for val in self.__predicate_values(obj, block) if val)
+
+    # Private Method
+    # Walks self between start and stop in the given direction and returns the first matching index.
+    def __scan(self, obj: Any, block: Optional[Callable[[Any], Any]],
+               start: Optional[int], stop: Optional[int], reverse: bool) -> Optional[int]:
+        if not isinstance(obj, _RLDefault):
+            if block:
+                warnings.warn("Ignoring Block since both block and argument is passed.")
+            block = lambda val: val is obj or val == obj  # noqa: E731
+        length = len(self)
+        start, stop, _ = slice(start, stop).indices(length)
+        if start >= stop:
+            return None
+
+        # Iterating a deque is O(1) per step, random access in the middle is not.
+        if reverse:
+            for offset, val in enumerate(islice(reversed(self), length - stop, length - start), length - stop):
+                if block(val):
+                    return length - 1 - offset
+        else:
+            for position, val in enumerate(islice(self, start, stop), start):
+                if block(val):
+                    return position
+        return None
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-index
+    def index(self, obj: Optional[Any] = _RLDefault(None), *,
+              block: Optional[Callable[[Any], Any]] = None,
+              start: Optional[int] = None,
+              stop: Optional[int] = None) -> int | None | Iterable:
+        """
+        Returns the index of the first element that meets a given criterion. See Array.index
+
+        Examples
+        --------
+        >>> DequeArray(['foo', 'bar', 2, 'bar']).index('bar')
+        1
+        >>> DequeArray(['foo', 'bar', 2, 'bar']).index(block=lambda x: x == 2)
+        2
+        """
+        if isinstance(obj, _RLDefault) and block is None:
+            return iter(self)
+        return self.__scan(obj, block, start, stop, reverse=False)
+
+    # ==> [alias]
+    find_index = index
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-rindex
+    def rindex(self, obj: Optional[Any] = _RLDefault(None), *,
+               block: Optional[Callable[[Any], Any]] = None,
+               start: Optional[int] = None,
+               stop: Optional[int] = None) -> int | None | Iterable:
+        """
+        Returns the index of the last element that meets a given criterion. See Array.rindex
+
+        Examples
+        --------
+        >>> DequeArray(['foo', 'bar', 2, 'bar']).rindex('bar')
+        3
+        """
+        if isinstance(obj, _RLDefault) and block is None:
+            return iter(self)
+        return self.__scan(obj, block, start, stop, reverse=True)
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Comparing
+    #   https://docs.ruby-lang.org/en/master/Array.html
+    # ---------------------------------------------------------------------------------
+
+    # Private Method
+    # Comparisons reuse the Array implementations, on lists holding the same elements.
+    @staticmethod
+    def __as_list(other: Any) -> Any:
+        return list(other) if isinstance(other, deque) else other
+
+    # <=> RENAMED to compare
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-3C-3D-3E
+    def compare(self, other_array: Any) -> Optional[int]:
+        """
+        Compares with another Array and returns -1, 0, 1 or None, see Array.compare.
+
+        Examples
+        --------
+        >>> DequeArray([0, 1, 2]).compare(DequeArray([0, 1, 3]))
+        -1
+        >>> DequeArray([0, 1, 2]).compare(Array([0, 1]))
+        1
+        """
+        return Array(self).compare(self.__as_list(other_array))
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-eql-3F
+    def eql(self, other_array: Any) -> bool:
+        """
+        Returns whether other_array has the same elements in the same order, see Array.eql.
+
+        Examples
+        --------
+        >>> DequeArray(['foo', 2]).eql(Array(['foo', 2]))
+        True
+        """
+        return Array(self).eql(self.__as_list(other_array))
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-hash
+    def hash(self) -> int:
+        """
+        Returns the integer hash value of the elements, the same as Array.hash for the same elements.
+
+        Examples
+        --------
+        >>> DequeArray([1, [2]]).hash() == Array([1, [2]]).hash()
+        True
+        """
+        return Array(self).hash()
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Assigning
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Assigning
+    # ---------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-push
+    def push(self, *objects: Any) -> DequeArray:
+        """
+        Appends trailing elements; returns self. Also aliased as: append
+
+        Examples
+        --------
+        >>> DequeArray(['foo']).push('baz', ['bat'])
+        ['foo', 'baz', ['bat']]
+        """
+        self.extend(objects)
+        return self
+
+    # ==> [alias]
+    append = push
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-unshift
+    def unshift(self, *objects: Any) -> DequeArray:
+        """
+        Prepends the given objects to self; returns self. Also aliased as: prepend
+
+        Each object is added to the left end in O(1), existing elements are not moved.
+
+        Examples
+        --------
+        >>> DequeArray(['foo', 'bar']).unshift('bam', [1, 2])
+        ['bam', [1, 2], 'foo', 'bar']
+        """
+        self.extendleft(reversed(objects))
+        return self
+
+    # ==> [alias]
+    prepend = unshift
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-insert
+    def insert(self, _index: SupportsIndex, _object: Any) -> DequeArray:
+        """
+        Inserts the object before the element at _index; returns self.
+
+        Examples
+        --------
+        >>> DequeArray(['foo', 'bar']).insert(1, 'baz')
+        ['foo', 'baz', 'bar']
+        """
+        super().insert(_index, _object)
+        return self
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Deleting
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Deleting
+    # ---------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-shift
+    def shift(self, n: Optional[int] = None) -> Any:
+        """
+        Removes and returns leading elements.
+
+        With no argument, removes and returns the first element, None if self is empty.
+        With integer n, removes and returns the first n elements as a new DequeArray.
+
+        Examples
+        --------
+        >>> a = DequeArray(['foo', 'bar', 2])
+        >>> a.shift()
+        'foo'
+        >>> a.shift(5)
+        ['bar', 2]
+        >>> a.shift() is None
+        True
+        """
+        if n is None:
+            return self.popleft() if self else None
+        if n < 0:
+            raise ValueError("negative array size")
+        popleft = self.popleft
+        return type(self)(popleft() for _ in range(min(n, len(self))))
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-pop
+    def pop(self, n: Optional[int] = None) -> Any:
+        """
+        Removes and returns trailing elements.
+
+        With no argument, removes and returns the last element, None if self is empty.
+        With integer n, removes and returns the last n elements as a new DequeArray, in their original order.
+
+        Examples
+        --------
+        >>> a = DequeArray(['foo', 'bar', 2])
+        >>> a.pop()
+        2
+        >>> a.pop(5)
+        ['foo', 'bar']
+        """
+        if n is None:
+            return super().pop() if self else None
+        if n < 0:
+            raise ValueError("negative array size")
+        popped = type(self)()
+        pop = super().pop
+        for _ in range(min(n, len(self))):
+            popped.appendleft(pop())
+        return popped
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-rotate
+    def rotate(self, count: int = 1) -> DequeArray:
+        """
+        Returns a new DequeArray rotated so that the element at count is first.
+
+        The copy costs O(n). To rotate in O(min(k, n - k)) without copying, use rotate_bang.
+
+        Examples
+        --------
+        >>> DequeArray(['foo', 'bar', 2]).rotate()
+        ['bar', 2, 'foo']
+        >>> DequeArray(['foo', 'bar', 2]).rotate(-1)
+        [2, 'foo', 'bar']
+        """
+        return type(self)(self).rotate_bang(count)
+
+    # rotate! RENAMED to rotate_bang
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-rotate-21
+    def rotate_bang(self, count: int = 1) -> DequeArray:
+        """
+        Rotates self in place so that the element at count is first; returns self.
+
+        Examples
+        --------
+        >>> a = DequeArray(['foo', 'bar', 2])
+        >>> a.rotate_bang(2)
+        [2, 'foo', 'bar']
+        """
+        if self:
+            super().rotate(-(count % len(self)))
+        return self
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
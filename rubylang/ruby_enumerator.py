@@ -0,0 +1,99 @@
+from __future__ import annotations
+from typing import Optional, Any, Callable, Iterator, Union
+from itertools import islice
+
+from .ruby_array import Array
+from .ruby_lazy import Lazy
+
+"""
+Python Implementation of Ruby Enumerator
+https://ruby-doc.org/3.1.3/Enumerator.html
+
+An Enumerator produces its values on demand, each iteration starting afresh from the factory.
+Its size can be known without producing any value.
+"""
+
+
+class Enumerator:
+    """
+    Python Implementation of Ruby Enumerator
+    https://ruby-doc.org/3.1.3/Enumerator.html
+
+    Examples
+    --------
+    >>> enum = Array([1, 2, 3]).combination(2)
+    >>> enum.size()
+    3
+    >>> enum.to_a()
+    [(1, 2), (1, 3), (2, 3)]
+    """
+
+    def __init__(self, factory: Callable[[], Iterator], size: Union[int, Callable[[], Optional[int]], None] = None,
+                 description: str = "") -> None:
+        self._factory = factory
+        self._size = size
+        self._description = description
+
+    def __repr__(self) -> str:
+        return f"#<Enumerator: {self._description}>"
+
+    def __iter__(self) -> Iterator:
+        return self._factory()
+
+    # https://ruby-doc.org/3.1.3/Enumerator.html#method-i-size
+    def size(self) -> Optional[int]:
+        """
+        Returns the number of values, computed without producing them; None when it is not known.
+        """
+        return self._size() if callable(self._size) else self._size
+
+    # https://ruby-doc.org/3.1.3/Enumerator.html#method-i-each
+    def each(self, block: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Calls block with each value; returns self. With no block, returns self.
+        """
+        if block is not None:
+            for val in self:
+                block(val)
+        return self
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-first
+    def first(self, n: Optional[int] = None) -> Any:
+        """
+        Returns the first value, or an Array of the first n values. Only those values are produced.
+
+        Examples
+        --------
+        >>> Array(range(1000)).repeated_permutation(3).first(2)
+        [(0, 0, 0), (0, 0, 1)]
+        """
+        if n is None:
+            return next(iter(self), None)
+        if n < 0:
+            raise ValueError("attempt to take negative size")
+        return Array(islice(self, n))
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-to_a
+    def to_a(self) -> Array:
+        """
+        Produces every value and returns them as an Array. Also aliased as: force
+        """
+        return Array(self)
+
+    # ==> [alias]
+    force = to_a
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-lazy
+    def lazy(self) -> Lazy:
+        """
+        Returns a lazy enumerator over the values, see Array.lazy.
+        """
+        return Lazy(self)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
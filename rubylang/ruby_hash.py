@@ -0,0 +1,419 @@
+from __future__ import annotations
+from typing import Optional, Any, Callable, Iterable, NamedTuple
+from collections import OrderedDict
+
+import time
+
+from .ruby_array import Array
+
+"""
+Python Implementation of Ruby Hash
+https://ruby-doc.org/3.1.3/Hash.html
+
+Hash is a dict with Ruby's default value and default proc, so that the memoization idiom
+Hash.new { |h, k| h[k] = compute(k) } reads Hash.new(block=lambda h, k: h.store(k, compute(k))).
+Given max_size= or ttl=, the Hash is bounded: least recently used entries are evicted past
+max_size, entries expire ttl seconds after they are stored, and hits, misses and evictions are
+counted for monitoring, see Hash.cache_info.
+"""
+
+_RLDefault = Array._RLDefault
+
+
+class CacheInfo(NamedTuple):
+    """
+    Counters of a bounded Hash, see Hash.cache_info.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    max_size: Optional[int]
+    size: int
+
+
+class Hash(dict):
+    """
+    Python Implementation of Ruby Hash
+    https://ruby-doc.org/3.1.3/Hash.html
+
+    A missing key returns the default value, or the result of the default proc called with the Hash
+    and the key. A plain Hash looks keys up at dict speed; max_size= and ttl= make it a bounded cache.
+
+    Examples
+    --------
+    >>> squares = Hash.new(block=lambda h, k: h.store(k, k * k))
+    >>> squares[4], squares
+    (16, {4: 16})
+    >>> cache = Hash.new(block=lambda h, k: h.store(k, k * k), max_size=2)
+    >>> _ = cache[1], cache[2], cache[1], cache[3]
+    >>> cache, cache.cache_info()
+    ({1: 1, 3: 9}, CacheInfo(hits=1, misses=3, evictions=1, expirations=0, max_size=2, size=2))
+    """
+
+    def __new__(cls, *args: Any, max_size: Optional[int] = None, ttl: Optional[float] = None, **kwargs: Any) -> Hash:
+        # The bounded behaviour lives in a subclass, so that plain Hash lookups stay in C.
+        if cls is Hash and (max_size is not None or ttl is not None):
+            cls = _BoundedHash
+        return super().__new__(cls)
+
+    def __init__(self, value: Iterable = (), *, default: Any = None,
+                 block: Optional[Callable[[Hash, Any], Any]] = None,
+                 max_size: Optional[int] = None, ttl: Optional[float] = None,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        if max_size is not None or ttl is not None:
+            raise TypeError(f"max_size and ttl are not supported by {type(self).__name__}")
+        super().__init__(value)
+        self.__default = default
+        self.__default_proc = block
+
+    # https://ruby-doc.org/3.1.3/Hash.html#method-c-new
+    @classmethod
+    def new(cls, default: Any = None, *, block: Optional[Callable[[Hash, Any], Any]] = None,
+            max_size: Optional[int] = None, ttl: Optional[float] = None,
+            timer: Callable[[], float] = time.monotonic) -> Hash:
+        """
+        Returns a new empty Hash with the given default value or default proc.
+
+        Parameters
+        ----------
+        default: Any = None
+            Returned for missing keys when there is no block.
+        block: Optional[Callable[[Hash, Any], Any]] = None
+            The default proc, called with the Hash and the missing key; its result is returned.
+        max_size: Optional[int] = None
+            Maximum count of entries, the least recently used entry is evicted past it.
+        ttl: Optional[float] = None
+            Seconds after which a stored entry expires.
+        timer: Callable[[], float] = time.monotonic
+            The clock used for ttl.
+
+        Returns
+        -------
+        Hash
+            New empty Hash.
+
+        Examples
+        --------
+        >>> h = Hash.new(0)
+        >>> h['a'] += 1
+        >>> h['a'], h['b']
+        (1, 0)
+        """
+        return cls(default=default, block=block, max_size=max_size, ttl=ttl, timer=timer)
+
+    def __missing__(self, key: Any) -> Any:
+        if self.__default_proc is not None:
+            return self.__default_proc(self, key)
+        return self.__default
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Querying.
+    # -----------------------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/Hash.html#method-i-default
+    def default(self, key: Any = _RLDefault(None)) -> Any:
+        """
+        Returns the default value. Given a key, returns the default for that key, calling the default proc.
+
+        Examples
+        --------
+        >>> Hash.new('none').default()
+        'none'
+        >>> Hash.new(block=lambda h, k: k * 2).default(3)
+        6
+        """
+        if self.__default_proc is not None and not isinstance(key, _RLDefault):
+            return self.__default_proc(self, key)
+        return self.__default
+
+    # https://ruby-doc.org/3.1.3/Hash.html#method-i-default_proc
+    def default_proc(self) -> Optional[Callable[[Hash, Any], Any]]:
+        """
+        Returns the default proc, None if there is none.
+        """
+        return self.__default_proc
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Fetching.
+    # -----------------------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/Hash.html#method-i-fetch
+    def fetch(self, key: Any, default: Any = _RLDefault(None), *,
+              block: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Returns the value for key, ignoring the default value and default proc.
+
+        For a missing key, returns block(key) if a block is given, else default if it is given,
+        else raises KeyError.
+
+        Parameters
+        ----------
+        key: Any
+            The key to look up.
+        default: Any
+            Returned for a missing key when there is no block.
+        block: Optional[Callable[[Any], Any]] = None
+            Called with a missing key, its result is returned.
+
+        Returns
+        -------
+        Any
+            The value for key.
+
+        Raises
+        ------
+        KeyError
+            If key is missing and neither default nor block is given.
+
+        Examples
+        --------
+        >>> h = Hash({'a': 1})
+        >>> h.fetch('a'), h.fetch('b', 0), h.fetch('b', block=str.upper)
+        (1, 0, 'B')
+        """
+        if key in self:
+            return self[key]
+        if block is not None:
+            return block(key)
+        if not isinstance(default, _RLDefault):
+            return default
+        raise KeyError(f"key not found: {key!r}")
+
+    # https://ruby-doc.org/3.1.3/Hash.html#method-i-dig
+    def dig(self, key: Any, *identifiers: Any) -> Any:
+        """
+        Returns the object in nested Hashes, dicts, Arrays and lists selected by the key and identifiers.
+
+        The first lookup uses self[key], so the default applies. Returns None as soon as a step is None,
+        or an index is out of range.
+
+        Raises
+        ------
+        TypeError
+            If an intermediate object can't be dug into.
+
+        Examples
+        --------
+        >>> h = Hash({'foo': {'bar': [10, 11, 12]}})
+        >>> h.dig('foo', 'bar', 2), h.dig('foo', 'baz', 0), h.dig('foo', 'bar', 5)
+        (12, None, None)
+        """
+        obj = self[key]
+        for identifier in identifiers:
+            if obj is None:
+                return None
+            if isinstance(obj, Hash):
+                obj = obj[identifier]
+            elif isinstance(obj, dict):
+                obj = obj.get(identifier)
+            elif isinstance(obj, (list, tuple)):
+                obj = obj[identifier] if -len(obj) <= identifier < len(obj) else None
+            else:
+                raise TypeError(f"{type(obj).__name__} does not have #dig method")
+        return obj
+
+    # https://ruby-doc.org/3.1.3/Hash.html#method-i-store
+    def store(self, key: Any, value: Any) -> Any:
+        """
+        Associates value with key; returns value. The expression form of self[key] = value.
+
+        Examples
+        --------
+        >>> Hash().store('a', 1)
+        1
+        """
+        self[key] = value
+        return value
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Converting.
+    # -----------------------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/Hash.html#method-i-to_a
+    def to_a(self) -> Array:
+        """
+        Returns a new Array of the (key, value) pairs of self.
+
+        Examples
+        --------
+        >>> Hash({'a': 1, 'b': 2}).to_a()
+        [('a', 1), ('b', 2)]
+        """
+        return Array(self.items())
+
+    # https://ruby-doc.org/3.1.3/Hash.html#method-i-transform_values
+    def transform_values(self, *, block: Callable[[Any], Any]) -> Hash:
+        """
+        Returns a new Hash with the keys of self and the values returned by the block for each value.
+
+        Examples
+        --------
+        >>> Hash({'a': 1, 'b': 2}).transform_values(block=lambda v: v * 10)
+        {'a': 10, 'b': 20}
+        """
+        return Hash({key: block(val) for key, val in self.items()})
+
+    # transform_values! RENAMED to transform_values_bang
+    # https://ruby-doc.org/3.1.3/Hash.html#method-i-transform_values-21
+    def transform_values_bang(self, *, block: Callable[[Any], Any]) -> Hash:
+        """
+        Replaces each value of self with the value returned by the block for it; returns self.
+
+        Examples
+        --------
+        >>> h = Hash({'a': 1})
+        >>> h.transform_values_bang(block=str) is h, h
+        (True, {'a': '1'})
+        """
+        for key, val in list(self.items()):
+            dict.__setitem__(self, key, block(val))
+        return self
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-group_by
+    def group_by(self, *, block: Callable[[Any, Any], Any]) -> Hash:
+        """
+        Groups the (key, value) pairs by the value the block returns for the key and value.
+
+        Returns a Hash whose values are Arrays of pairs, like Array.group_by.
+
+        Examples
+        --------
+        >>> Hash({'a': 1, 'b': 2, 'c': 3}).group_by(block=lambda k, v: v % 2)
+        {1: [('a', 1), ('c', 3)], 0: [('b', 2)]}
+        """
+        return self.to_a().group_by(block=lambda pair: block(*pair))
+
+
+class _BoundedHash(Hash):
+    """
+    Hash with max_size and/or ttl, created by Hash(..., max_size=, ttl=).
+
+    Recency is kept in an OrderedDict next to the entries: touching a key is move_to_end and the
+    least recently used key is popitem(last=False), both O(1). Expired entries are dropped when
+    they are looked up, and when they reach the least recently used end.
+    """
+
+    def __init__(self, value: Iterable = (), *, default: Any = None,
+                 block: Optional[Callable[[Hash, Any], Any]] = None,
+                 max_size: Optional[int] = None, ttl: Optional[float] = None,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"max_size must be positive, not {max_size}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, not {ttl}")
+        super().__init__(default=default, block=block)
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__timer = timer
+        # Key -> expiry time (None without ttl), least recently used first.
+        self.__recency: OrderedDict = OrderedDict()
+        self.__hits = self.__misses = self.__evictions = self.__expirations = 0
+        self.update(value)
+
+    # Private Method
+    # Whether key is stored and not expired, dropping it if it expired.
+    def __live(self, key: Any) -> bool:
+        if not dict.__contains__(self, key):
+            return False
+        expiry = self.__recency[key]
+        if expiry is not None and expiry <= self.__timer():
+            dict.__delitem__(self, key)
+            del self.__recency[key]
+            self.__expirations += 1
+            return False
+        return True
+
+    def __getitem__(self, key: Any) -> Any:
+        if self.__live(key):
+            self.__hits += 1
+            self.__recency.move_to_end(key)
+            return dict.__getitem__(self, key)
+        self.__misses += 1
+        return self.__missing__(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        recency = self.__recency
+        dict.__setitem__(self, key, value)
+        now = None if self.__ttl is None else self.__timer()
+        recency[key] = None if now is None else now + self.__ttl
+        recency.move_to_end(key)
+        if now is not None:
+            while recency:
+                oldest, expiry = next(iter(recency.items()))
+                if expiry > now:
+                    break
+                recency.popitem(last=False)
+                dict.__delitem__(self, oldest)
+                self.__expirations += 1
+        if self.__max_size is not None:
+            while len(recency) > self.__max_size:
+                oldest, _ = recency.popitem(last=False)
+                dict.__delitem__(self, oldest)
+                self.__evictions += 1
+
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        del self.__recency[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return self.__live(key)
+
+    def __ior__(self, other: Any) -> _BoundedHash:
+        self.update(other)
+        return self
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if self.__live(key):
+            return self[key]
+        self.__misses += 1
+        return default
+
+    def fetch(self, key: Any, default: Any = _RLDefault(None), *,
+              block: Optional[Callable[[Any], Any]] = None) -> Any:
+        if not self.__live(key):
+            self.__misses += 1
+        return super().fetch(key, default, block=block)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if self.__live(key):
+            return self[key]
+        return self.store(key, default)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if not self.__live(key):
+            if default:
+                return default[0]
+            raise KeyError(key)
+        del self.__recency[key]
+        return dict.pop(self, key)
+
+    def popitem(self) -> tuple:
+        item = dict.popitem(self)
+        del self.__recency[item[0]]
+        return item
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self.__recency.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the hit, miss, eviction (past max_size) and expiration (past ttl) counters, and the sizes.
+
+        Every lookup through [], get, fetch or dig counts as a hit or a miss. The size may include
+        expired entries that were not looked up since they expired.
+        """
+        return CacheInfo(self.__hits, self.__misses, self.__evictions, self.__expirations, self.__max_size, len(self))
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
@@ -0,0 +1,279 @@
+from __future__ import annotations
+from typing import Optional, Any, Callable, Iterable, Iterator, Tuple
+from itertools import islice, takewhile, dropwhile, filterfalse, count
+
+from .ruby_array import Array, _KeySet
+
+"""
+Python Implementation of Ruby Enumerator::Lazy
+https://ruby-doc.org/3.1.3/Enumerator/Lazy.html
+
+Each chained method only records a stage. Nothing is evaluated until first, to_a / force
+or iteration pulls values, and then all the stages run as one generator pipeline,
+one element at a time, without an intermediate Array per stage.
+"""
+
+# A stage turns the upstream iterator into the downstream iterator.
+_Stage = Callable[[Iterator], Iterator]
+
+
+class Lazy:
+    """
+    Python Implementation of Ruby Enumerator::Lazy
+    https://ruby-doc.org/3.1.3/Enumerator/Lazy.html
+
+    Examples
+    --------
+    >>> Array([1, 2, 3, 4]).lazy().map(block=lambda x: x * 2).select(block=lambda x: x > 4).to_a()
+    [6, 8]
+    """
+
+    def __init__(self, source: Iterable, stages: Tuple[_Stage, ...] = ()) -> None:
+        self._source = source
+        self._stages = stages
+
+    def __repr__(self) -> str:
+        return f"#<Enumerator::Lazy: {self._source!r} ({len(self._stages)} stages)>"
+
+    def __iter__(self) -> Iterator:
+        values = iter(self._source)
+        for stage in self._stages:
+            values = stage(values)
+        return values
+
+    # Private Method
+    # Lazy objects are immutable, chaining returns a new Lazy sharing the source.
+    def __chain(self, stage: _Stage) -> Lazy:
+        return Lazy(self._source, self._stages + (stage,))
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-lazy
+    def lazy(self) -> Lazy:
+        """
+        Returns self.
+        """
+        return self
+
+    # ---------------------------------------------------------------------------------
+    #   Intermediate (lazy) methods
+    # ---------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-map
+    def map(self, *, block: Callable[[Any], Any]) -> Lazy:
+        """
+        Lazily calls block with each element and yields the results. Also aliased as: collect
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).lazy().map(block=lambda x: x * 10).to_a()
+        [10, 20, 30]
+        """
+        return self.__chain(lambda values: map(block, values))
+
+    # ==> [alias]
+    collect = map
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-select
+    def select(self, *, block: Callable[[Any], Any]) -> Lazy:
+        """
+        Lazily yields the elements for which block returns a truthy value. Also aliased as: filter
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 4]).lazy().select(block=lambda x: x % 2 == 0).to_a()
+        [2, 4]
+        """
+        return self.__chain(lambda values: filter(block, values))
+
+    # ==> [alias]
+    filter = select
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-reject
+    def reject(self, *, block: Callable[[Any], Any]) -> Lazy:
+        """
+        Lazily yields the elements for which block returns a falsy value.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 4]).lazy().reject(block=lambda x: x % 2 == 0).to_a()
+        [1, 3]
+        """
+        return self.__chain(lambda values: filterfalse(block, values))
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-take_while
+    def take_while(self, *, block: Callable[[Any], Any]) -> Lazy:
+        """
+        Lazily yields elements while block returns a truthy value.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 1]).lazy().take_while(block=lambda x: x < 3).to_a()
+        [1, 2]
+        """
+        return self.__chain(lambda values: takewhile(block, values))
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-drop_while
+    def drop_while(self, *, block: Callable[[Any], Any]) -> Lazy:
+        """
+        Lazily skips elements while block returns a truthy value, then yields the rest.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 1]).lazy().drop_while(block=lambda x: x < 3).to_a()
+        [3, 1]
+        """
+        return self.__chain(lambda values: dropwhile(block, values))
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-take
+    def take(self, n: int) -> Lazy:
+        """
+        Lazily yields the first n elements, upstream is not pulled past the n-th element.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).lazy().take(2).to_a()
+        [1, 2]
+        """
+        if n < 0:
+            raise ValueError("attempt to take negative size")
+        return self.__chain(lambda values: islice(values, n))
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-flat_map
+    def flat_map(self, *, block: Callable[[Any], Any]) -> Lazy:
+        """
+        Lazily calls block with each element, flattening list or tuple results by one level.
+        Also aliased as: collect_concat
+
+        Examples
+        --------
+        >>> Array([1, 2]).lazy().flat_map(block=lambda x: [x, -x]).to_a()
+        [1, -1, 2, -2]
+        >>> Array([1, 2]).lazy().flat_map(block=lambda x: x * 2).to_a()
+        [2, 4]
+        """
+        def flatten_results(values: Iterator) -> Iterator:
+            for val in values:
+                result = block(val)
+                if isinstance(result, (list, tuple)):
+                    yield from result
+                else:
+                    yield result
+
+        return self.__chain(flatten_results)
+
+    # ==> [alias]
+    collect_concat = flat_map
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-uniq
+    def uniq(self, *, block: Optional[Callable[[Any], Any]] = None) -> Lazy:
+        """
+        Lazily yields the first occurrence of each element, or of each block result if block is given.
+
+        Keys are compared like Array.uniq does, nested lists and dicts by value.
+
+        Examples
+        --------
+        >>> Array([1, 2, 1, 3, 2]).lazy().uniq().to_a()
+        [1, 2, 3]
+        >>> Array(['a', 'bb', 'c']).lazy().uniq(block=len).to_a()
+        ['a', 'bb']
+        """
+        def unique(values: Iterator) -> Iterator:
+            seen = _KeySet()
+            for val in values:
+                if seen.add(val if block is None else block(val)):
+                    yield val
+
+        return self.__chain(unique)
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-with_index
+    def with_index(self, offset: int = 0, *, block: Optional[Callable[[Any, int], Any]] = None) -> Lazy:
+        """
+        Lazily pairs each element with its index, starting at offset.
+
+        Without block, yields (element, index) tuples.
+        With block, calls block(element, index) for each element and yields the element unchanged.
+
+        Examples
+        --------
+        >>> Array(['a', 'b']).lazy().with_index(1).to_a()
+        [('a', 1), ('b', 2)]
+        >>> Array(['a', 'b']).lazy().with_index().map(block=lambda pair: pair[0] * pair[1]).to_a()
+        ['', 'b']
+        """
+        if block is None:
+            return self.__chain(lambda values: zip(values, count(offset)))
+
+        def call_block(values: Iterator) -> Iterator:
+            for index, val in enumerate(values, offset):
+                block(val, index)
+                yield val
+
+        return self.__chain(call_block)
+
+    # ==> [alias]
+    each_with_index = with_index
+
+    # ---------------------------------------------------------------------------------
+    #   Terminal (eager) methods
+    # ---------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/Enumerable.html#method-i-first
+    def first(self, n: Optional[int] = None) -> Any:
+        """
+        Returns the first element, or an Array of the first n elements.
+
+        Only as many elements as needed are pulled through the pipeline.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).lazy().map(block=lambda x: x + 1).first()
+        2
+        >>> Array([1, 2, 3]).lazy().map(block=lambda x: x + 1).first(2)
+        [2, 3]
+        >>> Array([]).lazy().first() is None
+        True
+        """
+        if n is None:
+            return next(iter(self), None)
+        if n < 0:
+            raise ValueError("attempt to take negative size")
+        return Array(islice(self, n))
+
+    # https://ruby-doc.org/3.1.3/Enumerator/Lazy.html#method-i-force
+    def force(self) -> Array:
+        """
+        Evaluates the whole pipeline and returns the results as an Array. Also aliased as: to_a
+
+        Examples
+        --------
+        >>> Array([1, 2]).lazy().map(block=str).force()
+        ['1', '2']
+        """
+        return Array(self)
+
+    # ==> [alias]
+    to_a = force
+
+    # https://ruby-doc.org/3.1.3/Enumerator.html#method-i-each
+    def each(self, *, block: Callable[[Any], Any]) -> Lazy:
+        """
+        Calls block with each element produced by the pipeline; returns self.
+
+        Examples
+        --------
+        >>> Array([1, 2]).lazy().map(block=lambda x: x * 3).each(block=print)
+        3
+        6
+        #<Enumerator::Lazy: [1, 2] (1 stages)>
+        """
+        for val in self:
+            block(val)
+        return self
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
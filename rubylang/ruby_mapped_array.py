@@ -0,0 +1,320 @@
+from __future__ import annotations
+from typing import List, Optional, Any, Callable, Iterator, Union
+
+import io
+import mmap
+import os
+import struct
+import warnings
+
+from .ruby_array import Array
+
+"""
+Memory-mapped, file backed sibling of Array, for datasets of fixed width records larger than RAM.
+
+The file is mapped read only and queries stream over the mapping one chunk of records at a time,
+so memory use is bounded by the chunk size whatever the size of the file. Records can be appended
+to the end of the file when it is opened writable.
+"""
+
+_RLDefault = Array._RLDefault
+
+# Records decoded per chunk while streaming.
+_CHUNK_RECORDS = 1 << 16
+
+# Single record formats a memoryview can be cast to, decoded in C without struct.
+_CASTABLE = "bBhHiIlLqQfd"
+
+
+class _Mapping:
+    """
+    The file, its memory map and its record layout, shared by a MappedArray and its slices.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], dtype: str, writable: bool) -> None:
+        self.path = os.fspath(path)
+        self.dtype = dtype
+        self.record = struct.Struct(dtype)
+        if self.record.size == 0:
+            raise ValueError(f"dtype {dtype!r} has no fields")
+        self.scalar = len(self.record.unpack(bytes(self.record.size))) == 1
+        self.cast = dtype if dtype in _CASTABLE else None
+        self.writable = writable
+        self.file = open(path, "a+b" if writable else "rb")
+        self.map: Optional[mmap.mmap] = None
+        self.length = 0
+        # Set by appends, the file is mapped again before the next read.
+        self.stale = True
+
+    def refresh(self) -> None:
+        if not self.stale:
+            return
+        self.file.flush()
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        size = os.fstat(self.file.fileno()).st_size
+        # A trailing partial record (e.g. being written by another process) is ignored.
+        self.length = size // self.record.size
+        if size:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.stale = False
+
+    def read(self, positions: range) -> List[Any]:
+        # Decodes the records at positions (a range of record numbers), without copying the file.
+        if not positions:
+            return []
+        size = self.record.size
+        with memoryview(self.map) as raw:
+            if self.cast is not None:
+                stop = positions.stop if positions.stop >= 0 else None
+                with raw[:self.length * size].cast(self.cast) as typed:
+                    return typed[positions.start:stop:positions.step].tolist()
+            if positions.step == 1:
+                records = list(self.record.iter_unpack(raw[positions.start * size:positions.stop * size]))
+            else:
+                records = [self.record.unpack_from(raw, position * size) for position in positions]
+        if self.scalar:
+            return [val for (val,) in records]
+        return records
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+
+class MappedArray:
+    """
+    Read-mostly Ruby Array over a memory mapped file of fixed width records. Create one with Array.mmap.
+
+    dtype is a struct format describing one record: a single field format such as 'q' or 'd' gives
+    numbers, a multi field format such as '<qd' gives tuples. Indexing reads one record, slicing
+    returns a MappedArray view over the same mapping, and include, index, rindex, count, all and any
+    stream over the records. Use to_a to load the records into an Array.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'values.bin')
+    >>> with Array.mmap(path, 'q', writable=True) as arr:
+    ...     _ = arr.push(5, 10, 15, 20).flush()
+    ...     arr.length(), arr[1], arr[1:3].to_a(), arr.index(15)
+    (4, 10, [10, 15], 2)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], dtype: str, *, writable: bool = False) -> None:
+        self._mapping = _Mapping(path, dtype, writable)
+        # Record numbers of a slice, None for the whole (growing) file.
+        self._positions: Optional[range] = None
+
+    # Private Method
+    # View over some records of mapping, see __getitem__.
+    @classmethod
+    def __view(cls, mapping: _Mapping, positions: range) -> MappedArray:
+        view = cls.__new__(cls)
+        view._mapping = mapping
+        view._positions = positions
+        return view
+
+    # Private Method
+    # Record numbers covered by self, mapping the file again first if records were appended.
+    def __range(self) -> range:
+        self._mapping.refresh()
+        if self._positions is None:
+            return range(self._mapping.length)
+        return self._positions
+
+    # Private Method
+    # Consecutive chunks of at most _CHUNK_RECORDS decoded records, each as (offset in self, Array).
+    def __chunks(self, reverse: bool = False) -> Iterator[tuple]:
+        positions = self.__range()
+        starts = range(0, len(positions), _CHUNK_RECORDS)
+        for start in reversed(starts) if reverse else starts:
+            yield start, Array(self._mapping.read(positions[start:start + _CHUNK_RECORDS]))
+
+    # Private Method
+    @staticmethod
+    def __drop_ignored_block(obj: Any, block: Optional[Callable[[Any], Any]]) -> Optional[Callable[[Any], Any]]:
+        # Warns once here instead of once per chunk.
+        if not isinstance(obj, _RLDefault) and block:
+            warnings.warn("Both argument and block is given. block will be ignored")
+            return None
+        return block
+
+    def __len__(self) -> int:
+        return len(self.__range())
+
+    def __iter__(self) -> Iterator[Any]:
+        for _, chunk in self.__chunks():
+            yield from chunk
+
+    def __reversed__(self) -> Iterator[Any]:
+        for _, chunk in self.__chunks(reverse=True):
+            yield from reversed(chunk)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        positions = self.__range()
+        if isinstance(key, slice):
+            return self.__view(self._mapping, positions[key])
+        return self._mapping.read(range(positions[key], positions[key] + 1))[0]
+
+    def __repr__(self) -> str:
+        return f"#<MappedArray {self._mapping.path!r} {self._mapping.dtype!r} length={len(self)}>"
+
+    def __enter__(self) -> MappedArray:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def to_a(self) -> Array:
+        """
+        Returns a list backed Array with the records of self, loading all of them into memory.
+
+        Returns
+        -------
+        Array
+            New Array containing the records of self.
+        """
+        return Array(self)
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Querying.
+    # https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Querying
+    # -----------------------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-length
+    def length(self) -> int:
+        """
+        The number of records. Also aliased as: size
+        """
+        return len(self)
+
+    # ==> [alias]
+    size = length
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-include-3F
+    def include(self, item: object) -> bool:
+        """
+        Returns whether any record == a given object, stopping at the first chunk holding one.
+        """
+        return any(item in chunk for _, chunk in self.__chunks())
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-all-3F
+    def all(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether all records meet a given criterion, see Array.all. Stops at the first failing chunk.
+        """
+        block = self.__drop_ignored_block(obj, block)
+        return all(chunk.all(obj, block=block) for _, chunk in self.__chunks())
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-any-3F
+    def any(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether any record meets a given criterion, see Array.any. Stops at the first matching chunk.
+        """
+        block = self.__drop_ignored_block(obj, block)
+        return any(chunk.any(obj, block=block) for _, chunk in self.__chunks())
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-count
+    def count(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> int:
+        """
+        Returns the count of records that meet a given criterion, see Array.count.
+        """
+        if isinstance(obj, _RLDefault) and block is None:
+            return len(self)
+        block = self.__drop_ignored_block(obj, block)
+        return sum(chunk.count(obj, block=block) for _, chunk in self.__chunks())
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-index
+    def index(self, obj: Optional[Any] = _RLDefault(None), *,
+              block: Optional[Callable[[Any], Any]] = None) -> int | None | Iterator[Any]:
+        """
+        Returns the index of the first record that meets a given criterion, see Array.index.
+        With neither an argument nor a block, returns an iterator over the records.
+        Also aliased as: find_index
+        """
+        if isinstance(obj, _RLDefault) and block is None:
+            return iter(self)
+        block = self.__drop_ignored_block(obj, block)
+        for start, chunk in self.__chunks():
+            found = chunk.index(obj, block=block)
+            if found is not None:
+                return start + found
+        return None
+
+    # ==> [alias]
+    find_index = index
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-rindex
+    def rindex(self, obj: Optional[Any] = _RLDefault(None), *,
+               block: Optional[Callable[[Any], Any]] = None) -> int | None | Iterator[Any]:
+        """
+        Returns the index of the last record that meets a given criterion, see Array.rindex.
+        Chunks are streamed from the end of the file.
+        With neither an argument nor a block, returns an iterator over the records from the last one.
+        """
+        if isinstance(obj, _RLDefault) and block is None:
+            return reversed(self)
+        block = self.__drop_ignored_block(obj, block)
+        for start, chunk in self.__chunks(reverse=True):
+            found = chunk.rindex(obj, block=block)
+            if found is not None:
+                return start + found
+        return None
+
+    # -----------------------------------------------------------------------------------------------
+    #   Methods for Adding
+    # -----------------------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-push
+    def push(self, *records: Any) -> MappedArray:
+        """
+        Appends records to the end of the file; returns self. Also aliased as: append
+
+        Records are buffered by the file, they are visible to self right away and written to disk by flush.
+        """
+        mapping = self._mapping
+        if self._positions is not None:
+            raise TypeError("can't append to a slice of a MappedArray")
+        if not mapping.writable:
+            raise io.UnsupportedOperation("MappedArray is not writable, open it with writable=True")
+        if mapping.cast is not None:
+            # One C call for the whole batch.
+            data = struct.pack(f"{len(records)}{mapping.cast}", *records)
+        elif mapping.scalar:
+            data = b"".join(mapping.record.pack(val) for val in records)
+        else:
+            data = b"".join(mapping.record.pack(*record) for record in records)
+        mapping.file.write(data)
+        mapping.stale = True
+        return self
+
+    # ==> [alias]
+    append = push
+
+    def flush(self) -> MappedArray:
+        """
+        Writes appended records to disk; returns self.
+        """
+        mapping = self._mapping
+        if mapping.writable:
+            mapping.file.flush()
+            os.fsync(mapping.file.fileno())
+        return self
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file, for self and all its slices.
+        """
+        self._mapping.close()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
@@ -0,0 +1,414 @@
+from __future__ import annotations
+from typing import List, Tuple, Optional, Any, Sequence, Union
+from functools import lru_cache
+
+import math
+import struct
+
+from .ruby_array import Array
+
+"""
+Ruby pack / unpack directive language, backing Array.pack, Array.pack_into and unpack.
+https://docs.ruby-lang.org/en/master/packed_data_rdoc.html
+
+Supported directives, each optionally followed by a count or *:
+    C c S s L l Q q     8, 16, 32 and 64 bit integers, native byte order (S, L, Q, s, l, q take < or >)
+    n N / v V           16 and 32 bit unsigned integers, big / little endian
+    e E / g G / f d     single and double floats, little / big / native endian
+    a A Z               binary string, padded with nulls / spaces / nulls (Z* adds a trailing null)
+    U                   UTF-8 character
+    w                   BER-compressed integer
+
+A template is compiled once and cached. Adjacent fixed count numeric directives with the same byte
+order are merged into one struct.Struct, so a homogeneous run of values is packed by a single C call
+straight into the output buffer.
+"""
+
+# Ruby directive -> (struct format character, byte order). '=' is native order with standard sizes.
+_NUMERIC = {
+    "C": ("B", "="), "c": ("b", "="),
+    "S": ("H", "="), "s": ("h", "="),
+    "L": ("I", "="), "l": ("i", "="),
+    "Q": ("Q", "="), "q": ("q", "="),
+    "n": ("H", ">"), "N": ("I", ">"),
+    "v": ("H", "<"), "V": ("I", "<"),
+    "e": ("f", "<"), "E": ("d", "<"),
+    "g": ("f", ">"), "G": ("d", ">"),
+    "f": ("f", "="), "F": ("f", "="),
+    "d": ("d", "="), "D": ("d", "="),
+}
+# Integer directives taking an explicit byte order modifier.
+_ORDERED = "SsLlQq"
+_FLOATS = "fd"
+_STRINGS = "aAZ"
+
+# Compiled steps:
+#   ("struct", order, pieces, Struct)  fixed count numeric directives, pieces is ((format, count), ...)
+#   ("struct*", order, format)         numeric directive taking all the remaining values
+#   ("string", directive, count)       a, A or Z, count None for *
+#   ("utf8", count) / ("ber", count)   U and w, count None for *
+_Step = Tuple[Any, ...]
+
+_Buffer = Union[bytearray, memoryview]
+
+
+@lru_cache(maxsize=256)
+def _struct(fmt: str) -> struct.Struct:
+    return struct.Struct(fmt)
+
+
+@lru_cache(maxsize=256)
+def _compile(template: str) -> Tuple[_Step, ...]:
+    steps: List[_Step] = []
+    # Fixed count numeric directives waiting to be merged into one struct step.
+    order, pieces = None, []
+
+    def flush() -> None:
+        nonlocal order, pieces
+        if pieces:
+            fmt = order + "".join(f"{count}{code}" for code, count in pieces)
+            steps.append(("struct", order, tuple(pieces), _struct(fmt)))
+        order, pieces = None, []
+
+    i, length = 0, len(template)
+    while i < length:
+        directive = template[i]
+        i += 1
+        if directive.isspace():
+            continue
+        if directive == "#":
+            # Comment up to the end of the line.
+            while i < length and template[i] != "\n":
+                i += 1
+            continue
+
+        modifier = None
+        while i < length and template[i] in "<>_!":
+            if template[i] in "_!":
+                raise ValueError(f"native size modifier '{template[i]}' is not supported (in {template!r})")
+            if directive not in _ORDERED:
+                raise ValueError(f"'{template[i]}' allowed only after types {_ORDERED} (in {template!r})")
+            modifier = template[i]
+            i += 1
+
+        count: Optional[int] = 1
+        if i < length and template[i] == "*":
+            count = None
+            i += 1
+        elif i < length and template[i].isdigit():
+            start = i
+            while i < length and template[i].isdigit():
+                i += 1
+            count = int(template[start:i])
+
+        if directive in _NUMERIC:
+            code, byte_order = _NUMERIC[directive]
+            if modifier is not None:
+                byte_order = modifier
+            if count is None:
+                flush()
+                steps.append(("struct*", byte_order, code))
+                continue
+            if order is not None and order != byte_order:
+                flush()
+            order = byte_order
+            if count:
+                pieces.append((code, count))
+            continue
+
+        flush()
+        if directive in _STRINGS:
+            steps.append(("string", directive, count))
+        elif directive == "U":
+            steps.append(("utf8", count))
+        elif directive == "w":
+            steps.append(("ber", count))
+        else:
+            raise ValueError(f"unknown pack directive {directive!r} in {template!r}")
+    flush()
+    return tuple(steps)
+
+
+# -----------------------------------------------------------------------------------------------
+#   Packing
+# -----------------------------------------------------------------------------------------------
+
+def _integer(val: Any, code: str) -> int:
+    # Ruby truncates floats and wraps integers to the size of the directive instead of raising.
+    if isinstance(val, float):
+        val = int(val)
+    elif not isinstance(val, int):
+        raise TypeError(f"no implicit conversion of {type(val).__name__} into Integer")
+    bits = 8 * struct.calcsize(code)
+    val &= (1 << bits) - 1
+    if code.islower() and val >> (bits - 1):
+        val -= 1 << bits
+    return val
+
+
+def _float(val: Any, code: str) -> Any:
+    # Ruby packs a value out of the range of the directive as Infinity instead of raising.
+    if not isinstance(val, (int, float)):
+        raise TypeError(f"can't convert {type(val).__name__} into Float")
+    try:
+        # Standard size: the native one casts in C without checking the range.
+        _struct(f"<{code}").pack(float(val))
+    except OverflowError:
+        return math.inf if val > 0 else -math.inf
+    return val
+
+
+def _normalize(pieces: Sequence[Tuple[str, int]], values: Sequence[Any]) -> List[Any]:
+    normalized = []
+    position = 0
+    for code, count in pieces:
+        for val in values[position:position + count]:
+            if code in _FLOATS:
+                normalized.append(_float(val, code))
+            else:
+                normalized.append(_integer(val, code))
+        position += count
+    return normalized
+
+
+def _string(val: Any) -> bytes:
+    if isinstance(val, str):
+        return val.encode("utf-8")
+    if isinstance(val, (bytes, bytearray, memoryview)):
+        return bytes(val)
+    raise TypeError(f"no implicit conversion of {type(val).__name__} into String")
+
+
+def _ber(val: Any) -> bytes:
+    if isinstance(val, float):
+        val = int(val)
+    if not isinstance(val, int):
+        raise TypeError(f"no implicit conversion of {type(val).__name__} into Integer")
+    if val < 0:
+        raise ValueError("can't compress negative numbers")
+    encoded = [val & 0x7f]
+    val >>= 7
+    while val:
+        encoded.append(0x80 | (val & 0x7f))
+        val >>= 7
+    return bytes(reversed(encoded))
+
+
+# A planned write: (Struct, pieces, values) for numeric runs, bytes otherwise.
+_Write = Union[Tuple[struct.Struct, Tuple[Tuple[str, int], ...], Sequence[Any]], bytes]
+
+
+def _plan(values: Sequence[Any], template: str) -> Tuple[int, List[_Write]]:
+    writes: List[_Write] = []
+    size = 0
+    position = 0
+
+    def take(count: Optional[int]) -> Sequence[Any]:
+        nonlocal position
+        if count is None:
+            count = len(values) - position
+        if position + count > len(values):
+            raise ValueError("too few arguments")
+        taken = values[position:position + count]
+        position += count
+        return taken
+
+    for step in _compile(template):
+        kind = step[0]
+        if kind == "struct":
+            _, _, pieces, packer = step
+            writes.append((packer, pieces, take(sum(count for _, count in pieces))))
+            size += packer.size
+        elif kind == "struct*":
+            _, order, code = step
+            run = take(None)
+            packer = _struct(f"{order}{len(run)}{code}")
+            writes.append((packer, ((code, len(run)),), run))
+            size += packer.size
+        else:
+            if kind == "string":
+                _, directive, count = step
+                data = _string(take(1)[0])
+                if count is None:
+                    encoded = data + b"\0" if directive == "Z" else data
+                else:
+                    encoded = data[:count].ljust(count, b" " if directive == "A" else b"\0")
+            elif kind == "utf8":
+                encoded = b"".join(chr(_integer(val, "q")).encode("utf-8", "surrogatepass") for val in take(step[1]))
+            else:
+                encoded = b"".join(map(_ber, take(step[1])))
+            writes.append(encoded)
+            size += len(encoded)
+    return size, writes
+
+
+def _write(writes: List[_Write], buffer: _Buffer, offset: int) -> int:
+    for write in writes:
+        if isinstance(write, bytes):
+            buffer[offset:offset + len(write)] = write
+            offset += len(write)
+            continue
+        packer, pieces, run = write
+        try:
+            packer.pack_into(buffer, offset, *run)
+        except (struct.error, OverflowError):
+            # Out of range values, or float values for integer directives, converted the way Ruby does.
+            # Floats too large for single precision raise OverflowError.
+            packer.pack_into(buffer, offset, *_normalize(pieces, run))
+        offset += packer.size
+    return offset
+
+
+def pack(values: Sequence[Any], template: str, buffer: Optional[bytearray] = None) -> Union[bytes, bytearray]:
+    """
+    Packs values into binary data as directed by template, see Array.pack.
+    """
+    size, writes = _plan(values, template)
+    if buffer is not None:
+        offset = len(buffer)
+        buffer.extend(bytes(size))
+        _write(writes, buffer, offset)
+        return buffer
+    packed = bytearray(size)
+    _write(writes, packed, 0)
+    return bytes(packed)
+
+
+def pack_into(values: Sequence[Any], template: str, buffer: _Buffer, offset: int = 0) -> int:
+    """
+    Packs values into buffer from offset as directed by template, see Array.pack_into.
+    """
+    size, writes = _plan(values, template)
+    if offset < 0 or offset + size > len(buffer):
+        raise ValueError(f"pack_into requires a buffer of at least {offset + size} bytes, got {len(buffer)}")
+    return _write(writes, buffer, offset)
+
+
+# -----------------------------------------------------------------------------------------------
+#   Unpacking
+# -----------------------------------------------------------------------------------------------
+
+def _utf8(view: memoryview, offset: int) -> Tuple[int, int]:
+    lead = view[offset]
+    length = 1 if lead < 0x80 else 2 if lead < 0xe0 else 3 if lead < 0xf0 else 4
+    try:
+        char = bytes(view[offset:offset + length]).decode("utf-8", "surrogatepass")
+    except UnicodeDecodeError:
+        raise ValueError("malformed UTF-8 character") from None
+    if len(char) != 1:
+        raise ValueError("malformed UTF-8 character")
+    return ord(char), offset + length
+
+
+def _unber(view: memoryview, offset: int) -> Tuple[int, int]:
+    val = 0
+    while offset < len(view):
+        byte = view[offset]
+        offset += 1
+        val = (val << 7) | (byte & 0x7f)
+        if not byte & 0x80:
+            return val, offset
+    raise ValueError("can't unpack truncated BER-compressed integer")
+
+
+def unpack(data: Any, template: str, offset: int = 0) -> Array:
+    """
+    Extracts an Array of values from the bytes-like data as directed by template.
+
+    The inverse of Array.pack. Strings are returned as bytes, and numeric directives with no data
+    left give None, like Ruby. The data is read in place, without being copied.
+    https://docs.ruby-lang.org/en/master/String.html#method-i-unpack
+
+    Parameters
+    ----------
+    data: bytes-like
+        Binary data, e.g. bytes, bytearray, memoryview or mmap.
+    template: str
+        Directives, see the module documentation.
+    offset: int = 0
+        Position in data where unpacking starts.
+
+    Returns
+    -------
+    Array
+        The values read.
+
+    Examples
+    --------
+    >>> unpack(b'\\x00\\x01\\x00\\x00\\x00\\x02abc  ', 'nNA*')
+    [1, 2, b'abc']
+    >>> unpack(b'\\x01\\x02\\x03', 'C*')
+    [1, 2, 3]
+    >>> unpack(b'\\x01', 'Cn')
+    [1, None]
+    """
+    view = memoryview(data).cast("B")
+    values = Array([])
+    for step in _compile(template):
+        kind = step[0]
+        if kind == "struct":
+            _, order, pieces, unpacker = step
+            if offset + unpacker.size <= len(view):
+                values.extend(unpacker.unpack_from(view, offset))
+                offset += unpacker.size
+                continue
+            # Not enough data for the whole run, read item by item.
+            for code, count in pieces:
+                item = _struct(order + code)
+                for _ in range(count):
+                    if offset + item.size <= len(view):
+                        values.extend(item.unpack_from(view, offset))
+                        offset += item.size
+                    else:
+                        values.append(None)
+        elif kind == "struct*":
+            _, order, code = step
+            count = (len(view) - offset) // struct.calcsize(order + code)
+            unpacker = _struct(f"{order}{count}{code}")
+            values.extend(unpacker.unpack_from(view, offset))
+            offset += unpacker.size
+        elif kind == "string":
+            _, directive, count = step
+            end = len(view) if count is None else min(offset + count, len(view))
+            data = bytes(view[offset:end])
+            if directive == "A":
+                data = data.rstrip(b" \0")
+            elif directive == "Z":
+                null = data.find(b"\0")
+                if null >= 0:
+                    data = data[:null]
+                    if count is None:
+                        end = offset + null + 1
+            values.append(data)
+            offset = end
+        else:
+            decode = _utf8 if kind == "utf8" else _unber
+            count = step[1]
+            while offset < len(view) and (count is None or count > 0):
+                val, offset = decode(view, offset)
+                values.append(val)
+                if count is not None:
+                    count -= 1
+    return values
+
+
+def unpack1(data: Any, template: str, offset: int = 0) -> Any:
+    """
+    Like unpack, but returns only the first extracted value.
+    https://docs.ruby-lang.org/en/master/String.html#method-i-unpack1
+
+    Examples
+    --------
+    >>> unpack1(b'\\x00\\x00\\x80\\x3f', 'e')
+    1.0
+    """
+    values = unpack(data, template, offset)
+    return values[0] if values else None
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
@@ -0,0 +1,338 @@
+from __future__ import annotations
+from typing import List, Optional, Any, Callable, Iterator, Tuple
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import os
+import pickle
+
+from .ruby_array import Array
+
+"""
+Parallel block evaluation for Array.
+
+Array.parallel(n) returns a proxy whose block taking methods split self into contiguous chunks
+and evaluate the block on a process pool (or a thread pool for I/O bound blocks).
+Results keep the order of self, and any?, all?, none? and index stop submitting work and cancel
+pending chunks as soon as the answer is known.
+"""
+
+_RLDefault = Array._RLDefault
+
+# Chunks per worker when chunk_size is not given, small enough to balance uneven blocks.
+_CHUNKS_PER_WORKER = 4
+
+
+# Worker functions live at module level so that process pools can pickle them.
+
+def _map_chunk(block: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    return [block(val) for val in chunk]
+
+
+def _truth_chunk(block: Callable[[Any], Any], chunk: List[Any]) -> List[bool]:
+    return [bool(block(val)) for val in chunk]
+
+
+def _count_chunk(block: Callable[[Any], Any], chunk: List[Any]) -> int:
+    return sum(1 for val in chunk if block(val))
+
+
+def _find_chunk(block: Callable[[Any], Any], chunk: List[Any], truthy: bool) -> int:
+    # Offset of the first element whose block result has the wanted truthiness, -1 if none.
+    for offset, val in enumerate(chunk):
+        if bool(block(val)) is truthy:
+            return offset
+    return -1
+
+
+class Parallel:
+    """
+    Proxy running Array block methods on a pool of workers. Create one with Array.parallel.
+
+    Blocks run in a ProcessPoolExecutor by default and must be picklable, which means module level
+    functions, not lambdas or nested functions. Pass threads=True for I/O bound blocks, or an
+    existing executor, which is used as is and never shut down by the proxy.
+
+    Examples
+    --------
+    >>> Array([1, 2, 3, 4]).parallel(2, threads=True).map(block=lambda x: x * x)
+    [1, 4, 9, 16]
+    """
+
+    def __init__(self, array: Array, workers: Optional[int] = None, *,
+                 executor: Optional[Executor] = None,
+                 threads: bool = False,
+                 chunk_size: Optional[int] = None) -> None:
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._array = array
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = executor
+        self._threads = threads
+        self._chunk_size = chunk_size
+
+    def __repr__(self) -> str:
+        kind = "threads" if self._threads else "processes"
+        if self._executor is not None:
+            kind = type(self._executor).__name__
+        return f"#<Parallel {self._workers} {kind}: {self._array!r}>"
+
+    # Private Method
+    # Uses the given executor, or creates (and shuts down) a pool for the duration of one call.
+    # The pool is not waited for: after an early exit the pending chunks are cancelled, and the call
+    # returns without waiting for the ones already running.
+    @contextmanager
+    def __pool(self, block: Callable[[Any], Any]) -> Iterator[Executor]:
+        if self._executor is not None:
+            if isinstance(self._executor, ProcessPoolExecutor):
+                self.__check_picklable(block)
+            yield self._executor
+            return
+
+        if self._threads:
+            pool = ThreadPoolExecutor(max_workers=self._workers)
+        else:
+            self.__check_picklable(block)
+            pool = ProcessPoolExecutor(max_workers=self._workers)
+        try:
+            yield pool
+        finally:
+            pool.shutdown(wait=False)
+
+    # Private Method
+    # Fails fast with a clear message instead of a PicklingError raised later from a worker.
+    @staticmethod
+    def __check_picklable(block: Callable[[Any], Any]) -> None:
+        try:
+            pickle.dumps(block)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise TypeError(
+                f"block {block!r} can't be pickled to run in a process pool ({error}). "
+                "Use a module level function, or parallel(threads=True)."
+            ) from error
+
+    # Private Method
+    # Contiguous (start, chunk) pieces of self.
+    def __chunks(self) -> List[Tuple[int, List[Any]]]:
+        length = len(self._array)
+        size = self._chunk_size or max(1, -(-length // (self._workers * _CHUNKS_PER_WORKER)))
+        return [(start, self._array[start:start + size]) for start in range(0, length, size)]
+
+    # Private Method
+    # Submits every chunk, results are read in the order of self.
+    def __ordered_results(self, worker: Callable, block: Callable[[Any], Any],
+                          chunks: List[Tuple[int, List[Any]]]) -> List[Any]:
+        with self.__pool(block) as pool:
+            futures = [pool.submit(worker, block, chunk) for _, chunk in chunks]
+            try:
+                return [future.result() for future in futures]
+            finally:
+                self.__cancel(futures)
+
+    # Private Method
+    # Returns True as soon as any chunk holds an element whose block truthiness is `truthy`.
+    def __exists(self, block: Callable[[Any], Any], truthy: bool) -> bool:
+        with self.__pool(block) as pool:
+            futures = [pool.submit(_find_chunk, block, chunk, truthy) for _, chunk in self.__chunks()]
+            try:
+                for future in as_completed(futures):
+                    if future.result() >= 0:
+                        return True
+                return False
+            finally:
+                self.__cancel(futures)
+
+    @staticmethod
+    def __cancel(futures: List[Future]) -> None:
+        for future in futures:
+            future.cancel()
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Querying.
+    # -----------------------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-all-3F
+    def all(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether all elements meet a given criterion, see Array.all.
+
+        The block runs on the workers, pending chunks are cancelled at the first falsy result.
+        Without a block the call is answered by the Array itself.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).parallel(2, threads=True).all(block=lambda x: x > 0)
+        True
+        """
+        if block is None or not isinstance(obj, _RLDefault):
+            return self._array.all(obj, block=block)
+        return not self.__exists(block, truthy=False)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-any-3F
+    def any(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether any element meets a given criterion, see Array.any.
+
+        The block runs on the workers, pending chunks are cancelled at the first truthy result.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).parallel(2, threads=True).any(block=lambda x: x > 2)
+        True
+        """
+        if block is None or not isinstance(obj, _RLDefault):
+            return self._array.any(obj, block=block)
+        return self.__exists(block, truthy=True)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-none-3F
+    def none(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether no element meets a given criterion, see Array.none.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).parallel(2, threads=True).none(block=lambda x: x > 5)
+        True
+        """
+        return not self.any(obj, block=block)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-one-3F
+    def one(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> bool:
+        """
+        Returns whether exactly one element meets a given criterion, see Array.one.
+
+        Pending chunks are cancelled once a second truthy result is seen.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).parallel(2, threads=True).one(block=lambda x: x > 2)
+        True
+        """
+        if block is None or not isinstance(obj, _RLDefault):
+            return self._array.one(obj, block=block)
+
+        with self.__pool(block) as pool:
+            futures = [pool.submit(_count_chunk, block, chunk) for _, chunk in self.__chunks()]
+            truthy_count = 0
+            try:
+                for future in as_completed(futures):
+                    truthy_count += future.result()
+                    if truthy_count > 1:
+                        return False
+                return truthy_count == 1
+            finally:
+                self.__cancel(futures)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-count
+    def count(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> int:
+        """
+        Returns the count of elements that meet a given criterion, see Array.count.
+
+        Examples
+        --------
+        >>> Array([0, 1, 2, 3]).parallel(2, threads=True).count(block=lambda x: x > 1)
+        2
+        """
+        if block is None or not isinstance(obj, _RLDefault):
+            return self._array.count(obj, block=block)
+        return sum(self.__ordered_results(_count_chunk, block, self.__chunks()))
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-index
+    def index(self, obj: Optional[Any] = _RLDefault(None), *,
+              block: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Returns the index of the first element that meets a given criterion, see Array.index.
+
+        Chunks are awaited in order, and the ones after the first chunk holding a match are cancelled.
+
+        Examples
+        --------
+        >>> Array(['foo', 'bar', 2, 'bar']).parallel(2, threads=True).index(block=lambda x: x == 'bar')
+        1
+        """
+        if block is None or not isinstance(obj, _RLDefault):
+            return self._array.index(obj, block=block)
+
+        with self.__pool(block) as pool:
+            chunks = self.__chunks()
+            futures = [pool.submit(_find_chunk, block, chunk, True) for _, chunk in chunks]
+            try:
+                for (start, _), future in zip(chunks, futures):
+                    offset = future.result()
+                    if offset >= 0:
+                        return start + offset
+                return None
+            finally:
+                self.__cancel(futures)
+
+    # ==> [alias]
+    find_index = index
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Creating Arrays from a block.
+    # -----------------------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-map
+    def map(self, *, block: Callable[[Any], Any]) -> Array:
+        """
+        Returns a new Array of the block results, in the order of self. Also aliased as: collect
+
+        Examples
+        --------
+        >>> Array([1, 2, 3]).parallel(2, threads=True).map(block=str)
+        ['1', '2', '3']
+        """
+        results = Array([])
+        for chunk_results in self.__ordered_results(_map_chunk, block, self.__chunks()):
+            results.extend(chunk_results)
+        return results
+
+    # ==> [alias]
+    collect = map
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-select
+    def select(self, *, block: Callable[[Any], Any]) -> Array:
+        """
+        Returns a new Array of the elements for which the block is truthy. Also aliased as: filter
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 4]).parallel(2, threads=True).select(block=lambda x: x % 2 == 0)
+        [2, 4]
+        """
+        return self.__keep(block, truthy=True)
+
+    # ==> [alias]
+    filter = select
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-reject
+    def reject(self, *, block: Callable[[Any], Any]) -> Array:
+        """
+        Returns a new Array of the elements for which the block is falsy.
+
+        Examples
+        --------
+        >>> Array([1, 2, 3, 4]).parallel(2, threads=True).reject(block=lambda x: x % 2 == 0)
+        [1, 3]
+        """
+        return self.__keep(block, truthy=False)
+
+    # Private Method
+    # Only the truthiness of the block result travels back from the workers, not the elements.
+    def __keep(self, block: Callable[[Any], Any], truthy: bool) -> Array:
+        kept = Array([])
+        chunks = self.__chunks()
+        truth_values = self.__ordered_results(_truth_chunk, block, chunks)
+        for (_, chunk), chunk_truth in zip(chunks, truth_values):
+            kept.extend(val for val, keep in zip(chunk, chunk_truth) if keep is truthy)
+        return kept
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
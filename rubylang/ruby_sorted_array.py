@@ -0,0 +1,300 @@
+from __future__ import annotations
+from typing import Optional, Any, Callable, Iterable, Iterator, SupportsIndex
+from bisect import bisect_left, bisect_right
+
+from .ruby_array import Array
+
+"""
+Sorted sibling of Array, for Arrays that are searched more often than they are changed.
+
+The elements are kept in ascending order, so lookups are binary searches: include, index, rindex
+and count(obj) are O(log n), and between(lo, hi) returns a range of elements without scanning.
+"""
+
+_RLDefault = Array._RLDefault
+
+# Up to this many values are inserted one by one with bisect, larger batches are appended and
+# merged by a single sort, which runs in linear time on two sorted runs.
+_INSORT_LIMIT = 8
+
+
+class SortedArray(Array):
+    """
+    Ruby Array kept in ascending order.
+
+    Elements must be mutually comparable with <. Every method adding elements (push, append,
+    unshift, prepend, insert, extend, +=, []=) puts them at their sorted position, and methods that
+    would break the order (sort with a key or in reverse, reverse) raise TypeError.
+
+    Examples
+    --------
+    >>> arr = SortedArray([5, 1, 3])
+    >>> arr
+    [1, 3, 5]
+    >>> arr.push(4, 0)
+    [0, 1, 3, 4, 5]
+    >>> arr.include(4), arr.index(4)
+    (True, 3)
+    """
+
+    def __init__(self, value: Iterable = ()) -> None:
+        super().__init__(sorted(value))
+
+    # Private Method
+    # New SortedArray holding values that are already sorted, without sorting them again.
+    @classmethod
+    def __from_sorted(cls, values: Iterable) -> SortedArray:
+        arr = cls()
+        list.extend(arr, values)
+        return arr
+
+    # Private Method
+    # True when obj can be ordered against the elements, so that bisect results are meaningful.
+    def __comparable(self, obj: Any) -> bool:
+        if not self:
+            return True
+        try:
+            self[0] < obj
+        except TypeError:
+            return False
+        return True
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Querying.
+    # https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Querying
+    # -----------------------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-include-3F
+    def include(self, item: object) -> bool:
+        """
+        Returns whether any element == a given object, in O(log n). See Array.include.
+
+        Examples
+        --------
+        >>> SortedArray([3, 1, 2]).include(2)
+        True
+        >>> SortedArray([3, 1, 2]).include('a')
+        False
+        """
+        if not self.__comparable(item):
+            return super().include(item)
+        position = bisect_left(self, item)
+        return position < len(self) and self[position] == item
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-count
+    def count(self, obj: Optional[Any] = _RLDefault(None), *, block: Optional[Callable[[Any], Any]] = None) -> int:
+        """
+        Returns the count of elements that meet a given criterion. See Array.count.
+
+        With argument obj and no block, the equal elements are adjacent and counted in O(log n).
+
+        Examples
+        --------
+        >>> SortedArray([2, 1, 2, 3, 2]).count(2)
+        3
+        """
+        if isinstance(obj, _RLDefault) or block is not None or not self.__comparable(obj):
+            return super().count(obj, block=block)
+        return bisect_right(self, obj) - bisect_left(self, obj)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-index
+    def index(self, obj: Optional[Any] = _RLDefault(None), *,
+              block: Optional[Callable[[Any], Any]] = None,
+              start: Optional[int] = None,
+              stop: Optional[int] = None) -> int | None | Iterable:
+        """
+        Returns the index of the first element that meets a given criterion. Also aliased as: find_index
+
+        With argument obj and no block, the index is found in O(log n). See Array.index.
+
+        Examples
+        --------
+        >>> SortedArray([1, 2, 2, 3]).index(2)
+        1
+        >>> SortedArray([1, 2, 2, 3]).index(2, start=2)
+        2
+        """
+        if isinstance(obj, _RLDefault) or block is not None or not self.__comparable(obj):
+            return super().index(obj, block=block, start=start, stop=stop)
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return None
+        position = bisect_left(self, obj, start, stop)
+        return position if position < stop and self[position] == obj else None
+
+    # ==> [alias]
+    find_index = index
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-rindex
+    def rindex(self, obj: Optional[Any] = _RLDefault(None), *,
+               block: Optional[Callable[[Any], Any]] = None,
+               start: Optional[int] = None,
+               stop: Optional[int] = None) -> int | None | Iterable:
+        """
+        Returns the index of the last element that meets a given criterion.
+
+        With argument obj and no block, the index is found in O(log n). See Array.rindex.
+
+        Examples
+        --------
+        >>> SortedArray([1, 2, 2, 3]).rindex(2)
+        2
+        """
+        if isinstance(obj, _RLDefault) or block is not None or not self.__comparable(obj):
+            return super().rindex(obj, block=block, start=start, stop=stop)
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return None
+        position = bisect_right(self, obj, start, stop) - 1
+        return position if position >= start and self[position] == obj else None
+
+    # Not part of Ruby, the sorted counterpart of Comparable#between?
+    def between(self, lo: Any, hi: Any, *, exclude_end: bool = False) -> SortedArray:
+        """
+        Returns a new SortedArray of the elements e with lo <= e <= hi, found in O(log n) without scanning.
+
+        Parameters
+        ----------
+        lo: Any
+            Lowest element included.
+        hi: Any
+            Highest element, included unless exclude_end is True.
+        exclude_end: bool = False
+            Whether elements == hi are left out, like the Ruby range lo...hi.
+
+        Returns
+        -------
+        SortedArray
+            New SortedArray with the elements in the range.
+
+        Examples
+        --------
+        >>> arr = SortedArray([1, 3, 5, 7, 9])
+        >>> arr.between(3, 7)
+        [3, 5, 7]
+        >>> arr.between(3, 7, exclude_end=True)
+        [3, 5]
+        >>> arr.between(10, 20)
+        []
+        """
+        low = bisect_left(self, lo)
+        high = bisect_left(self, hi, low) if exclude_end else bisect_right(self, hi, low)
+        return self.__from_sorted(self[low:high])
+
+    # -----------------------------------------------------------------------------------------------
+    #   Methods for Assigning
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Assigning
+    # -----------------------------------------------------------------------------------------------
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        # Assigned elements can be anywhere, sorting mostly sorted data is close to linear.
+        super().sort()
+
+    def __iadd__(self, other: Iterable) -> SortedArray:
+        self.extend(other)
+        return self
+
+    def __imul__(self, n: int) -> SortedArray:
+        super().__imul__(n)
+        super().sort()
+        return self
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-map-21
+    def map_bang(self, *, block: Optional[Callable[[Any], Any]] = None) -> SortedArray | Iterator:
+        """
+        Replaces each element with the value returned by the block for it, then sorts self again.
+        Also aliased as: collect_bang
+
+        Examples
+        --------
+        >>> SortedArray([1, 2, 3]).map_bang(block=lambda x: -x)
+        [-3, -2, -1]
+        """
+        mapped = super().map_bang(block=block)
+        if block is not None:
+            super().sort()
+        return mapped
+
+    # ==> [alias]
+    collect_bang = map_bang
+
+    def extend(self, iterable: Iterable) -> None:
+        values = list(iterable)
+        if len(values) <= _INSORT_LIMIT:
+            for val in values:
+                super().insert(bisect_right(self, val), val)
+            return
+        super().extend(values)
+        super().sort()
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-push
+    def push(self, *objects: Any) -> SortedArray:
+        """
+        Inserts each argument in objects at its sorted position; returns self. Also aliased as: append
+
+        Examples
+        --------
+        >>> SortedArray([1, 5]).push(3, 7)
+        [1, 3, 5, 7]
+        """
+        self.extend(objects)
+        return self
+
+    # ==> [alias]
+    append = push
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-unshift
+    def unshift(self, *objects: Any) -> SortedArray:
+        """
+        Same as push, the objects go to their sorted position and not to the front. Also aliased as: prepend
+
+        Examples
+        --------
+        >>> SortedArray([1, 5]).unshift(9)
+        [1, 5, 9]
+        """
+        self.extend(objects)
+        return self
+
+    # ==> [alias]
+    prepend = unshift
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-insert
+    def insert(self, _index: SupportsIndex, _object: Any) -> SortedArray:
+        """
+        Inserts the object at its sorted position, _index is ignored; returns self.
+
+        Examples
+        --------
+        >>> SortedArray([1, 5]).insert(0, 3)
+        [1, 3, 5]
+        """
+        super().insert(bisect_right(self, _object), _object)
+        return self
+
+    # -----------------------------------------------------------------------------------------------
+    #   Methods for Deleting
+    #   https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Deleting
+    # -----------------------------------------------------------------------------------------------
+
+    def remove(self, value: Any) -> None:
+        position = self.index(value)
+        if position is None:
+            raise ValueError(f"{value!r} is not in SortedArray")
+        del self[position]
+
+    def sort(self, *, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        if key is not None or reverse:
+            raise TypeError("SortedArray is always in ascending order, use Array(self).sort(...) instead")
+
+    def reverse(self) -> None:
+        raise TypeError("SortedArray is always in ascending order, use Array(self).reverse() instead")
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
@@ -0,0 +1,369 @@
+from __future__ import annotations
+from typing import List, Tuple, Optional, Any, Callable, Iterator, Union
+from collections import deque
+from itertools import chain
+
+import re
+
+"""
+Python Implementation of Ruby String
+https://ruby-doc.org/3.1.3/String.html
+
+Python strings are immutable, so building one with repeated += copies it every time. String keeps
+its content as a list of pieces instead: appending (<<, concat) and prepending are amortized O(1),
+and the pieces are joined once, when the content is read. The joined str is cached until the next
+mutation.
+"""
+
+# Appended pieces are collected in a tail list, joined into one piece every _TAIL_PIECES appends so
+# that the number of pieces stays small. Each character is copied once there and once when read.
+_TAIL_PIECES = 1024
+
+StrLike = Union[str, "String"]
+
+
+class String:
+    """
+    Python Implementation of Ruby String
+    https://ruby-doc.org/3.1.3/String.html
+
+    Mutable text with amortized O(1) appends.
+
+    Examples
+    --------
+    >>> s = String('Hello')
+    >>> s << ', ' << 'World' << 33
+    'Hello, World!'
+    >>> s.length()
+    13
+    >>> str(s.prepend('>> '))
+    '>> Hello, World!'
+    """
+
+    __slots__ = ("_pieces", "_tail", "_length", "_cached")
+
+    def __init__(self, value: StrLike = "") -> None:
+        value = self.__text(value)
+        self._pieces: deque = deque([value] if value else ())
+        self._tail: List[str] = []
+        self._length = len(value)
+        # Joined content, None when it must be joined again.
+        self._cached: Optional[str] = value
+
+    # Private Method
+    # The str appended for obj, Ruby appends integers as the character with that codepoint.
+    @staticmethod
+    def __text(obj: Any) -> str:
+        if isinstance(obj, str):
+            return obj
+        if isinstance(obj, String):
+            return obj.to_s()
+        if isinstance(obj, int) and not isinstance(obj, bool):
+            return chr(obj)
+        raise TypeError(f"no implicit conversion of {type(obj).__name__} into String")
+
+    # Private Method
+    # Snapshot of the pieces, safe to iterate while self is mutated.
+    def __snapshot(self) -> Tuple[str, ...]:
+        if self._cached is not None:
+            return (self._cached,)
+        return tuple(chain(self._pieces, self._tail))
+
+    def __str__(self) -> str:
+        return self.to_s()
+
+    def __repr__(self) -> str:
+        return repr(self.to_s())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (str, String)):
+            return self._length == len(other) and self.to_s() == str(other)
+        return NotImplemented
+
+    # Mutable, so not hashable, like Array.
+    __hash__ = None
+
+    def __iter__(self) -> Iterator[str]:
+        return self.each_char()
+
+    def __contains__(self, other: StrLike) -> bool:
+        return self.__text(other) in self.to_s()
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        return self.to_s()[key]
+
+    # << : Appends an object to self.
+    # https://ruby-doc.org/3.1.3/String.html#method-i-3C-3C
+    def __lshift__(self, obj: StrLike | int) -> String:
+        return self.concat(obj)
+
+    def __iadd__(self, obj: StrLike) -> String:
+        return self.concat(obj)
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-2B
+    def __add__(self, obj: StrLike) -> String:
+        return String(self.to_s() + self.__text(obj))
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Converting and Querying.
+    # -----------------------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-to_s
+    def to_s(self) -> str:
+        """
+        Returns the content of self as a str. Also aliased as: to_str
+
+        The pieces are joined at most once per mutation, the result is cached.
+
+        Examples
+        --------
+        >>> String('ab').concat('c').to_s()
+        'abc'
+        """
+        if self._cached is None:
+            joined = "".join(chain(self._pieces, self._tail))
+            self._pieces = deque([joined] if joined else ())
+            self._tail = []
+            self._cached = joined
+        return self._cached
+
+    # ==> [alias]
+    to_str = to_s
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-length
+    def length(self) -> int:
+        """
+        Returns the count of characters in self, without joining the pieces. Also aliased as: size
+        """
+        return self._length
+
+    # ==> [alias]
+    size = length
+
+    # empty? RENAMED to empty
+    # https://ruby-doc.org/3.1.3/String.html#method-i-empty-3F
+    def empty(self) -> bool:
+        """
+        Returns whether the length of self is zero.
+        """
+        return self._length == 0
+
+    # include? RENAMED to include
+    # https://ruby-doc.org/3.1.3/String.html#method-i-include-3F
+    def include(self, other: StrLike) -> bool:
+        """
+        Returns whether self contains other.
+
+        Examples
+        --------
+        >>> String('foo').include('oo')
+        True
+        """
+        return other in self
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Modifying.
+    # -----------------------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-concat
+    def concat(self, *objects: StrLike | int) -> String:
+        """
+        Appends each of the objects to self, in amortized O(1) each; returns self.
+
+        Strings are appended as is, integers as the character with that codepoint.
+
+        Parameters
+        ----------
+        objects: str | String | int
+            The objects to append.
+
+        Returns
+        -------
+        Self
+            Returns self.
+
+        Examples
+        --------
+        >>> String('foo').concat('bar', 'baz')
+        'foobarbaz'
+        """
+        for obj in objects:
+            text = self.__text(obj)
+            if not text:
+                continue
+            self._tail.append(text)
+            self._length += len(text)
+            if len(self._tail) >= _TAIL_PIECES:
+                self._pieces.append("".join(self._tail))
+                self._tail = []
+        if objects:
+            self._cached = None
+        return self
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-prepend
+    def prepend(self, *objects: StrLike | int) -> String:
+        """
+        Prepends the objects to self, in amortized O(1) each; returns self.
+
+        Examples
+        --------
+        >>> String('baz').prepend('foo', 'bar')
+        'foobarbaz'
+        """
+        for obj in reversed(objects):
+            text = self.__text(obj)
+            if text:
+                self._pieces.appendleft(text)
+                self._length += len(text)
+        if objects:
+            self._cached = None
+        return self
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Iterating.
+    # -----------------------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-each_char
+    def each_char(self, *, block: Optional[Callable[[str], Any]] = None) -> String | Iterator[str]:
+        """
+        Calls the block with each successive character of self; returns self.
+        With no block, returns an iterator over the characters, streamed from the pieces.
+
+        Examples
+        --------
+        >>> list(String('ab') << 'c')
+        ['a', 'b', 'c']
+        """
+        chars = chain.from_iterable(self.__snapshot())
+        if block is None:
+            return chars
+        for char in chars:
+            block(char)
+        return self
+
+    # Private Method
+    # Lines of the pieces, streamed piece by piece without joining them.
+    @staticmethod
+    def __lines(pieces: Tuple[str, ...], separator: Optional[str], chomp: bool) -> Iterator[str]:
+        if separator is None:
+            yield from filter(None, pieces)
+            return
+        pending: List[str] = []
+        for piece in pieces:
+            start = 0
+            while True:
+                end = piece.find(separator, start)
+                if end < 0:
+                    break
+                pending.append(piece[start:end] if chomp else piece[start:end + len(separator)])
+                yield "".join(pending)
+                pending = []
+                start = end + len(separator)
+            if start < len(piece):
+                pending.append(piece[start:])
+        if pending:
+            yield "".join(pending)
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-each_line
+    def each_line(self, separator: Optional[str] = "\n", *, chomp: bool = False,
+                  block: Optional[Callable[[str], Any]] = None) -> String | Iterator[str]:
+        """
+        Calls the block with each successive line of self; returns self.
+        With no block, returns an iterator over the lines, streamed from the pieces.
+
+        Parameters
+        ----------
+        separator: Optional[str] = "\\n"
+            The line separator, None for the whole content as a single line.
+        chomp: bool = False
+            Whether the separator is removed from the end of each line.
+        block: Optional[Callable[[str], Any]] = None
+            The function in which each line will be passed.
+
+        Returns
+        -------
+        Self | Iterator[str]
+            Returns self with a block, an iterator of lines otherwise.
+
+        Examples
+        --------
+        >>> s = String('one\\n') << 'tw' << 'o\\nthree'
+        >>> list(s.each_line())
+        ['one\\n', 'two\\n', 'three']
+        >>> list(s.each_line(chomp=True))
+        ['one', 'two', 'three']
+        """
+        if separator == "":
+            raise ValueError("paragraph mode (empty separator) is not supported")
+        # A single character separator can't straddle two pieces, longer ones are searched in the joined content.
+        pieces = self.__snapshot() if separator is not None and len(separator) == 1 else (self.to_s(),)
+        lines = self.__lines(pieces, separator, chomp)
+        if block is None:
+            return lines
+        for line in lines:
+            block(line)
+        return self
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-scan
+    def scan(self, pattern: Union[str, re.Pattern], *,
+             block: Optional[Callable[[Any], Any]] = None) -> String | Iterator[Any]:
+        """
+        Matches pattern against self and calls the block with each match; returns self.
+        With no block, returns an iterator over the matches (Ruby returns an Array).
+
+        A str pattern is matched literally, a compiled re.Pattern as a regular expression.
+        Each match is the matched str, or a tuple of the groups when the pattern has groups.
+
+        Examples
+        --------
+        >>> import re
+        >>> list(String('cruel world').scan(re.compile(r'\\w+')))
+        ['cruel', 'world']
+        >>> list(String('a1 b2').scan(re.compile(r'(\\w)(\\d)')))
+        [('a', '1'), ('b', '2')]
+        >>> list(String('abab').scan('ab'))
+        ['ab', 'ab']
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(re.escape(pattern))
+        matches = (match.groups() if pattern.groups else match.group()
+                   for match in pattern.finditer(self.to_s()))
+        if block is None:
+            return matches
+        for match in matches:
+            block(match)
+        return self
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-unpack
+    def unpack(self, template: str, offset: int = 0) -> Any:
+        """
+        Extracts values from the UTF-8 bytes of self as directed by template, see rubylang.ruby_pack.unpack.
+
+        Examples
+        --------
+        >>> String('AB').unpack('C*')
+        [65, 66]
+        """
+        from .ruby_pack import unpack
+
+        return unpack(self.to_s().encode("utf-8"), template, offset)
+
+    # https://ruby-doc.org/3.1.3/String.html#method-i-unpack1
+    def unpack1(self, template: str, offset: int = 0) -> Any:
+        """
+        Like unpack, but returns only the first extracted value.
+        """
+        from .ruby_pack import unpack1
+
+        return unpack1(self.to_s().encode("utf-8"), template, offset)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
@@ -0,0 +1,341 @@
+from __future__ import annotations
+from typing import Optional, Any, Callable, Iterable, Union
+from array import array
+from functools import lru_cache
+from itertools import chain
+
+import math
+import warnings
+
+from .ruby_array import Array
+
+"""
+Typed numeric storage for Array, backed by the stdlib array module.
+
+Elements are stored unboxed (8 bytes per 'd' element instead of a pointer plus a float object),
+and queries run as bulk C-level operations. When NumPy is installed, queries run as vectorized
+NumPy operations over a zero-copy view of the buffer, with the same results as without NumPy.
+"""
+
+_RLDefault = Array._RLDefault
+
+# array module typecodes holding numbers. 'u' (wide char) is deliberately excluded.
+NUMERIC_TYPECODES = "bBhHiIlLqQfd"
+
+
+# NumPy is optional and slow to import, so it is imported by the first query instead of with the module.
+@lru_cache(maxsize=None)
+def _numpy() -> Optional[Any]:
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional, the stdlib array module is enough.
+        return None
+    return numpy
+
+
+def _is_ndarray(values: Any) -> bool:
+    np = _numpy()
+    return np is not None and isinstance(values, np.ndarray)
+
+
+class TypedArray(array):
+    """
+    Ruby Array of numbers stored in a typed, contiguous buffer.
+
+    Create one with Array.typed(typecode, data). The typecode is one of the array module
+    numeric typecodes: 'b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f' or 'd'.
+
+    Examples
+    --------
+    >>> arr = Array.typed('d', [1.0, 2.5, 0.0])
+    >>> arr.sum()
+    3.5
+    >>> arr.count(block=lambda x: x > 1)
+    1
+    """
+
+    def __new__(cls, typecode: str, value: Iterable = ()) -> TypedArray:
+        if typecode not in NUMERIC_TYPECODES:
+            raise ValueError(f"typecode must be one of {NUMERIC_TYPECODES!r}, not {typecode!r}")
+        return super().__new__(cls, typecode, value)
+
+    def __repr__(self) -> str:
+        return f"Array.typed({self.typecode!r}, {self.tolist()!r})"
+
+    # Private Method
+    # Zero-copy NumPy view over the buffer, None when NumPy is missing or self is empty.
+    # The view pins the buffer, so it must not outlive the calling method.
+    def __view(self) -> Optional[Any]:
+        np = _numpy()
+        if np is None or not self:
+            return None
+        return np.frombuffer(self, dtype=self.typecode)
+
+    # Private Method
+    # Vectorized element == obj mask, None when obj can't be compared in bulk.
+    def __equal_mask(self, obj: Any) -> Optional[Any]:
+        view = self.__view()
+        if view is None or isinstance(obj, bool) or not isinstance(obj, (int, float)):
+            return None
+        try:
+            return view == obj
+        except (OverflowError, TypeError):
+            return None
+
+    # Private Method
+    # Bulk truthiness of each element, or of each block result.
+    # A vectorized block is called once with the whole NumPy view instead of once per element.
+    def __truth_values(self, obj: Any, block: Optional[Callable[[Any], Any]], vectorized: bool) -> Any:
+        if not isinstance(obj, _RLDefault):
+            if block:
+                warnings.warn("Both argument and block is given. block will be ignored")
+            mask = self.__equal_mask(obj)
+            return mask if mask is not None else (val == obj for val in self)
+
+        if block is None:
+            view = self.__view()
+            return view if view is not None else self
+
+        if vectorized:
+            view = self.__view()
+            if view is not None:
+                return _numpy().asarray(block(view), dtype=bool)
+        return map(block, self)
+
+    def to_a(self) -> Array:
+        """
+        Returns a list backed Array with the elements of self.
+
+        Examples
+        --------
+        >>> Array.typed('i', [1, 2]).to_a()
+        [1, 2]
+        """
+        return Array(self.tolist())
+
+    # -----------------------------------------------------------------------------------------------
+    # Methods for Querying.
+    # https://docs.ruby-lang.org/en/master/Array.html#class-Array-label-Methods+for+Querying
+    # -----------------------------------------------------------------------------------------------
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-length
+    def length(self) -> int:
+        """
+        The length or size of the Array. Also aliased as: size
+
+        Examples
+        --------
+        >>> Array.typed('d', [1.0, 2.0]).length()
+        2
+        """
+        return len(self)
+
+    # ==> [alias]
+    size = length
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-empty-3F
+    def empty(self) -> bool:
+        """
+        Returns whether there are no elements.
+
+        Examples
+        --------
+        >>> Array.typed('d', []).empty()
+        True
+        """
+        return not bool(self)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-include-3F
+    def include(self, item: object) -> bool:
+        """
+        Returns whether any element == a given object.
+
+        Examples
+        --------
+        >>> Array.typed('i', [1, 2, 3]).include(2)
+        True
+        >>> Array.typed('i', [1, 2, 3]).include('2')
+        False
+        """
+        mask = self.__equal_mask(item)
+        if mask is not None:
+            return bool(mask.any())
+        return item in self
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-all-3F
+    def all(self, obj: Optional[Any] = _RLDefault(None), *,
+            block: Optional[Callable[[Any], Any]] = None, vectorized: bool = False) -> bool:
+        """
+        Returns whether all elements meet a given criterion. See Array.all
+
+        With vectorized=True and NumPy installed, block is called once with a NumPy array of all
+        the elements and must return an array of booleans, e.g. lambda x: x > 0.
+
+        Examples
+        --------
+        >>> Array.typed('d', [1.0, 0.0]).all()
+        False
+        >>> Array.typed('d', [1.0, 2.0]).all(block=lambda x: x > 0, vectorized=True)
+        True
+        """
+        values = self.__truth_values(obj, block, vectorized)
+        return bool(values.all()) if _is_ndarray(values) else all(values)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-any-3F
+    def any(self, obj: Optional[Any] = _RLDefault(None), *,
+            block: Optional[Callable[[Any], Any]] = None, vectorized: bool = False) -> bool:
+        """
+        Returns whether any element meets a given criterion. See Array.any and TypedArray.all
+
+        Examples
+        --------
+        >>> Array.typed('i', [0, 0, 3]).any()
+        True
+        >>> Array.typed('i', [0, 0, 3]).any(4)
+        False
+        """
+        values = self.__truth_values(obj, block, vectorized)
+        return bool(values.any()) if _is_ndarray(values) else any(values)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-none-3F
+    def none(self, obj: Optional[Any] = _RLDefault(None), *,
+             block: Optional[Callable[[Any], Any]] = None, vectorized: bool = False) -> bool:
+        """
+        Returns whether no element meets a given criterion. See Array.none and TypedArray.all
+
+        Examples
+        --------
+        >>> Array.typed('i', [0, 0]).none()
+        True
+        """
+        return not self.any(obj, block=block, vectorized=vectorized)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-count
+    def count(self, obj: Optional[Any] = _RLDefault(None), *,
+              block: Optional[Callable[[Any], Any]] = None, vectorized: bool = False) -> int:
+        """
+        Returns the count of elements that meet a given criterion. See Array.count and TypedArray.all
+
+        Examples
+        --------
+        >>> Array.typed('i', [0, 1, 2, 0]).count(0)
+        2
+        >>> Array.typed('d', [0.5, 1.5, 2.5]).count(block=lambda x: x > 1, vectorized=True)
+        2
+        """
+        if isinstance(obj, _RLDefault) and block is None:
+            return len(self)
+        if not isinstance(obj, _RLDefault) and block is None:
+            mask = self.__equal_mask(obj)
+            return int(_numpy().count_nonzero(mask)) if mask is not None else super().count(obj)
+
+        values = self.__truth_values(obj, block, vectorized)
+        if _is_ndarray(values):
+            return int(_numpy().count_nonzero(values))
+        return sum(1 for val in values if val)
+
+    # https://docs.ruby-lang.org/en/master/Array.html#method-i-index
+    def index(self, obj: Optional[Any] = _RLDefault(None), *,
+              block: Optional[Callable[[Any], Any]] = None,
+              start: Optional[int] = None,
+              stop: Optional[int] = None) -> Union[int, None, Iterable]:
+        """
+        Returns the index of the first element that meets a given criterion. See Array.index
+
+        Examples
+        --------
+        >>> Array.typed('i', [5, 6, 7, 6]).index(6)
+        1
+        >>> Array.typed('i', [5, 6, 7, 6]).index(6, start=2)
+        3
+        >>> Array.typed('i', [5, 6, 7]).index(block=lambda x: x > 5)
+        1
+        """
+        if isinstance(obj, _RLDefault) and block is None:
+            return iter(self)
+        if not isinstance(obj, _RLDefault) and block:
+            warnings.warn("Ignoring Block since both block and argument is passed.")
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return None
+
+        if not isinstance(obj, _RLDefault):
+            # array.index stops at the first hit and runs in C.
+            try:
+                return super().index(obj, start, stop)
+            except ValueError:
+                return None
+
+        for i in range(start, stop):
+            if block(self[i]):
+                return i
+        return None
+
+    # ==> [alias]
+    find_index = index
+
+    # ---------------------------------------------------------------------------------
+    #   Methods for Computing
+    # ---------------------------------------------------------------------------------
+
+    # https://ruby-doc.org/3.1.3/Array.html#method-i-sum
+    def sum(self, init: Union[int, float] = 0) -> Union[int, float]:
+        """
+        Returns the sum of init and all elements.
+
+        Integer arrays are summed exactly, float arrays with math.fsum, in double precision and
+        correctly rounded, so the result does not depend on whether NumPy is installed.
+
+        Examples
+        --------
+        >>> Array.typed('i', [1, 2, 3]).sum()
+        6
+        >>> Array.typed('i', [1, 2, 3]).sum(10)
+        16
+        >>> Array.typed('d', [0.1] * 10).sum()
+        1.0
+        """
+        if self.typecode in "fd":
+            return math.fsum(chain((init,), self))
+        return sum(self, init)
+
+    # https://ruby-doc.org/3.1.3/Array.html#method-i-min
+    def min(self) -> Union[int, float, None]:
+        """
+        Returns the element with the minimum value, None if self is empty.
+
+        Examples
+        --------
+        >>> Array.typed('d', [2.0, -1.5, 3.0]).min()
+        -1.5
+        >>> Array.typed('d', []).min() is None
+        True
+        """
+        view = self.__view()
+        if view is not None:
+            return view.min().item()
+        return min(self, default=None)
+
+    # https://ruby-doc.org/3.1.3/Array.html#method-i-max
+    def max(self) -> Union[int, float, None]:
+        """
+        Returns the element with the maximum value, None if self is empty.
+
+        Examples
+        --------
+        >>> Array.typed('d', [2.0, -1.5, 3.0]).max()
+        3.0
+        """
+        view = self.__view()
+        if view is not None:
+            return view.max().item()
+        return max(self, default=None)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    test_result = doctest.testmod()
+    print(f"Attempted : {test_result.attempted}")
+    print(f"Failed : {test_result.failed}")
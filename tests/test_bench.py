@@ -0,0 +1,42 @@
+import json
+
+from rubylang import bench
+
+
+def test_run_covers_every_public_method():
+    results = bench.run(sizes=[10], kinds=["ints", "nested"], repeat=1, min_time=0)
+    assert results["uncovered"] == []
+    entries = {(entry["method"], entry["kind"]) for entry in results["results"]}
+    assert ("include", "nested") in entries
+    assert {("parallel", "ints"), ("parallel[workers=2]", "ints"), ("parallel[workers=4]", "ints")} <= entries
+    assert len(entries) == sum(len({"ints", "nested"} & set(case.kinds or bench.KINDS))
+                               for case in bench.CASES.values())
+    json.dumps(results)
+
+
+def test_compare_flags_regressions():
+    results = bench.run(sizes=[10], kinds=["ints"], methods=["length", "include"], repeat=1, min_time=0)
+    baseline = json.loads(json.dumps(results))
+    baseline["results"][0]["ruby_seconds"] /= 10
+    regressions = bench.compare(results, baseline, tolerance=0.5)
+    assert [entry["method"] for entry in regressions] == [results["results"][0]["method"]]
+
+
+def test_main_writes_json(tmp_path):
+    output = tmp_path / "results.json"
+    status = bench.main(["--sizes", "10", "--methods", "length", "--kinds", "ints",
+                         "--repeat", "1", "--min-time", "0", "--output", str(output)])
+    assert status == 0
+    assert json.loads(output.read_text())["results"][0]["method"] == "length"
+
+    status = bench.main(["--sizes", "10", "--methods", "length", "--kinds", "ints", "--repeat", "1",
+                         "--min-time", "0", "--output", str(tmp_path / "again.json"),
+                         "--baseline", str(output), "--tolerance", "1000"])
+    assert status == 0
+
+
+def test_max_size_caps_slow_cases():
+    sizes = [10, bench._PARALLEL_MAX_SIZE + 1]
+    results = bench.run(sizes=sizes, kinds=["ints"], methods=["length", "parallel"], repeat=1, min_time=0)
+    entries = {(entry["method"], entry["size"]) for entry in results["results"]}
+    assert entries == {("length", 10), ("length", sizes[1]), ("parallel", 10)}
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import rubylang
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative microseconds `import rubylang` may take, the best of a few runs to absorb noise.
+IMPORT_BUDGET_US = 25_000
+# Modules that must wait until the feature needing them is used.
+DEFERRED = {"numpy", "asyncio", "concurrent.futures", "multiprocessing", "mmap", "struct"}
+
+
+def _import_times(code):
+    # {module: cumulative microseconds} of the modules imported by running code.
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True, cwd=ROOT)
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.partition("import time:")[2].split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def _new_modules(code):
+    return set(_import_times(code)) - set(_import_times("pass"))
+
+
+def test_import_imports_nothing_else():
+    assert _new_modules("import rubylang") == {"rubylang"}
+
+
+def test_import_time_budget():
+    best = min(_import_times("import rubylang")["rubylang"] for _ in range(3))
+    assert best <= IMPORT_BUDGET_US
+
+
+def test_array_does_not_import_optional_backends():
+    assert not _new_modules("import rubylang; rubylang.Array") & DEFERRED
+
+
+def test_lazy_attributes():
+    from rubylang.ruby_array import Array
+
+    assert rubylang.Array is Array
+    assert "SortedArray" in dir(rubylang) and set(rubylang.__all__) <= set(dir(rubylang))
+    with pytest.raises(AttributeError):
+        rubylang.NotAClass
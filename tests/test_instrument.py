@@ -0,0 +1,76 @@
+import asyncio
+
+from rubylang import instrument
+from rubylang.ruby_array import Array
+
+
+def test_disabled_has_no_wrappers():
+    original = Array.any
+    with instrument.measure():
+        assert Array.any is not original
+    assert Array.any is original
+    assert instrument.enabled() is False
+
+
+def test_enable_records_outermost_calls():
+    records = []
+    instrument.reset()
+    instrument.enable(callback=lambda name, record: records.append(name))
+    try:
+        arr = Array([1, 2, 3])
+        arr.none(block=lambda x: x > 5)
+        arr.push(4)
+        arr.include(2)
+    finally:
+        instrument.disable()
+
+    snapshot = instrument.snapshot(reset=True)
+    assert set(snapshot) == {"none", "push", "include"}
+    assert snapshot["none"] == {"calls": 1, "receiver_length": 3, "block_calls": 3,
+                                "seconds": snapshot["none"]["seconds"]}
+    assert snapshot["push"]["receiver_length"] == 4
+    assert records == ["none", "push", "include"]
+    assert instrument.snapshot() == {}
+
+    Array([1]).any()
+    assert instrument.snapshot() == {}
+
+
+def test_measure_is_scoped():
+    with instrument.measure() as outer:
+        Array([1, 2]).count(block=bool)
+        with instrument.measure() as inner:
+            Array([1, 2]).count(1)
+    assert outer.snapshot()["count"]["calls"] == 2
+    assert outer.snapshot()["count"]["block_calls"] == 2
+    assert inner.snapshot()["count"]["calls"] == 1
+    assert instrument.snapshot() == {}
+
+
+def test_async_methods_are_timed_until_done():
+    async def slow(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    with instrument.measure() as stats:
+        asyncio.run(Array([1, 2]).async_map(block=slow))
+    record = stats.snapshot()["async_map"]
+    assert record["block_calls"] == 2
+    assert record["seconds"] >= 0.01
+
+
+def test_storage_class_overrides_are_recorded():
+    from rubylang.ruby_deque_array import DequeArray
+    from rubylang.ruby_sorted_array import SortedArray
+
+    original = DequeArray.rotate_bang
+    with instrument.measure() as stats:
+        assert DequeArray.rotate_bang is not original
+        DequeArray([1, 2, 3]).rotate_bang()
+        Array.typed('q', [1, 2, 3]).count(block=lambda x: x > 1)
+        SortedArray([3, 1, 2]).include(2)
+    assert DequeArray.rotate_bang is original
+    snapshot = stats.snapshot()
+    assert snapshot["rotate_bang"]["calls"] == 1
+    assert snapshot["count"]["block_calls"] == 3
+    assert snapshot["include"]["receiver_length"] == 3
@@ -56,12 +56,575 @@ def test_empty():
     assert Array([1]).empty() is False
 
 
+def test_predicates_short_circuit():
+    calls = []
 
+    def record(value):
+        calls.append(value)
+        return value > 1
 
+    arr = Array([5, 0, 1, 2, 3])
+    assert arr.any(block=record) is True
+    assert calls == [5]
 
+    calls.clear()
+    assert arr.all(block=record) is False
+    assert calls == [5, 0]
 
+    calls.clear()
+    assert arr.one(block=record) is False
+    assert calls == [5, 0, 1, 2]
 
+    calls.clear()
+    assert arr.count(block=record) == 3
+    assert calls == [5, 0, 1, 2, 3]
 
 
+def test_predicates_with_object():
+    assert Array([1, 2, 1]).count(1) == 2
+    assert Array([1, 2, 1]).one(2) is True
+    assert Array([1, 2, 1]).one(1) is False
+    assert Array([]).one() is False
+    assert Array([]).all() is True
+    assert Array([]).count(block=bool) == 0
 
 
+def test_index_stops_at_first_hit():
+    calls = []
+
+    def record(value):
+        calls.append(value)
+        return value == 'bar'
+
+    arr = Array(['foo', 'bar', 2, 'bar'])
+    assert arr.index(block=record) == 1
+    assert calls == ['foo', 'bar']
+
+    calls.clear()
+    assert arr.rindex(block=record) == 3
+    assert calls == ['bar']
+
+
+def test_index_bounds():
+    arr = Array([1, 2, 1, 2, 1])
+    assert arr.index(1, start=1) == 2
+    assert arr.index(1, start=-2) == 4
+    assert arr.index(2, start=4) is None
+    assert arr.rindex(1, stop=4) == 2
+    assert arr.rindex(2, start=4) is None
+    assert arr.rindex(block=lambda x: x == 1, start=1, stop=-1) == 2
+    assert arr.find_index(block=lambda x: x == 2, start=2) == 3
+    assert Array([]).rindex(1) is None
+
+
+def test_unshift_bulk():
+    a = Array([1, 2])
+    assert a.unshift() is a
+    assert a.prepend(-1, 0) == [-1, 0, 1, 2]
+
+
+def test_build_index_lookups():
+    a = Array(['cat', 99, 'a', Array([1, 2, 3]), {"class": "Hash"}, 99]).build_index()
+    assert a.include('cat') is True
+    assert a.include('dog') is False
+    assert a.include([1, 2, 3]) is True
+    assert a.include({"class": "Hash"}) is True
+    assert a.index(99) == 1
+    assert a.index(99, start=2) == 5
+    assert a.index(99, start=2, stop=5) is None
+    assert a.rindex(99) == 5
+    assert a.rindex(99, stop=5) == 1
+    assert a.rindex(99, start=2, stop=5) is None
+    assert a.count(99) == 2
+    assert a.count([1, 2, 3]) == 1
+
+
+def test_build_index_unhashable_elements():
+    a = Array([{1}, 2, [3, [4]], {'k': [5]}]).build_index()
+    assert a.include(frozenset({1})) is True and a.index(frozenset({1})) == 0
+    assert a.include((3, [4])) is False and a.include(Array([3, [4]]).freeze()) is True
+    assert a.index({'k': [5]}) == 3 and a.count([3, [4]]) == 1
+    assert a.push([3, [4]]).rindex([3, [4]]) == 4
+
+    class Unkeyed:
+        __hash__ = None
+
+        def __eq__(self, other):
+            return other == 'anything'
+
+    b = Array([1, Unkeyed()]).build_index()
+    assert b.include('anything') is True and b.index('anything') == 1
+    assert b.include(Unkeyed()) is Array([1, Unkeyed()]).include(Unkeyed())
+
+
+def test_build_index_follows_mutations():
+    a = Array([1, 2, 3]).build_index()
+    a.push(1)
+    assert a.rindex(1) == 3
+    a += [1]
+    assert a.count(1) == 3
+    a.unshift(0)
+    assert a.index(1) == 1
+    a.insert(0, 1)
+    assert a.index(1) == 0
+    a[0] = 5
+    assert a.index(5) == 0
+    assert a.count(1) == 3
+    del a[0]
+    assert a.index(5) is None
+    a.pop()
+    a.remove(2)
+    assert a.count(1) == 2
+    assert a.index(3) == 2
+    a.reverse()
+    assert a.index(0) == 3
+    a.sort()
+    assert a.index(0) == 0
+    a.clear()
+    assert a.include(0) is False
+    assert a.drop_index().push(0).include(0) is True
+
+
+def test_build_index_not_shared_with_copies():
+    import copy
+
+    a = Array([1, 2]).build_index()
+    b = copy.copy(a)
+    b.push(1)
+    assert a.count(1) == 1
+    assert b.count(1) == 2
+
+
+def test_ordering_calls_block_once_per_element():
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return -value
+
+    arr = Array([3, 1, 4, 1, 5, 9, 2, 6])
+    assert arr.sort_by(block=key) == [9, 6, 5, 4, 3, 2, 1, 1]
+    assert len(calls) == len(arr)
+
+    for method in (arr.min_by, arr.max_by):
+        calls.clear()
+        method(3, block=key)
+        assert len(calls) == len(arr)
+
+
+def test_top_n():
+    arr = Array([3, 1, 4, 1, 5, 9, 2, 6])
+    assert arr.min(3) == [1, 1, 2]
+    assert arr.max(3) == [9, 6, 5]
+    assert arr.max(0) == []
+    assert arr.max(100) == sorted(arr, reverse=True)
+    assert arr.min_by(2, block=lambda x: -x) == [9, 6]
+    assert arr.max_by(block=lambda x: -x) == 1
+    assert arr.minmax() == [1, 9]
+    assert Array([]).minmax() == [None, None]
+    assert Array([]).min(2) == []
+
+
+def test_ordering_stability_and_errors():
+    import pytest
+
+    words = Array(['bb', 'a', 'cc', 'd'])
+    assert words.sort_by(block=len) == ['a', 'd', 'bb', 'cc']
+    assert words.min_by(2, block=len) == ['a', 'd']
+
+    mixed = Array([1, "Second", {"class": "Hash"}])
+    with pytest.raises(TypeError, match="comparison of int with str failed"):
+        mixed.max()
+    with pytest.raises(TypeError, match="comparison of int with str failed"):
+        mixed.min(2)
+    with pytest.raises(TypeError, match="comparison of int with str failed"):
+        mixed.sort_by(block=lambda x: x)
+    with pytest.raises(ValueError):
+        Array([1]).min(-1)
+    assert mixed == [1, "Second", {"class": "Hash"}]
+
+
+def test_grouping():
+    arr = Array([3, 1, 4, 1, 5, 9, 2, 6])
+    groups = arr.group_by(block=lambda x: x % 3)
+    assert groups == {0: [3, 9, 6], 1: [1, 4, 1], 2: [5, 2]}
+    assert all(isinstance(group, Array) for group in groups.values())
+    assert arr.tally() == {3: 1, 1: 2, 4: 1, 5: 1, 9: 1, 2: 1, 6: 1}
+    assert arr.partition(block=lambda x: x > 3) == [[4, 5, 9, 6], [3, 1, 1, 2]]
+    assert Array([]).partition(block=bool) == [[], []]
+    assert Array([]).tally() == {}
+
+
+def test_chunks():
+    arr = Array([1, 2, 4, 9, 10, 11, 12, 15, 16, 19, 20, 21])
+    chunks = list(arr.chunk_while(block=lambda a, b: b == a + 1))
+    assert chunks == [[1, 2], [4], [9, 10, 11, 12], [15, 16], [19, 20, 21]]
+    assert list(arr.slice_when(block=lambda a, b: b != a + 1)) == chunks
+    assert list(Array([]).chunk_while(block=lambda a, b: True)) == []
+    assert list(Array([1]).slice_when(block=lambda a, b: True)) == [[1]]
+
+
+def test_each_slice_and_each_cons():
+    import types
+
+    arr = Array(range(7))
+    slices = arr.each_slice(3)
+    assert isinstance(slices, types.GeneratorType)
+    assert next(slices) == [0, 1, 2]
+    assert list(slices) == [[3, 4, 5], [6]]
+    assert list(arr.each_cons(6)) == [[0, 1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 6]]
+    assert list(arr.each_cons(8)) == []
+
+    seen = []
+    assert arr.each_cons(2, block=seen.append) is arr
+    assert len(seen) == 6
+    assert arr.each_slice(10, block=seen.append) is arr
+    assert seen[-1] == list(range(7))
+
+
+def test_set_operations():
+    a = Array([1, 1, 2, 3, 2, 4])
+    assert a.uniq() == [1, 2, 3, 4]
+    assert a.difference([2], [4]) == [1, 1, 3]
+    assert a - [1] == [2, 3, 2, 4]
+    assert a.intersection([4, 2, 9], [2, 4]) == [2, 4]
+    assert a & [3, 1] == [1, 3]
+    assert a.union([5, 1], [6]) == [1, 2, 3, 4, 5, 6]
+    assert a | [0] == [1, 2, 3, 4, 0]
+    assert a.intersect([9, 4]) is True
+    assert a.intersect([]) is False
+    assert isinstance(a | [0], Array)
+
+
+def test_set_operations_unhashable():
+    mixed = Array([1, "Second", {"class": "Hash"}, [1, [2]], {"class": "Hash"}, [1, [2]], (1, [2])])
+    assert mixed.uniq() == [1, "Second", {"class": "Hash"}, [1, [2]], (1, [2])]
+    assert mixed - [{"class": "Hash"}, (1, [2])] == [1, "Second", [1, [2]], [1, [2]]]
+    assert mixed & [[1, [2]]] == [[1, [2]]]
+    assert mixed.intersect([{"class": "Hash"}]) is True
+    # A list is never equal to a tuple with the same contents.
+    assert Array([[1, 2]]).intersect([(1, 2)]) is False
+    # Numbers equal across types stay equal inside containers.
+    assert Array([[1], [1.0], [True]]).uniq() == [[1]]
+    # Dict equality ignores insertion order.
+    assert Array([{"a": [1], "b": 2}, {"b": 2, "a": [1]}]).uniq() == [{"a": [1], "b": 2}]
+
+
+def test_set_operations_uncanonical_fallback():
+    class Unhashable:
+        __hash__ = None
+
+        def __init__(self, value):
+            self.value = value
+
+        def __eq__(self, other):
+            return isinstance(other, Unhashable) and self.value == other.value
+
+    arr = Array([Unhashable(1), Unhashable(1), Unhashable(2), 3])
+    assert [getattr(val, "value", val) for val in arr.uniq()] == [1, 2, 3]
+    assert len(arr - [Unhashable(1)]) == 2
+
+
+def test_uniq_bang():
+    a = Array(['a', 'aa', 'b', 'bb']).build_index()
+    assert a.uniq_bang(block=len) is a
+    assert a == ['a', 'aa']
+    assert a.index('b') is None
+    assert a.uniq_bang(block=len) is None
+
+
+def test_flatten_deep_nesting():
+    import sys
+
+    nested = Array([0])
+    innermost = nested
+    for i in range(1, sys.getrecursionlimit() * 20):
+        inner = [i]
+        innermost.append(inner)
+        innermost = inner
+    flat = nested.flatten()
+    assert isinstance(flat, Array)
+    assert flat == list(range(sys.getrecursionlimit() * 20))
+    assert nested.flatten(2)[:3] == [0, 1, 2]
+
+
+def test_flatten_depth():
+    a = Array([0, [1, [2, [3]]], [], 4])
+    assert a.flatten(0) == a
+    assert a.flatten(0) is not a
+    assert a.flatten(1) == [0, 1, [2, [3]], 4]
+    assert a.flatten(2) == [0, 1, 2, [3], 4]
+    assert a.flatten(-1) == [0, 1, 2, 3, 4]
+    assert list(a.each_flat(1)) == [0, 1, [2, [3]], 4]
+    assert Array([(1, [2])]).flatten() == [(1, [2])]
+
+
+def test_flatten_recursive():
+    import pytest
+
+    a = Array([1])
+    a.push([2, a])
+    with pytest.raises(ValueError, match="recursive"):
+        a.flatten()
+    assert a.flatten(1)[:2] == [1, 2]
+    # The same list twice, side by side, is not recursion.
+    shared = [1]
+    assert Array([shared, shared]).flatten() == [1, 1]
+
+
+def test_flatten_bang():
+    a = Array([0, [1], 2])
+    assert a.flatten_bang(0) is None
+    assert a.flatten_bang() is a
+    assert a == [0, 1, 2]
+    assert a.flatten_bang() is None
+
+
+def test_in_place_filters():
+    arr = Array(range(10))
+    assert arr.select_bang(block=lambda x: x % 2 == 0) is arr and arr == [0, 2, 4, 6, 8]
+    assert arr.filter_bang(block=lambda x: True) is None
+    assert arr.reject_bang(block=lambda x: x > 4) is arr and arr == [0, 2, 4]
+    assert arr.reject_bang(block=lambda x: x > 4) is None
+    assert arr.keep_if(block=bool) is arr and arr == [2, 4]
+    assert arr.delete_if(block=lambda x: x == 2) is arr and arr == [4]
+    assert list(arr.select_bang()) == [4]
+
+    arr = Array([1, None, 2, None])
+    assert arr.compact_bang() == [1, 2] and arr.compact_bang() is None
+
+    arr = Array([1, 1.0, 2, 1])
+    assert arr.delete(1) == 1 and arr == [2]
+    assert arr.delete(3) is None and arr.delete(3, block=lambda x: -x) == -3
+    nan = float('nan')
+    arr = Array([nan, 1, nan])
+    assert arr.include(arr[0]) and arr.delete(arr[0]) is nan and arr == [1]
+    assert Array([nan]).delete(float('nan')) is None
+
+    arr = Array([1, 2, 3])
+    assert arr.map_bang(block=lambda x: x * 2) is arr and arr == [2, 4, 6]
+    assert arr.collect_bang(block=str) == ['2', '4', '6']
+
+
+def test_in_place_filters_keep_index_and_unread_elements():
+    import pytest
+
+    arr = Array([1, 2, 3, 4, 5]).build_index()
+    arr.select_bang(block=lambda x: x != 2)
+    assert arr.index(4) == 2 and arr.include(2) is False
+
+    def fails_at_four(x):
+        if x == 4:
+            raise ValueError
+        return x != 3
+
+    with pytest.raises(ValueError):
+        arr.select_bang(block=fails_at_four)
+    assert arr == [1, 4, 5] and arr.index(5) == 2
+
+
+def test_slice_bang():
+    arr = Array(range(6))
+    assert arr.slice_bang(0) == 0 and arr.slice_bang(-1) == 5 and arr == [1, 2, 3, 4]
+    assert arr.slice_bang(10) is None and arr.slice_bang(-10) is None
+    assert arr.slice_bang(1, 2) == [2, 3] and arr == [1, 4]
+    assert arr.slice_bang(2, 5) == [] and arr.slice_bang(3, 1) is None and arr.slice_bang(0, -1) is None
+    assert arr.slice_bang(slice(0, 1)) == [1] and arr == [4]
+    assert isinstance(arr.slice_bang(slice(0, 1)), Array) and arr == []
+
+
+def _nested(depth, leaf):
+    nested = [leaf]
+    for _ in range(depth):
+        nested = [nested]
+    return nested
+
+
+def test_compare_and_mismatch():
+    from rubylang import ruby_array
+
+    size = 3 * ruby_array._COMPARE_CHUNK + 5
+    arr = Array(range(size))
+    other = list(range(size))
+    assert arr.compare(other) == 0 and arr.eql(other) and arr.mismatch(other) is None
+    other[-2] = -1
+    assert arr.compare(other) == 1 and arr.mismatch(other) == (size - 2,)
+    assert arr.compare(other[:-2]) == 1 and arr.mismatch(other[:-2]) == (size - 2,)
+    assert Array([1, 2]).compare([1, 2, 0]) == -1 and Array([1, 2]).mismatch([1, 2, 0]) == (2,)
+    assert Array([1, [2, [3]]]).compare([1, [2, [4]]]) == -1
+    assert Array([1, [2, [3]]]).mismatch([1, [2, [4]]]) == (1, 1, 0)
+    assert Array([1, 'a']).compare([1, 2]) is None and Array([{1}]).compare([{2}]) is None
+    assert Array([1]).compare('1') is None and not Array([1]).eql((1,))
+    nan = float('nan')
+    assert Array([nan, 1]).compare([nan, 2]) == -1 and Array([1, 1.0]).compare([1.0, 1]) == 0
+
+
+def test_compare_deep_and_recursive():
+    import pytest
+
+    deep = Array(_nested(20_000, 1))
+    assert deep.eql(_nested(20_000, 1)) and deep.compare(_nested(20_000, 1)) == 0
+    assert not deep.eql(_nested(20_000, 2)) and deep.compare(_nested(20_000, 2)) == -1
+    assert deep.mismatch(_nested(20_000, 2)) == (0,) * 20_001
+    left, right = Array([1]), Array([1])
+    left.append(left)
+    right.append(right)
+    assert left.compare(right) == 0 and left.mismatch(right) is None
+    with pytest.raises(TypeError):
+        Array([1]).mismatch(1)
+
+
+def test_new():
+    import pytest
+
+    assert Array.new() == [] and isinstance(Array.new(), Array)
+    assert Array.new(0) == [] and Array.new(2) == [None, None]
+    shared = Array.new(3, {})
+    shared[0]['a'] = 1
+    assert shared == [{'a': 1}] * 3 and shared[1] is shared[2]
+    assert Array.new(5, block=str) == ['0', '1', '2', '3', '4']
+    with pytest.warns(UserWarning):
+        assert Array.new(2, 'x', block=lambda i: i) == [0, 1]
+    assert Array.new((x for x in 'ab')) == ['a', 'b']
+    with pytest.raises(ValueError):
+        Array.new(-1)
+    from rubylang import SortedArray
+    assert isinstance(SortedArray.new(3, block=lambda i: -i), SortedArray)
+    assert SortedArray.new(3, block=lambda i: -i) == [-2, -1, 0]
+
+
+def test_try_convert_and_from_iter():
+    import pytest
+
+    arr = Array([1, 2])
+    assert Array.try_convert(arr) is arr
+    converted = Array.try_convert([1, 2])
+    assert isinstance(converted, Array) and converted == [1, 2]
+    assert Array.try_convert((1, 2)) is None and Array.try_convert(None) is None
+
+    class Listish:
+        def __init__(self, result):
+            self.result = result
+
+        def to_ary(self):
+            return self.result
+
+    assert Array.try_convert(Listish(arr)) is arr and Array.try_convert(Listish([3])) == [3]
+    with pytest.raises(TypeError):
+        Array.try_convert(Listish('nope'))
+
+    assert Array.from_iter((i for i in range(5)), size_hint=5) == list(range(5))
+    assert Array.from_iter((i for i in range(5)), size_hint=2) == list(range(5))
+    assert Array.from_iter((i for i in range(2)), size_hint=100) == [0, 1]
+    assert isinstance(Array.from_iter(iter('ab')), Array)
+    with pytest.raises(ValueError):
+        Array.from_iter([], size_hint=-1)
+
+
+def test_combinatorics():
+    from rubylang import Enumerator
+
+    arr = Array([1, 2, 3])
+    combinations = arr.combination(2)
+    assert isinstance(combinations, Enumerator)
+    assert combinations.size() == 3
+    assert combinations.to_a() == [(1, 2), (1, 3), (2, 3)]
+    assert list(combinations) == list(combinations)
+    assert arr.combination(0).to_a() == [()]
+    assert arr.combination(4).size() == 0 and arr.combination(4).to_a() == []
+    assert arr.combination(-1).size() == 0 and arr.combination(-1).to_a() == []
+
+    assert arr.permutation().size() == 6
+    assert arr.permutation(1).to_a() == [(1,), (2,), (3,)]
+    assert arr.permutation(-1).to_a() == []
+    assert arr.repeated_combination(2).size() == len(arr.repeated_combination(2).to_a()) == 6
+    assert arr.repeated_combination(0).size() == 1
+    assert Array([]).repeated_combination(2).size() == 0
+    assert arr.repeated_permutation(2).size() == len(arr.repeated_permutation(2).to_a()) == 9
+    assert arr.product([4, 5], []).size() == 0
+    assert arr.product().to_a() == [(1,), (2,), (3,)]
+
+    # Sizes are computed, values are only produced on demand.
+    big = Array(range(1000))
+    assert big.repeated_permutation(10).size() == 1000 ** 10
+    assert big.permutation(500).first() == tuple(range(500))
+
+    seen = []
+    assert arr.combination(2, block=seen.append) is arr
+    assert arr.product([0], block=seen.append) is arr
+    assert seen == [(1, 2), (1, 3), (2, 3), (1, 0), (2, 0), (3, 0)]
+
+    # The enumerator reads the current contents of self when iterated.
+    lazy_pairs = arr.combination(2)
+    arr.push(4)
+    assert lazy_pairs.size() == 6
+
+
+def test_freeze():
+    import pytest
+    from rubylang.ruby_array import FrozenError
+
+    arr = Array([3, 1, 2])
+    assert arr.freeze() is arr and arr.frozen()
+    mutations = [
+        lambda: arr.push(4), lambda: arr.append(4), lambda: arr.unshift(0), lambda: arr.insert(0, 0),
+        lambda: arr.extend([4]), lambda: arr.__iadd__([4]), lambda: arr.__imul__(2), lambda: arr.pop(),
+        lambda: arr.remove(1), lambda: arr.clear(), lambda: arr.sort(), lambda: arr.reverse(),
+        lambda: arr.__setitem__(0, 9), lambda: arr.__delitem__(0), lambda: arr.flatten_bang(),
+        lambda: arr.uniq_bang(), lambda: arr.select_bang(block=bool), lambda: arr.keep_if(block=bool),
+        lambda: arr.reject_bang(block=bool), lambda: arr.delete_if(block=bool), lambda: arr.delete(5),
+        lambda: arr.compact_bang(), lambda: arr.map_bang(block=str), lambda: arr.slice_bang(5),
+    ]
+    for mutate in mutations:
+        with pytest.raises(FrozenError):
+            mutate()
+    assert arr == [3, 1, 2]
+    assert isinstance(FrozenError("x"), RuntimeError)
+
+
+def test_hash():
+    import pytest
+
+    assert Array([1, [2], {'a': 3}]).hash() == Array([1.0, [2], {'a': 3}]).hash()
+    assert Array([1, 2]).hash() != Array([2, 1]).hash()
+    with pytest.raises(TypeError):
+        hash(Array([1]))
+
+    memo = {Array([1, 2]).freeze(): 'a'}
+    assert memo[Array([1, 2]).freeze()] == 'a'
+    # A frozen Array and an equal list are still the same value for the set operations.
+    assert Array([Array([1, 2]).freeze(), [1, 2]]).uniq() == [[1, 2]]
+    assert Array([[1, 2]]).build_index().include(Array([1, 2]).freeze())
+
+
+def test_hash_deep_nesting():
+    def nested(depth, leaf):
+        value = [leaf]
+        for _ in range(depth):
+            value = [value, {'depth': [leaf]}]
+        return value
+
+    deep = Array(nested(5000, 1))
+    assert deep.hash() == Array(nested(5000, 1.0)).hash() != Array(nested(5000, 2)).hash()
+    assert Array([nested(5000, 1), nested(5000, 1)]).uniq().length() == 1
+    assert Array([[[1], 2], [[1, 2]]]).uniq().length() == 2
+    recursive = Array([1])
+    recursive.append(recursive)
+    assert isinstance(recursive.hash(), int)
+
+
+def test_dup_and_clone():
+    import copy
+
+    frozen = Array([1, [2]]).freeze()
+    content_hash = frozen.hash()
+    dup = frozen.dup()
+    assert dup == frozen and not dup.frozen()
+    assert dup.hash() == content_hash
+    dup.push(3)
+    assert dup.hash() != content_hash and frozen == [1, [2]]
+    assert frozen.clone().frozen() and not frozen.clone(freeze=False).frozen()
+    assert Array([1]).clone(freeze=True).frozen()
+    assert not copy.copy(frozen).frozen()
+    deep = copy.deepcopy(frozen)
+    assert deep == frozen and deep.frozen() and deep[1] is not frozen[1]
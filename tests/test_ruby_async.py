@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from rubylang.ruby_array import Array
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_concurrency_is_bounded():
+    running = 0
+    peak = 0
+
+    async def block(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return value
+
+    assert run(Array(range(20)).async_map(block=block, limit=3)) == list(range(20))
+    assert peak == 3
+
+
+def test_any_cancels_outstanding_blocks():
+    finished = []
+
+    async def block(value):
+        await asyncio.sleep(0 if value == 0 else 0.05)
+        finished.append(value)
+        return value == 0
+
+    assert run(Array(range(10)).async_any(block=block, limit=4)) is True
+    assert finished == [0]
+
+
+def test_index_is_first_in_order():
+    async def block(value):
+        # Later elements finish first.
+        await asyncio.sleep(0.001 * (10 - value))
+        return value in (3, 7)
+
+    assert run(Array(range(10)).async_index(block=block, limit=10)) == 3
+    assert run(Array(range(10)).async_find_index(block=block, limit=1)) == 3
+
+
+def test_predicates():
+    async def positive(value):
+        await asyncio.sleep(0)
+        return value > 0
+
+    arr = Array([-1, 0, 1, 2])
+    assert run(arr.async_all(block=positive)) is False
+    assert run(arr.async_none(block=positive)) is False
+    assert run(arr.async_one(block=positive)) is False
+    assert run(Array([1]).async_one(block=positive)) is True
+    assert run(arr.async_count(block=positive)) == 2
+    assert run(arr.async_select(block=positive)) == [1, 2]
+    assert run(arr.async_reject(block=positive)) == [-1, 0]
+    assert run(Array([]).async_all(block=positive)) is True
+    assert run(Array([]).async_index(block=positive)) is None
+
+
+def test_sync_blocks_and_arguments():
+    arr = Array([1, 2, 2])
+    assert run(arr.async_count(block=lambda x: x == 2)) == 2
+    assert run(arr.async_count(2)) == 2
+    assert run(arr.async_index(2)) == 1
+
+
+def test_errors():
+    async def fail(value):
+        raise KeyError(value)
+
+    with pytest.raises(KeyError):
+        run(Array([1, 2]).async_any(block=fail))
+    with pytest.raises(ValueError):
+        run(Array([1]).async_any(block=fail, limit=0))
@@ -0,0 +1,54 @@
+from rubylang.ruby_array import Array
+from rubylang.ruby_deque_array import DequeArray
+
+
+def test_work_queue():
+    queue = DequeArray([])
+    queue.push(1, 2, 3)
+    assert queue.shift() == 1
+    queue.unshift('a', 'b')
+    assert list(queue) == ['a', 'b', 2, 3]
+    assert queue.shift(2) == DequeArray(['a', 'b'])
+    assert queue.pop(1) == DequeArray([3])
+    assert queue.pop() == 2
+    assert queue.pop() is None
+    assert queue.shift() is None
+    assert queue.empty() is True
+
+
+def test_indexing():
+    arr = DequeArray([0, 1, 2, 3, 4])
+    assert arr[0] == 0
+    assert arr[-1] == 4
+    assert list(arr[1:3]) == [1, 2]
+    assert list(arr[::-2]) == [4, 2, 0]
+    assert isinstance(arr[1:3], DequeArray)
+
+
+def test_rotate():
+    arr = DequeArray([1, 2, 3])
+    assert list(arr.rotate(4)) == [2, 3, 1]
+    assert list(arr) == [1, 2, 3]
+    assert arr.rotate_bang(-1) is arr
+    assert list(arr) == [3, 1, 2]
+    assert list(DequeArray([]).rotate()) == []
+
+
+def test_queries():
+    arr = DequeArray([1, 2, 1, 2, 1])
+    assert arr.length() == 5
+    assert arr.include(2) is True
+    assert arr.count(1) == 3
+    assert arr.one(block=lambda x: x > 1) is False
+    assert arr.index(2, start=2) == 3
+    assert arr.rindex(2) == 3
+    assert arr.rindex(1, stop=4) == 2
+    assert arr.rindex(block=lambda x: x == 9) is None
+
+
+def test_comparing():
+    arr = DequeArray([1, [2, 3]])
+    assert arr.eql(DequeArray([1, [2, 3]])) and arr.eql(Array([1, [2, 3]])) and not arr.eql((1, [2, 3]))
+    assert arr.compare(DequeArray([1, [2, 4]])) == -1 and arr.compare(Array([1])) == 1
+    assert arr.compare(Array([1, [2, 3]])) == 0 and arr.compare(DequeArray([1, ['a']])) is None
+    assert arr.hash() == Array([1, [2, 3]]).hash() != DequeArray([1, [3, 2]]).hash()
@@ -0,0 +1,108 @@
+import pytest
+
+from rubylang import Array, FrozenError, Hash
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_default_and_default_proc():
+    h = Hash({'a': 1}, default=0)
+    assert h['a'] == 1 and h['b'] == 0 and 'b' not in h
+    assert h.default() == 0 and h.default_proc() is None
+    calls = []
+    memo = Hash.new(block=lambda hsh, k: calls.append(k) or hsh.store(k, k * 2))
+    assert memo[3] == 6 and memo[3] == 6
+    assert calls == [3] and memo == {3: 6}
+    assert memo.default(5) == 10 and memo.default() is None
+    assert type(Hash()) is Hash and isinstance(Hash(max_size=1), Hash)
+
+
+def test_fetch_and_dig():
+    h = Hash({'a': {'b': [1, Hash({'c': 2})]}, 'n': None}, default='x')
+    assert h.fetch('a')['b'][0] == 1
+    assert h.fetch('z', 0) == 0 and h.fetch('z', block=lambda k: k * 2) == 'zz'
+    with pytest.raises(KeyError):
+        h.fetch('z')
+    assert h.dig('a', 'b', 1, 'c') == 2
+    assert h.dig('a', 'b', -1, 'c') == 2
+    assert h.dig('a', 'b', 9) is None and h.dig('n', 'x') is None
+    assert h.dig('z') == 'x'
+    with pytest.raises(TypeError):
+        h.dig('a', 'b', 0, 'c')
+
+
+def test_transform_values_and_group_by():
+    h = Hash({'a': 1, 'b': 2, 'c': 3})
+    assert h.transform_values(block=lambda v: v + 1) == {'a': 2, 'b': 3, 'c': 4} and h['a'] == 1
+    assert h.transform_values_bang(block=lambda v: v * 2) is h and h == {'a': 2, 'b': 4, 'c': 6}
+    groups = h.group_by(block=lambda k, v: v > 3)
+    assert isinstance(groups, Hash) and isinstance(groups[True], Array)
+    assert groups == {False: [('a', 2)], True: [('b', 4), ('c', 6)]}
+    assert h.to_a() == [('a', 2), ('b', 4), ('c', 6)]
+    by_parity = Array([1, 2, 3, 4]).group_by(block=lambda x: x % 2)
+    assert isinstance(by_parity, Hash) and by_parity.fetch(0) == [2, 4]
+    assert isinstance(Array(['a', 'a']).tally(), Hash)
+
+
+def test_lru_eviction():
+    cache = Hash(default=-1, max_size=3)
+    for key in 'abcd':
+        cache[key] = ord(key)
+    assert list(cache) == ['b', 'c', 'd']
+    assert cache['b'] == ord('b')
+    cache['e'] = 0
+    assert list(cache) == ['b', 'd', 'e'] and cache['c'] == -1
+    cache.update(f=1, g=2)
+    assert len(cache) == 3 and 'e' in cache and 'b' not in cache
+    assert cache.pop('e') == 0 and cache.pop('e', None) is None
+    del cache['f']
+    cache.setdefault('h', 5)
+    cache |= {'i': 6}
+    assert cache == {'g': 2, 'h': 5, 'i': 6}
+    info = cache.cache_info()
+    assert (info.evictions, info.max_size, info.size) == (4, 3, 3)
+    cache.clear()
+    assert cache.cache_info().size == 0
+    cache['j'] = 1
+    assert cache.cache_info().size == 1
+    with pytest.raises(ValueError):
+        Hash(max_size=0)
+
+
+def test_ttl_expiry_and_counters():
+    clock = _Clock()
+    calls = []
+    cache = Hash.new(block=lambda h, k: calls.append(k) or h.store(k, k.upper()), ttl=10, timer=clock)
+    assert cache['a'] == 'A'
+    clock.now = 5
+    assert cache['a'] == 'A' and cache.get('b') is None and cache.fetch('b', 0) == 0
+    cache['b'] = 'B'
+    clock.now = 12
+    assert 'a' not in cache and cache['b'] == 'B'
+    assert cache['a'] == 'A' and calls == ['a', 'a']
+    clock.now = 30
+    cache['c'] = 'C'
+    assert list(cache) == ['c']
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.expirations, info.evictions) == (2, 4, 3, 0)
+    with pytest.raises(ValueError):
+        Hash(ttl=0)
+
+
+def test_group_by_and_tally_nested_lists():
+    nested = Array([[1], [1, [2]], [1], {'a': [3]}, [1, [2]], {'a': [3]}])
+    counts = nested.tally()
+    assert isinstance(counts, Hash) and list(counts.values()) == [2, 2, 2]
+    assert list(counts) == [[1], [1, [2]], {'a': [3]}]
+    groups = nested.group_by(block=lambda x: x)
+    assert list(groups) == [[1], [1, [2]], {'a': [3]}]
+    assert groups.fetch(Array([1]).freeze()) == [[1], [1]]
+    with pytest.raises(FrozenError):
+        next(iter(groups)).append(2)
+    assert Array([[1], [2], [1]]).group_by(block=len) == {1: [[1], [2], [1]]}
@@ -0,0 +1,74 @@
+from rubylang.ruby_array import Array
+from rubylang.ruby_lazy import Lazy
+
+
+def test_lazy_is_not_evaluated_until_forced():
+    calls = []
+
+    def record(value):
+        calls.append(value)
+        return value * 2
+
+    lazy = Array([1, 2, 3]).lazy().map(block=record)
+    assert isinstance(lazy, Lazy)
+    assert calls == []
+    assert lazy.to_a() == [2, 4, 6]
+    assert calls == [1, 2, 3]
+
+
+def test_first_stops_early():
+    calls = []
+
+    def record(value):
+        calls.append(value)
+        return value
+
+    arr = Array(range(1000))
+    assert arr.lazy().map(block=record).select(block=lambda x: x % 2 == 0).first(3) == [0, 2, 4]
+    assert calls == [0, 1, 2, 3, 4]
+
+
+def test_chained_pipeline():
+    arr = Array([3, 1, 4, 1, 5, 9, 2, 6])
+    result = (arr.lazy()
+              .drop_while(block=lambda x: x < 4)
+              .uniq()
+              .reject(block=lambda x: x == 9)
+              .flat_map(block=lambda x: [x, x])
+              .take_while(block=lambda x: x != 6)
+              .take(5)
+              .with_index()
+              .force())
+    assert result == [(4, 0), (4, 1), (1, 2), (1, 3), (5, 4)]
+    assert isinstance(result, Array)
+
+
+def test_chaining_returns_new_lazy():
+    base = Array([1, 2, 3]).lazy()
+    doubled = base.map(block=lambda x: x * 2)
+    assert base.to_a() == [1, 2, 3]
+    assert doubled.to_a() == [2, 4, 6]
+    assert doubled.to_a() == [2, 4, 6]
+
+
+def test_uniq_unhashable():
+    arr = Array([[1], [1], {"class": "Hash"}, {"class": "Hash"}, 1])
+    assert arr.lazy().uniq().to_a() == [[1], {"class": "Hash"}, 1]
+
+
+def test_block_is_keyword_only():
+    import pytest
+
+    lazy = Array([1, 2]).lazy()
+    for name in ('map', 'select', 'reject', 'take_while', 'drop_while', 'flat_map', 'uniq', 'each'):
+        with pytest.raises(TypeError):
+            getattr(lazy, name)(str)
+    with pytest.raises(TypeError):
+        lazy.with_index(0, str)
+
+
+def test_with_index_block():
+    seen = []
+    result = Array(['a', 'b']).lazy().with_index(10, block=lambda x, i: seen.append((x, i))).to_a()
+    assert result == ['a', 'b']
+    assert seen == [('a', 10), ('b', 11)]
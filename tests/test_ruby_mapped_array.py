@@ -0,0 +1,91 @@
+import io
+import struct
+
+import pytest
+
+import rubylang.ruby_mapped_array as ruby_mapped_array
+from rubylang import Array, MappedArray
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / 'records.bin'
+    path.write_bytes(struct.pack('10q', *range(10)))
+    return path
+
+
+def test_reading(path):
+    with Array.mmap(path, 'q') as arr:
+        assert isinstance(arr, MappedArray)
+        assert len(arr) == arr.length() == arr.size() == 10
+        assert arr[0] == 0 and arr[-1] == 9
+        with pytest.raises(IndexError):
+            arr[10]
+        assert list(arr) == list(range(10))
+        assert arr.to_a() == list(range(10))
+
+
+def test_slices_are_views(path):
+    with Array.mmap(path, 'q') as arr:
+        view = arr[2:8]
+        assert isinstance(view, MappedArray)
+        assert view.to_a() == [2, 3, 4, 5, 6, 7]
+        assert view[::2].to_a() == [2, 4, 6]
+        assert arr[::-3].to_a() == [9, 6, 3, 0]
+        assert view.index(5) == 3 and view.include(2) and not view.include(8)
+        assert arr[5:2].to_a() == []
+
+
+def test_queries_stream_in_chunks(path, monkeypatch):
+    monkeypatch.setattr(ruby_mapped_array, '_CHUNK_RECORDS', 3)
+    with Array.mmap(path, 'q') as arr:
+        assert arr.include(7) and not arr.include(10)
+        assert arr.index(7) == 7 and arr.index(block=lambda x: x > 3) == 4 and arr.index(42) is None
+        assert arr.rindex(block=lambda x: x < 5) == 4 and arr.rindex(0) == 0
+        assert arr.count() == 10 and arr.count(3) == 1 and arr.count(block=lambda x: x % 2) == 5
+        assert arr.all(block=lambda x: x >= 0) and not arr.all(block=lambda x: x < 9)
+        assert arr.any(block=lambda x: x == 9) and not arr.any(block=lambda x: x > 9)
+        assert arr[1:].all() and not arr.all()
+        with pytest.warns(UserWarning):
+            assert arr.count(3, block=lambda x: True) == 1
+
+
+def test_index_without_argument_or_block(path, monkeypatch):
+    monkeypatch.setattr(ruby_mapped_array, '_CHUNK_RECORDS', 3)
+    with Array.mmap(path, 'q') as arr:
+        assert list(arr.index()) == list(range(10)) == list(arr.find_index())
+        assert list(arr[2:7].index()) == [2, 3, 4, 5, 6]
+
+
+def test_rindex_without_argument_or_block(path, monkeypatch):
+    monkeypatch.setattr(ruby_mapped_array, '_CHUNK_RECORDS', 3)
+    with Array.mmap(path, 'q') as arr:
+        assert list(arr.rindex()) == list(range(9, -1, -1)) == list(reversed(arr))
+        assert list(arr[2:7].rindex()) == [6, 5, 4, 3, 2]
+
+
+def test_records(tmp_path):
+    path = tmp_path / 'pairs.bin'
+    with Array.mmap(path, '<qd', writable=True) as arr:
+        assert arr.length() == 0 and arr.to_a() == []
+        arr.push((1, 0.5), (2, 1.5))
+        assert arr.to_a() == [(1, 0.5), (2, 1.5)]
+        assert arr[::-1][0] == (2, 1.5)
+        assert arr.index((2, 1.5)) == 1
+    assert path.read_bytes() == struct.pack('<qd', 1, 0.5) + struct.pack('<qd', 2, 1.5)
+
+
+def test_appending(path):
+    with Array.mmap(path, 'q') as arr:
+        with pytest.raises(io.UnsupportedOperation):
+            arr.push(10)
+
+    with Array.mmap(path, 'q', writable=True) as arr:
+        head = arr[:2]
+        arr.push(10, 11).append(12)
+        assert arr.length() == 13 and arr[-1] == 12 and arr.include(11)
+        assert head.to_a() == [0, 1]
+        with pytest.raises(TypeError):
+            head.push(1)
+        arr.flush()
+    assert path.stat().st_size == 13 * 8
@@ -0,0 +1,101 @@
+import struct
+
+import pytest
+
+from rubylang import Array
+from rubylang.ruby_pack import unpack, unpack1, _compile
+
+
+def test_integers():
+    values = Array([1, 258, 65539, 2 ** 40])
+    assert values.pack('CSLQ') == struct.pack('=BHIQ', 1, 258, 65539, 2 ** 40)
+    assert Array([1, 2]).pack('nN') == b'\x00\x01\x00\x00\x00\x02'
+    assert Array([1, 2]).pack('vV') == b'\x01\x00\x02\x00\x00\x00'
+    assert Array([1, 2]).pack('S>L<') == b'\x00\x01\x02\x00\x00\x00'
+    assert Array([-1, -2]).pack('cs') == struct.pack('=bh', -1, -2)
+    # Ruby wraps out of range integers and truncates floats.
+    assert Array([256, -1, 2.9, 65536]).pack('CCCS') == b'\x00\xff\x02\x00\x00'
+    assert Array([255]).pack('c') == b'\xff'
+    with pytest.raises(TypeError):
+        Array(['a']).pack('C')
+
+
+def test_counts():
+    assert Array(range(5)).pack('C*') == bytes(range(5))
+    assert Array(range(5)).pack('C2 C*') == bytes(range(5))
+    assert Array([1, 2, 3]).pack('C0C3') == b'\x01\x02\x03'
+    assert Array([1, 2, 3]).pack('C2 # comment\n C') == b'\x01\x02\x03'
+    with pytest.raises(ValueError, match='too few arguments'):
+        Array([1]).pack('C2')
+    with pytest.raises(ValueError, match='unknown pack directive'):
+        Array([1]).pack('y')
+    with pytest.raises(ValueError):
+        Array([1]).pack('C<')
+
+
+def test_floats():
+    assert Array([1.5, 2]).pack('eE') == struct.pack('<fd', 1.5, 2)
+    assert Array([1.5, 2]).pack('gG') == struct.pack('>fd', 1.5, 2)
+    assert unpack(Array([1.5, -0.25]).pack('g*'), 'g*') == [1.5, -0.25]
+
+
+def test_out_of_range_floats_pack_as_infinity():
+    inf = float('inf')
+    for directive, fmt in (('e', '<f'), ('g', '>f'), ('f', '=f')):
+        assert Array([1e300, -1e300]).pack(f'{directive}2') == struct.pack(f'{fmt[0]}2{fmt[1]}', inf, -inf)
+        assert unpack(Array([1e300, 1.5, -1e300]).pack(f'{directive}*'), f'{directive}*') == [inf, 1.5, -inf]
+    assert unpack(Array([1 << 1100]).pack('E'), 'E') == [inf]
+
+
+def test_strings():
+    assert Array(['abc']).pack('a5') == b'abc\x00\x00'
+    assert Array(['abc']).pack('A5') == b'abc  '
+    assert Array(['abc']).pack('Z*') == b'abc\x00'
+    assert Array(['abcdef']).pack('a3') == b'abc'
+    assert Array(['abc', b'xy']).pack('aa*') == b'axy'
+    assert Array(['é']).pack('a*') == 'é'.encode()
+    assert unpack(b'abc  ', 'A*') == [b'abc']
+    assert unpack(b'ab\x00cd', 'Z*a*') == [b'ab', b'cd']
+    assert unpack(b'ab\x00cdef', 'Z5a') == [b'ab', b'e']
+
+
+def test_utf8_and_ber():
+    assert Array([0x41, 0xe9, 0x1f600]).pack('U*') == 'Aé😀'.encode()
+    assert unpack('Aé😀'.encode(), 'U*') == [0x41, 0xe9, 0x1f600]
+    assert Array([0, 127, 128, 2 ** 70]).pack('w*') == b'\x00\x7f\x81\x00' + Array([2 ** 70]).pack('w')
+    assert unpack(Array([0, 127, 128, 2 ** 70]).pack('w*'), 'w*') == [0, 127, 128, 2 ** 70]
+    with pytest.raises(ValueError):
+        Array([-1]).pack('w')
+    with pytest.raises(ValueError):
+        unpack(b'\xff', 'U')
+
+
+def test_unpack():
+    data = Array([7, 300, 70000, 'hi', 2.5]).pack('CnNa2G')
+    assert unpack(data, 'CnNa2G') == [7, 300, 70000, b'hi', 2.5]
+    assert unpack(memoryview(data), 'nN', offset=1) == [300, 70000]
+    assert unpack(b'\x01', 'Cn') == [1, None]
+    assert unpack(b'\x01\x02\x03', 'n*') == [0x102]
+    assert unpack1(b'\x00\x05', 'n') == 5
+
+
+def test_buffers():
+    buffer = bytearray(b'head')
+    assert Array([1, 2]).pack('C*', buffer=buffer) is buffer
+    assert buffer == b'head\x01\x02'
+
+    target = bytearray(8)
+    end = Array([1, 2]).pack_into('n*', target, 2)
+    assert end == 6 and target == b'\x00\x00\x00\x01\x00\x02\x00\x00'
+    Array([9]).pack_into('C', memoryview(target)[6:])
+    assert target[6] == 9
+    with pytest.raises(ValueError):
+        Array([1, 2]).pack_into('N*', bytearray(7))
+
+
+def test_templates_are_compiled_once():
+    assert _compile('C2nN') is _compile('C2nN')
+    # Fixed count directives with the same byte order share one Struct.
+    steps = _compile('C S L n N')
+    assert [step[0] for step in steps] == ['struct', 'struct']
+    assert steps[0][3].format == '=1B1H1I'
@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from rubylang.ruby_array import Array
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+def test_process_pool():
+    arr = Array(range(20))
+    par = arr.parallel(2, chunk_size=3)
+    assert par.count(block=is_even) == 10
+    assert par.map(block=is_even) == [is_even(val) for val in arr]
+    assert par.select(block=is_even) == list(range(0, 20, 2))
+    assert par.index(block=is_even) == 0
+    assert par.any(block=is_even) is True
+    assert par.all(block=is_even) is False
+
+
+def test_unpicklable_block_is_reported():
+    with pytest.raises(TypeError, match="can't be pickled"):
+        Array([1, 2]).parallel(2).count(block=lambda x: x > 1)
+
+
+def test_threads_keep_order():
+    arr = Array(range(100))
+    par = arr.parallel(4, threads=True, chunk_size=7)
+    assert par.map(block=lambda x: x * 2) == [x * 2 for x in range(100)]
+    assert par.reject(block=lambda x: x < 95) == [95, 96, 97, 98, 99]
+    assert par.index(block=lambda x: x > 41) == 42
+    assert par.index(block=lambda x: x > 100) is None
+    assert par.one(block=lambda x: x == 50) is True
+    assert par.one(block=lambda x: x > 50) is False
+    assert par.none(block=lambda x: x > 100) is True
+
+
+def test_early_exit_cancels_pending_chunks():
+    calls = []
+
+    def record(value):
+        calls.append(value)
+        return True
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert Array(range(100)).parallel(1, executor=executor, chunk_size=10).any(block=record) is True
+    assert len(calls) < 100
+
+
+def test_delegates_without_block():
+    par = Array([1, 1, 2]).parallel(2, threads=True)
+    assert par.count(1) == 2
+    assert par.all() is True
+    assert par.index(2) == 2
+
+
+def test_early_exit_does_not_wait_for_running_chunks():
+    import time
+
+    def slow_unless_zero(value):
+        if value:
+            time.sleep(1)
+        return value == 0
+
+    par = Array(range(4)).parallel(2, threads=True, chunk_size=1)
+    queries = [(lambda: par.any(block=slow_unless_zero), True), (lambda: par.index(block=slow_unless_zero), 0),
+               (lambda: par.all(block=lambda x: not slow_unless_zero(x)), False)]
+    for query, expected in queries:
+        started = time.perf_counter()
+        assert query() is expected
+        assert time.perf_counter() - started < 0.5
@@ -0,0 +1,76 @@
+import pytest
+
+from rubylang import Array, SortedArray
+
+
+def test_keeps_order():
+    arr = SortedArray([5, 3, 9])
+    arr.push(4)
+    arr.unshift(10, 0)
+    arr.insert(0, 6)
+    arr.extend(range(20, 0, -2))
+    arr += [7]
+    arr[0] = 100
+    assert arr == sorted(arr)
+    assert arr[-1] == 100
+    arr.map_bang(block=lambda x: -x)
+    assert arr == sorted(arr) and arr[0] == -100
+    assert arr.select_bang(block=lambda x: x % 3) == sorted(arr)
+    assert isinstance(arr, Array)
+
+
+def test_lookups():
+    arr = SortedArray([1, 2, 2, 2, 3, 5])
+    assert arr.include(2) and not arr.include(4)
+    assert arr.index(2) == 1 and arr.rindex(2) == 3
+    assert arr.index(2, start=2, stop=3) == 2
+    assert arr.index(2, start=4) is None
+    assert arr.index(4) is None and arr.rindex(0) is None
+    assert arr.count(2) == 3 and arr.count(4) == 0
+    assert arr.count() == 6
+    assert arr.count(block=lambda x: x > 2) == 2
+    assert arr.index(block=lambda x: x > 2) == 4
+    # Arguments that can't be ordered against the elements are compared with == instead.
+    assert arr.include('a') is False and arr.index(None) is None and arr.count('a') == 0
+
+
+def test_between():
+    arr = SortedArray(range(0, 100, 10))
+    assert arr.between(15, 45) == [20, 30, 40]
+    assert arr.between(20, 40, exclude_end=True) == [20, 30]
+    assert arr.between(50, 10) == []
+    assert isinstance(arr.between(0, 0), SortedArray)
+
+
+def test_remove_and_order_breaking_methods():
+    arr = SortedArray([3, 1, 2])
+    arr.remove(2)
+    assert arr == [1, 3]
+    with pytest.raises(ValueError):
+        arr.remove(2)
+    arr.sort()
+    with pytest.raises(TypeError):
+        arr.sort(reverse=True)
+    with pytest.raises(TypeError):
+        arr.reverse()
+
+
+def test_bsearch():
+    arr = Array([0, 4, 7, 10, 12])
+    assert arr.bsearch(block=lambda x: x >= 4) == 4
+    assert arr.bsearch(block=lambda x: x >= 6) == 7
+    assert arr.bsearch(block=lambda x: x >= -1) == 0
+    assert arr.bsearch(block=lambda x: x >= 100) is None
+    assert arr.bsearch_index(block=lambda x: x >= 6) == 2
+    # find-any mode
+    assert arr.bsearch(block=lambda x: 1 - x // 4) in (4, 7)
+    assert arr.bsearch(block=lambda x: 4 - x) == 4
+    assert arr.bsearch(block=lambda x: 5 - x) is None
+    assert Array([]).bsearch(block=lambda x: True) is None
+
+    calls = []
+    Array(range(1024)).bsearch(block=lambda x: calls.append(x) or x >= 700)
+    assert len(calls) <= 11
+
+    with pytest.raises(TypeError):
+        arr.bsearch(block=lambda x: 'a')
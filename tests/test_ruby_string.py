@@ -0,0 +1,75 @@
+import re
+import types
+
+import pytest
+
+from rubylang import String
+import rubylang.ruby_string as ruby_string
+
+
+def test_appending():
+    s = String()
+    assert s.empty() and s == ''
+    s << 'foo' << String('bar') << 33
+    s += 'baz'
+    s.concat('1', '2')
+    s.prepend('<', '[').prepend('')
+    assert s == '<[foobar!baz12' and s.length() == len('<[foobar!baz12')
+    assert str(s) is s.to_s() is s.to_str()
+    assert s + '>' == '<[foobar!baz12>' and s == '<[foobar!baz12'
+    assert s.include('bar!') and 'qux' not in s
+    assert s[2:5] == 'foo'
+    with pytest.raises(TypeError):
+        s << 1.5
+    with pytest.raises(TypeError):
+        hash(s)
+
+
+def test_many_appends_stay_compact(monkeypatch):
+    monkeypatch.setattr(ruby_string, '_TAIL_PIECES', 4)
+    s = String()
+    for i in range(100):
+        s << str(i % 10)
+        assert s.length() == i + 1
+    assert len(s._pieces) + len(s._tail) <= 100 // 4 + 4
+    assert s.to_s() == '0123456789' * 10
+    assert len(s._pieces) == 1 and s._tail == []
+
+
+def test_each_char_and_each_line_stream():
+    s = String('ab\ncd') << 'e\n' << '\nf'
+    chars = s.each_char()
+    assert isinstance(chars, types.GeneratorType) or iter(chars) is chars
+    assert ''.join(chars) == 'ab\ncde\n\nf'
+    lines = s.each_line()
+    assert next(lines) == 'ab\n'
+    assert list(lines) == ['cde\n', '\n', 'f']
+    assert list(s.each_line(chomp=True)) == ['ab', 'cde', '', 'f']
+    assert list((String('a\r') << '\nb').each_line('\r\n')) == ['a\r\n', 'b']
+    assert list(s.each_line(None)) == [s.to_s()]
+    assert list(String().each_line()) == []
+
+    seen = []
+    assert s.each_line(block=seen.append) is s
+    assert s.each_char(block=seen.append) is s
+    assert len(seen) == 4 + len(s)
+
+    # Iterators work on a snapshot, mutating self while iterating is safe.
+    lines = s.each_line()
+    s << 'more\n'
+    assert list(lines) == ['ab\n', 'cde\n', '\n', 'f']
+
+
+def test_scan():
+    s = String('a1 b22') << ' c333'
+    assert list(s.scan(re.compile(r'\d+'))) == ['1', '22', '333']
+    assert list(s.scan(re.compile(r'([a-z])(\d)'))) == [('a', '1'), ('b', '2'), ('c', '3')]
+    assert list(String('a.b.').scan('.')) == ['.', '.']
+    seen = []
+    assert s.scan(re.compile(r'[a-z]'), block=seen.append) is s
+    assert seen == ['a', 'b', 'c']
+
+
+def test_unpack():
+    assert String('\x00\x01').unpack('n') == [1]
+    assert String('é').unpack1('U') == 0xe9
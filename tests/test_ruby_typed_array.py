@@ -0,0 +1,85 @@
+from array import array
+
+import pytest
+
+from rubylang.ruby_array import Array
+from rubylang.ruby_typed_array import TypedArray
+
+
+def test_typed_storage():
+    arr = Array.typed('d', [1, 2, 3])
+    assert isinstance(arr, TypedArray)
+    assert isinstance(arr, array)
+    assert arr.itemsize == 8
+    assert arr.to_a() == Array([1.0, 2.0, 3.0])
+
+
+def test_rejects_non_numeric_typecode():
+    with pytest.raises(ValueError):
+        Array.typed('u', 'abc')
+
+
+def test_queries():
+    arr = Array.typed('q', [0, 3, 5, 3])
+    assert arr.all() is False
+    assert arr.any() is True
+    assert arr.none(7) is True
+    assert arr.count(3) == 2
+    assert arr.count('3') == 0
+    assert arr.count(block=lambda x: x > 2) == 3
+    assert arr.include(5) is True
+    assert arr.include(2 ** 70) is False
+    assert arr.index(3) == 1
+    assert arr.index(3, start=2) == 3
+    assert arr.index(block=lambda x: x > 3) == 2
+    assert arr.index(9) is None
+    assert arr.sum() == 11
+    assert arr.min() == 0
+    assert arr.max() == 5
+
+
+def test_vectorized_block():
+    arr = Array.typed('d', [0.5, 1.5, 2.5])
+    assert arr.count(block=lambda x: x > 1, vectorized=True) == 2
+    assert arr.all(block=lambda x: x > 0, vectorized=True) is True
+    assert arr.none(block=lambda x: x > 3, vectorized=True) is True
+
+
+def test_empty():
+    arr = Array.typed('d')
+    assert arr.empty() is True
+    assert arr.all() is True
+    assert arr.any() is False
+    assert arr.count(1.0) == 0
+    assert arr.sum() == 0
+    assert arr.min() is None
+    assert arr.max() is None
+
+
+def test_float_sum_is_correctly_rounded():
+    assert Array.typed('d', [0.1] * 10).sum() == 1.0
+    assert Array.typed('f', [1e8, 1.0, -1e8]).sum() == 1.0
+    assert Array.typed('d', [1.5]).sum(1) == 2.5
+
+
+@pytest.mark.parametrize('typecode', ['q', 'B', 'f', 'd'])
+def test_numpy_matches_fallback(typecode, monkeypatch):
+    pytest.importorskip('numpy')
+    import rubylang.ruby_typed_array as ruby_typed_array
+
+    arr = Array.typed(typecode, [3, 0, 7, 1, 7, 250] * 1000)
+
+    def queries():
+        return [
+            arr.all(), arr.any(), arr.none(), arr.all(7), arr.any(7), arr.none(255),
+            arr.count(7), arr.count(7.0), arr.count('7'), arr.count(2 ** 70),
+            arr.count(block=lambda x: x > 2), arr.count(block=lambda x: x > 2, vectorized=True),
+            arr.any(block=lambda x: x > 249, vectorized=True), arr.include(250), arr.include(0.5),
+            arr.index(7), arr.sum(), arr.sum(0.5), arr.min(), arr.max(),
+        ]
+
+    with_numpy = queries()
+    monkeypatch.setattr(ruby_typed_array, '_numpy', lambda: None)
+    fallback = queries()
+    assert with_numpy == fallback
+    assert [type(val) for val in with_numpy] == [type(val) for val in fallback]